@@ -1,3 +1,25 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Skill, SkillAlias
+
+
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    """Edits here reach every worker's skill matcher without a restart."""
+
+    list_display = ("name", "category")
+    list_filter = ("category",)
+    search_fields = ("name", "aliases__alias")
+    inlines = [SkillAliasInline]
+
+
+@admin.register(SkillAlias)
+class SkillAliasAdmin(admin.ModelAdmin):
+    list_display = ("alias", "skill")
+    search_fields = ("alias", "skill__name")
+    autocomplete_fields = ("skill",)
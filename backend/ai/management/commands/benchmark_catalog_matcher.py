@@ -0,0 +1,50 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from ai.matchers.resume_matcher import CatalogSnapshot
+from ai.services import SkillExtractor
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the vectorized resume matcher on a synthetic catalog. "
+        "Nothing is read from or written to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=100_000, help="Number of synthetic jobs.")
+        parser.add_argument("--vocabulary", type=int, default=20_000, help="Distinct job description tokens.")
+        parser.add_argument("--tokens", type=int, default=60, help="Tokens per job.")
+        parser.add_argument("--runs", type=int, default=20, help="Resumes to score.")
+        parser.add_argument("--top", type=int, default=10, help="k for top-k.")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        vocabulary = [f"term{i}" for i in range(options["vocabulary"])]
+        skills = [skill for group in SkillExtractor.TECH_SKILLS.values() for skill in group]
+
+        start = time.perf_counter()
+        snapshot = CatalogSnapshot(
+            range(1, options["jobs"] + 1),
+            [rng.sample(skills, rng.randint(1, 8)) for _ in range(options["jobs"])],
+            [rng.sample(vocabulary, options["tokens"]) for _ in range(options["jobs"])],
+        )
+        build_ms = (time.perf_counter() - start) * 1000
+        self.stdout.write(f"Built snapshot of {len(snapshot)} jobs in {build_ms:.0f} ms")
+
+        timings = []
+        for _ in range(options["runs"]):
+            resume_skills = rng.sample(skills, 10)
+            resume_tokens = set(rng.sample(vocabulary, 300))
+            start = time.perf_counter()
+            snapshot.top_k(resume_skills, resume_tokens, options["top"])
+            timings.append((time.perf_counter() - start) * 1000)
+
+        timings.sort()
+        self.stdout.write(self.style.SUCCESS(
+            f"top_k over {len(snapshot)} jobs: "
+            f"median {timings[len(timings) // 2]:.1f} ms, max {timings[-1]:.1f} ms"
+        ))
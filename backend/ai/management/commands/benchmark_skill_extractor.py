@@ -0,0 +1,64 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from ai.matchers.skill_extractor import SkillPattern
+from ai.services import SkillExtractor
+
+FILLER = (
+    "designed built shipped maintained services teams customers reporting "
+    "pipelines dashboards migrations reviews mentoring architecture testing"
+).split()
+
+
+def substring_extract(taxonomy, text):
+    """The previous implementation: one substring test per skill."""
+    text_lower = text.lower()
+    found_skills = {}
+    for category, skills in taxonomy.items():
+        found = [skill for skill in skills if skill in text_lower]
+        if found:
+            found_skills[category] = found
+    return found_skills
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the compiled skill extractor with per-skill substring matching "
+        "on long resumes, optionally with a larger synthetic taxonomy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--words", type=int, default=5000, help="Words per synthetic resume.")
+        parser.add_argument("--resumes", type=int, default=50)
+        parser.add_argument(
+            "--extra-skills", type=int, default=0,
+            help="Synthetic skills added to TECH_SKILLS to see how each approach scales.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        taxonomy = dict(SkillExtractor.TECH_SKILLS)
+        if options["extra_skills"]:
+            taxonomy["synthetic"] = [f"skill{i}" for i in range(options["extra_skills"])]
+        skills = [skill for group in taxonomy.values() for skill in group]
+        pattern = SkillPattern(taxonomy)
+        resumes = [
+            " ".join(rng.choice(skills) if rng.random() < 0.05 else rng.choice(FILLER)
+                     for _ in range(options["words"]))
+            for _ in range(options["resumes"])
+        ]
+
+        self.stdout.write(f"{len(skills)} skills")
+        extractors = (
+            ("substring", lambda text: substring_extract(taxonomy, text)),
+            ("compiled", pattern.extract),
+        )
+        for label, extract in extractors:
+            start = time.perf_counter()
+            for resume in resumes:
+                extract(resume)
+            per_resume_ms = (time.perf_counter() - start) * 1000 / len(resumes)
+            self.stdout.write(f"{label:>10}: {per_resume_ms:.3f} ms per {options['words']}-word resume")
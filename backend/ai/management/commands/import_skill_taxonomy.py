@@ -0,0 +1,37 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ai.matchers.resume_matcher import bump_catalog_version
+from ai.repository import JobFeatureRepository, SkillTaxonomyRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Load skills and aliases from a JSON file shaped like "
+        '{"category": {"skill": ["alias", ...]}}. Existing skills are updated, '
+        "nothing is deleted. Running workers pick the change up without a restart."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the taxonomy JSON file.")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not read taxonomy: {exc}")
+        if not isinstance(data, dict) or not all(isinstance(v, dict) for v in data.values()):
+            raise CommandError('Expected {"category": {"skill": ["alias", ...]}}')
+
+        skills, aliases = SkillTaxonomyRepository.import_taxonomy(data)
+        self.stdout.write(self.style.SUCCESS(f"Imported {skills} skills and {aliases} aliases."))
+
+        if settings.CELERY_ENABLED:
+            self.stdout.write("Job features will be recomputed by a background task.")
+        else:
+            count = JobFeatureRepository.refresh_all()
+            bump_catalog_version()
+            self.stdout.write(f"Recomputed features for {count} jobs.")
@@ -0,0 +1,216 @@
+"""
+Vectorized resume -> job scoring over the whole active catalog.
+
+The catalog keeps two sparse job x term matrices in CSC form (one for
+tokens, one for skills): for every term, the array of job rows containing
+it. Scoring a resume gathers the rows of the resume's terms and counts
+them with one np.bincount, which yields |resume ∩ job| for every job at
+once. From those intersection sizes and the stored per-job sizes we get
+the same skill-match and Jaccard scores JobMatcher.score_features computes
+one job at a time, then take the true top-k with np.argpartition.
+
+Snapshots are immutable and rebuilt from ai.JobFeatures when the catalog
+version (bumped by ai.signals on job writes) changes, at most once per
+AI_CATALOG_MIN_REBUILD_SECONDS per process. Only a process's first
+snapshot is built in a request: later rebuilds run in a background thread
+while requests keep scoring against the previous snapshot
+(AI_CATALOG_BACKGROUND_REBUILD), so a job write never makes a request pay
+for a catalog-sized rebuild.
+"""
+
+import logging
+import threading
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = "ai:catalog:version"
+
+
+class _TermMatrix:
+    """Sparse job x term incidence matrix stored column-wise (CSC)."""
+
+    def __init__(self, vocabulary: dict, col_ptr: np.ndarray, rows: np.ndarray, row_sizes: np.ndarray):
+        self.vocabulary = vocabulary
+        self.col_ptr = col_ptr
+        self.rows = rows
+        self.row_sizes = row_sizes
+
+    @classmethod
+    def build(cls, term_lists: Sequence[Iterable[str]]) -> "_TermMatrix":
+        vocabulary = {}
+        cols, rows = [], []
+        row_sizes = np.zeros(len(term_lists), dtype=np.int32)
+        for row, terms in enumerate(term_lists):
+            unique = set(terms)
+            row_sizes[row] = len(unique)
+            for term in unique:
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                rows.append(row)
+
+        cols = np.asarray(cols, dtype=np.int32)
+        rows = np.asarray(rows, dtype=np.int32)
+        order = np.argsort(cols, kind="stable")
+        col_ptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=len(vocabulary)), out=col_ptr[1:])
+        return cls(vocabulary, col_ptr, rows[order], row_sizes)
+
+    def intersections(self, terms: Iterable[str], n_rows: int) -> np.ndarray:
+        """|terms ∩ row| for every row."""
+        slices = []
+        for term in set(terms):
+            col = self.vocabulary.get(term)
+            if col is not None:
+                slices.append(self.rows[self.col_ptr[col]:self.col_ptr[col + 1]])
+        if not slices:
+            return np.zeros(n_rows, dtype=np.int64)
+        return np.bincount(np.concatenate(slices), minlength=n_rows)
+
+
+class CatalogSnapshot:
+    """Immutable scoring index over a fixed set of jobs."""
+
+    def __init__(self, job_ids: Sequence[int], skills: Sequence[Iterable[str]],
+                 tokens: Sequence[Iterable[str]], version=None):
+        self.job_ids = np.asarray(job_ids, dtype=np.int64)
+        self.skills = _TermMatrix.build(skills)
+        self.tokens = _TermMatrix.build(tokens)
+        self.version = version
+        self.built_at = time.monotonic()
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def scores(self, resume_skills: Iterable[str], resume_tokens: Iterable[str]) -> np.ndarray:
+        """Overall match score (0-100) of the resume against every job."""
+        n = len(self.job_ids)
+        resume_skills = {s.lower() for s in resume_skills}
+        resume_tokens = set(resume_tokens)
+
+        # skill match: |R ∩ J| / |J| * 100, 0 when the job lists no skills
+        skill_inter = self.skills.intersections(resume_skills, n)
+        job_skill_sizes = self.skills.row_sizes
+        skill_match = np.divide(
+            skill_inter * 100.0, job_skill_sizes,
+            out=np.zeros(n), where=job_skill_sizes > 0,
+        )
+
+        # text similarity: Jaccard |R ∩ J| / |R ∪ J| * 100
+        token_inter = self.tokens.intersections(resume_tokens, n)
+        union = len(resume_tokens) + self.tokens.row_sizes - token_inter
+        valid = (self.tokens.row_sizes > 0) & (len(resume_tokens) > 0)
+        similarity = np.divide(
+            token_inter * 100.0, union, out=np.zeros(n), where=valid & (union > 0),
+        )
+
+        return skill_match * 0.6 + similarity * 0.4
+
+    def top_k(self, resume_skills: Iterable[str], resume_tokens: Iterable[str],
+              k: int) -> List[Tuple[int, float]]:
+        """The k best (job_id, score) pairs, best first; ties go to newer jobs."""
+        n = len(self.job_ids)
+        if n == 0 or k <= 0:
+            return []
+        scores = self.scores(resume_skills, resume_tokens)
+        k = min(k, n)
+        candidates = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+        order = np.lexsort((-self.job_ids[candidates], -scores[candidates]))
+        best = candidates[order]
+        return [(int(self.job_ids[i]), float(scores[i])) for i in best]
+
+
+def _catalog_version():
+    try:
+        return cache.get(CATALOG_VERSION_KEY)
+    except Exception:
+        return None
+
+
+def bump_catalog_version():
+    """Mark every process's catalog snapshot as stale."""
+    try:
+        cache.set(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+    except Exception:
+        pass
+
+
+def build_snapshot(version=None) -> CatalogSnapshot:
+    """Build a snapshot of all active jobs from stored JobFeatures."""
+    from jobs.models import Job
+    from ai.models import JobFeatures
+    from ai.repository import JobFeatureRepository
+
+    # Jobs saved before features existed get them now, in bulk (the join
+    # tells for_jobs they have none without a query per job)
+    JobFeatureRepository.for_jobs(
+        Job.objects.filter(is_active=True, ai_features__isnull=True)
+        .select_related("ai_features").iterator(chunk_size=1000)
+    )
+
+    job_ids, skills, tokens = [], [], []
+    rows = JobFeatures.objects.filter(job__is_active=True).values_list("job_id", "skills", "tokens")
+    for job_id, job_skills, job_tokens in rows.iterator(chunk_size=2000):
+        job_ids.append(job_id)
+        skills.append(job_skills)
+        tokens.append(job_tokens)
+    return CatalogSnapshot(job_ids, skills, tokens, version=version)
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_lock = threading.Lock()
+_rebuilding = False
+
+
+def get_catalog() -> CatalogSnapshot:
+    """
+    Current catalog snapshot for this process. Once the catalog version has
+    moved and the last build is old enough, the existing snapshot is
+    returned while a fresh one is built in the background.
+    """
+    global _snapshot
+    version = _catalog_version()
+    snapshot = _snapshot
+    min_age = getattr(settings, "AI_CATALOG_MIN_REBUILD_SECONDS", 30)
+    if snapshot is not None and (
+        time.monotonic() - snapshot.built_at < min_age
+        # Without a version stamp (cache down/cold) fall back to age only
+        or (version is not None and snapshot.version == version)
+    ):
+        return snapshot
+
+    if snapshot is not None and getattr(settings, "AI_CATALOG_BACKGROUND_REBUILD", True):
+        _start_rebuild(snapshot, version)
+        return snapshot
+
+    with _lock:
+        if _snapshot is snapshot:  # nobody rebuilt while we waited
+            _snapshot = build_snapshot(version)
+        return _snapshot
+
+
+def _start_rebuild(snapshot: CatalogSnapshot, version):
+    global _rebuilding
+    with _lock:
+        if _rebuilding or _snapshot is not snapshot:
+            return
+        _rebuilding = True
+    threading.Thread(target=_rebuild, args=(version,), name="catalog-rebuild", daemon=True).start()
+
+
+def _rebuild(version):
+    global _snapshot, _rebuilding
+    from django.db import connection
+
+    try:
+        _snapshot = build_snapshot(version)
+    except Exception:
+        # The old snapshot stays; the next request past min_age retries
+        logger.warning("Catalog rebuild failed", exc_info=True)
+    finally:
+        _rebuilding = False
+        connection.close()
@@ -0,0 +1,176 @@
+"""
+Single-pass skill matching.
+
+All skills of a taxonomy are compiled into one regex, factored as a
+character trie ('java' and 'javascript' share 'java'), so a text is
+scanned once whatever the number of skills and each position costs at
+most one walk down the trie (the pure-Python stand-in for an
+Aho-Corasick automaton). Matches
+must stand on their own: a skill may not be preceded or followed by a
+letter, digit, '_', '+', '#' or '-', so 'r' and 'go' no longer match
+inside 'rust' or 'going', 'java' does not match in 'javascript' and
+'c++' does not match in 'c+++'. Whitespace inside multi-word skills
+('machine learning') matches any run of whitespace.
+
+The taxonomy lives in ai.Skill / ai.SkillAlias. get_skill_pattern()
+compiles it once per process and swaps in a new SkillPattern when the
+taxonomy version (bumped by ai.signals on skill writes) moves; the
+version is looked up at most once per AI_SKILL_TAXONOMY_CHECK_SECONDS.
+"""
+
+import logging
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+TAXONOMY_VERSION_KEY = "ai:skills:version"
+
+_BOUNDARY = r"[\w+#-]"
+
+
+def _trie_regex(node: dict) -> str:
+    alternatives = [
+        (r"\s+" if key == " " else re.escape(key)) + _trie_regex(child)
+        for key, child in sorted(node.items())
+        if key
+    ]
+    if not alternatives:
+        return ""
+    body = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+    if "" in node:
+        # A skill ends here; the longer continuation is tried first and
+        # dropped again if it does not end on a boundary
+        body = f"(?:{body})?"
+    return body
+
+
+def compile_skills(skills: Iterable[str]) -> "re.Pattern":
+    """One regex matching any of `skills` as a standalone term."""
+    trie = {}
+    for skill in skills:
+        node = trie
+        for key in " ".join(skill.split()):
+            node = node.setdefault(key, {})
+        node[""] = {}
+    body = _trie_regex(trie) if trie else "(?!)"
+    return re.compile(rf"(?<!{_BOUNDARY})(?:{body})(?!{_BOUNDARY})")
+
+
+class SkillPattern:
+    """
+    Compiled matcher for a {category: [skill, ...]} taxonomy and optional
+    {alias: skill} spellings; an alias is reported as its skill.
+    """
+
+    def __init__(self, taxonomy: Mapping[str, Iterable[str]],
+                 aliases: Optional[Mapping[str, str]] = None, version=None):
+        self.taxonomy = {
+            category: [self._normalize(s) for s in skills] for category, skills in taxonomy.items()
+        }
+        self.categories: Dict[str, List[str]] = {}
+        for category, skills in self.taxonomy.items():
+            for skill in skills:
+                self.categories.setdefault(skill, []).append(category)
+
+        self._skill_by_match = {skill: skill for skill in self.categories}
+        for alias, skill in (aliases or {}).items():
+            alias, skill = self._normalize(alias), self._normalize(skill)
+            if skill in self.categories:
+                self._skill_by_match.setdefault(alias, skill)
+        self.regex = compile_skills(self._skill_by_match)
+        self.version = version
+        self.checked_at = time.monotonic()
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def find(self, text: str) -> set:
+        """Every distinct skill in `text`."""
+        return {
+            self._skill_by_match[self._normalize(match)]
+            for match in self.regex.findall(text.lower())
+        }
+
+    def extract(self, text: str) -> Dict[str, List[str]]:
+        """Skills in `text` grouped by category, in taxonomy order."""
+        found = self.find(text)
+        result = {}
+        for category, skills in self.taxonomy.items():
+            matched = [skill for skill in skills if skill in found]
+            if matched:
+                result[category] = matched
+        return result
+
+
+def _taxonomy_version():
+    try:
+        return cache.get(TAXONOMY_VERSION_KEY)
+    except Exception:
+        return None
+
+
+def bump_taxonomy_version():
+    """Make every process recompile its skill pattern on next use."""
+    try:
+        cache.set(TAXONOMY_VERSION_KEY, time.time_ns(), timeout=None)
+    except Exception:
+        pass
+
+
+def build_pattern(version=None) -> SkillPattern:
+    """
+    Compile the stored taxonomy. Falls back to the built-in
+    SkillExtractor.TECH_SKILLS while the taxonomy table is empty or
+    unreachable (e.g. before migrations).
+    """
+    from ai.repository import SkillTaxonomyRepository
+    from ai.services import SkillExtractor
+
+    try:
+        taxonomy, aliases = SkillTaxonomyRepository.load()
+    except Exception:
+        logger.warning("Skill taxonomy unavailable, using built-in skills", exc_info=True)
+        taxonomy, aliases = {}, {}
+    if not taxonomy:
+        taxonomy = SkillExtractor.TECH_SKILLS
+    return SkillPattern(taxonomy, aliases, version=version)
+
+
+_pattern: Optional[SkillPattern] = None
+_lock = threading.Lock()
+
+
+def get_skill_pattern() -> SkillPattern:
+    """The current compiled pattern for this process."""
+    global _pattern
+    pattern = _pattern
+    interval = getattr(settings, "AI_SKILL_TAXONOMY_CHECK_SECONDS", 5)
+    if pattern is not None and time.monotonic() - pattern.checked_at < interval:
+        return pattern
+
+    version = _taxonomy_version()
+    if pattern is not None and version == pattern.version:
+        pattern.checked_at = time.monotonic()
+        return pattern
+
+    with _lock:
+        if _pattern is pattern:  # nobody swapped it while we waited
+            # Compiled aside and published with one assignment, so readers
+            # see either the old pattern or the new one
+            _pattern = build_pattern(version)
+        return _pattern
+
+
+def reload_skill_pattern() -> SkillPattern:
+    """Recompile now, skipping the check interval (used by bulk refreshes)."""
+    global _pattern
+    with _lock:
+        _pattern = build_pattern(_taxonomy_version())
+        return _pattern
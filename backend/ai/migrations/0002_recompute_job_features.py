@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+def drop_stale_features(apps, schema_editor):
+    # Features stored before word-boundary skill matching contain false
+    # positives such as 'r' and 'go'. Deleting them is enough: missing
+    # features are rebuilt on demand (JobFeatureRepository.for_jobs).
+    apps.get_model("ai", "JobFeatures").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_stale_features, migrations.RunPython.noop),
+    ]
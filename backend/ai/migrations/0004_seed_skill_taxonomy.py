@@ -0,0 +1,82 @@
+from django.db import migrations
+
+# Frozen copy of SkillExtractor.TECH_SKILLS at the time the taxonomy moved
+# to the database, plus common aliases.
+SKILLS = {
+    'programming_languages': [
+        'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'swift',
+        'kotlin', 'go', 'rust', 'typescript', 'scala', 'r', 'matlab'
+    ],
+    'web_frameworks': [
+        'django', 'flask', 'fastapi', 'react', 'angular', 'vue', 'nodejs',
+        'express', 'spring', 'laravel', 'rails', 'asp.net'
+    ],
+    'databases': [
+        'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
+        'cassandra', 'dynamodb', 'oracle', 'sql server', 'sqlite'
+    ],
+    'cloud_devops': [
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab',
+        'github actions', 'terraform', 'ansible', 'ci/cd'
+    ],
+    'data_science': [
+        'machine learning', 'deep learning', 'tensorflow', 'pytorch',
+        'scikit-learn', 'pandas', 'numpy', 'data analysis', 'nlp'
+    ],
+    'soft_skills': [
+        'leadership', 'communication', 'teamwork', 'problem solving',
+        'project management', 'agile', 'scrum'
+    ],
+}
+
+ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'golang': 'go',
+    'cpp': 'c++',
+    'csharp': 'c#',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vue.js': 'vue',
+    'vuejs': 'vue',
+    'node.js': 'nodejs',
+    'express.js': 'express',
+    'ruby on rails': 'rails',
+    'postgres': 'postgresql',
+    'mongo': 'mongodb',
+    'mssql': 'sql server',
+    'amazon web services': 'aws',
+    'google cloud': 'gcp',
+    'google cloud platform': 'gcp',
+    'k8s': 'kubernetes',
+    'sklearn': 'scikit-learn',
+    'natural language processing': 'nlp',
+}
+
+
+def seed(apps, schema_editor):
+    Skill = apps.get_model("ai", "Skill")
+    SkillAlias = apps.get_model("ai", "SkillAlias")
+    skills = {}
+    for category, names in SKILLS.items():
+        for name in names:
+            skills[name], _ = Skill.objects.get_or_create(name=name, defaults={"category": category})
+    for alias, name in ALIASES.items():
+        SkillAlias.objects.get_or_create(alias=alias, defaults={"skill": skills[name]})
+
+
+def unseed(apps, schema_editor):
+    apps.get_model("ai", "Skill").objects.filter(
+        name__in=[name for names in SKILLS.values() for name in names]
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0003_skill_taxonomy"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, unseed),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai', '0004_seed_skill_taxonomy'),
+        ('jobs', '0007_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationFeatures',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ai_features', serialize=False, to='jobs.jobapplication')),
+                ('skills', models.JSONField(default=list)),
+                ('tokens', models.JSONField(default=list)),
+                ('error', models.CharField(blank=True, default='', max_length=255)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
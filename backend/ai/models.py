@@ -1,3 +1,75 @@
 from django.db import models
 
-# Create your models here.
+
+class JobFeatures(models.Model):
+    """
+    Job-side matching features (skill list and token set), computed once
+    when a job is saved so recommendation requests only parse the resume.
+    """
+
+    job = models.OneToOneField(
+        "jobs.Job", on_delete=models.CASCADE, primary_key=True, related_name="ai_features"
+    )
+    skills = models.JSONField(default=list)
+    tokens = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Features for job {self.job_id}"
+
+
+class ApplicationFeatures(models.Model):
+    """
+    Resume-side matching features of a job application's resume file,
+    extracted once so candidate ranking never re-reads the uploads.
+    """
+
+    application = models.OneToOneField(
+        "jobs.JobApplication", on_delete=models.CASCADE, primary_key=True, related_name="ai_features"
+    )
+    skills = models.JSONField(default=list)
+    tokens = models.JSONField(default=list)
+    # Set when the resume file could not be read; skills/tokens are then empty
+    error = models.CharField(max_length=255, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Features for application {self.application_id}"
+
+
+class Skill(models.Model):
+    """
+    A canonical skill in the matching taxonomy. Editing skills or aliases
+    takes effect in every worker without a restart (see
+    ai.matchers.skill_extractor.get_skill_pattern).
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    category = models.CharField(max_length=50, db_index=True)
+
+    class Meta:
+        ordering = ["id"]
+
+    def save(self, *args, **kwargs):
+        self.name = " ".join(self.name.lower().split())
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.name} ({self.category})"
+
+
+class SkillAlias(models.Model):
+    """Another spelling of a skill, e.g. 'k8s' for 'kubernetes'."""
+
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="aliases")
+    alias = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        verbose_name_plural = "skill aliases"
+
+    def save(self, *args, **kwargs):
+        self.alias = " ".join(self.alias.lower().split())
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.alias} -> {self.skill.name}"
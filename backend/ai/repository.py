@@ -0,0 +1,211 @@
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from .models import ApplicationFeatures, JobFeatures, Skill, SkillAlias
+from .services import JobMatcher
+
+
+class JobFeatureRepository:
+    """
+    Stores and loads precomputed job features (see ai.models.JobFeatures).
+    """
+
+    @staticmethod
+    def _build(job) -> JobFeatures:
+        features = JobMatcher.extract_job_features(job.description, job.requirements or "")
+        return JobFeatures(
+            job_id=job.pk,
+            skills=features['skills'],
+            tokens=sorted(features['tokens']),
+        )
+
+    @classmethod
+    def refresh(cls, job) -> JobFeatures:
+        """Recompute and store the features for `job`."""
+        built = cls._build(job)
+        features, _ = JobFeatures.objects.update_or_create(
+            job_id=job.pk, defaults={"skills": built.skills, "tokens": built.tokens}
+        )
+        return features
+
+    @classmethod
+    def refresh_many(cls, jobs: Iterable) -> int:
+        """Compute and store the features of jobs written in bulk (no post_save)."""
+        return cls._upsert([cls._build(job) for job in jobs])
+
+    @classmethod
+    def for_jobs(cls, jobs: Iterable) -> Dict[int, Dict]:
+        """
+        Features for each job, keyed by job id, as {'skills': list, 'tokens': set}.
+        Jobs should come with select_related("ai_features"); any job without
+        stored features (e.g. created before they existed) is computed and
+        saved in one bulk insert.
+        """
+        result = {}
+        missing = []
+        for job in jobs:
+            try:
+                features = job.ai_features
+            except JobFeatures.DoesNotExist:
+                features = None
+            if features is None:
+                features = cls._build(job)
+                missing.append(features)
+            result[job.pk] = {'skills': features.skills, 'tokens': set(features.tokens)}
+
+        if missing:
+            JobFeatures.objects.bulk_create(missing, ignore_conflicts=True)
+        return result
+
+    @classmethod
+    def refresh_all(cls, chunk_size: int = 500) -> int:
+        """Recompute the features of every job, e.g. after a taxonomy change."""
+        from jobs.models import Job
+        from .matchers.skill_extractor import reload_skill_pattern
+
+        reload_skill_pattern()
+        count = 0
+        batch = []
+        for job in Job.objects.only("pk", "description", "requirements").iterator(chunk_size=chunk_size):
+            batch.append(cls._build(job))
+            if len(batch) >= chunk_size:
+                count += cls._upsert(batch)
+                batch = []
+        if batch:
+            count += cls._upsert(batch)
+        return count
+
+    @staticmethod
+    def _upsert(features: List[JobFeatures]) -> int:
+        JobFeatures.objects.bulk_create(
+            features, update_conflicts=True, unique_fields=["job"],
+            update_fields=["skills", "tokens", "updated_at"],
+        )
+        return len(features)
+
+
+class SkillTaxonomyRepository:
+    """
+    Reads and bulk-loads the skill taxonomy (see ai.models.Skill).
+    """
+
+    @staticmethod
+    def load() -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+        """({category: [skill, ...]}, {alias: skill}), skills in insertion order."""
+        taxonomy = {}
+        for name, category in Skill.objects.order_by("id").values_list("name", "category"):
+            taxonomy.setdefault(category, []).append(name)
+        aliases = dict(SkillAlias.objects.values_list("alias", "skill__name"))
+        return taxonomy, aliases
+
+    @staticmethod
+    @transaction.atomic
+    def import_taxonomy(data: Dict[str, Dict[str, List[str]]]) -> Tuple[int, int]:
+        """
+        Upsert {category: {skill: [alias, ...]}}. Existing skills move to the
+        given category; nothing is deleted. Returns (skills, aliases) written.
+        """
+        skill_count = alias_count = 0
+        for category, skills in data.items():
+            for name, aliases in skills.items():
+                skill, _ = Skill.objects.update_or_create(
+                    name=" ".join(name.lower().split()), defaults={"category": category}
+                )
+                skill_count += 1
+                for alias in aliases:
+                    SkillAlias.objects.update_or_create(
+                        alias=" ".join(alias.lower().split()), defaults={"skill": skill}
+                    )
+                    alias_count += 1
+        return skill_count, alias_count
+
+
+EXTRACTION_QUEUED_KEY = "ai:features:extract-queued:{}"
+EXTRACTION_QUEUED_TIMEOUT = 300
+
+
+def extract_resume_file_features(application_id: int, file_name: str) -> Tuple[int, List[str], List[str], str]:
+    """(application_id, skills, tokens, error) for a stored resume file."""
+    from resumes.extraction import ResumeExtractionError, extract_text
+
+    try:
+        with default_storage.open(file_name) as fh:
+            text = extract_text(fh)
+    except (ResumeExtractionError, OSError) as exc:
+        return application_id, [], [], str(exc)[:255]
+    features = JobMatcher.extract_resume_features(text)
+    return application_id, features['skills'], sorted(features['tokens']), ""
+
+
+class ApplicationFeatureRepository:
+    """
+    Stores and loads resume features of job applications
+    (see ai.models.ApplicationFeatures).
+    """
+
+    @staticmethod
+    def refresh(application) -> ApplicationFeatures:
+        """Re-extract and store the features of one application's resume."""
+        _, skills, tokens, error = extract_resume_file_features(application.pk, application.resume.name)
+        features, _ = ApplicationFeatures.objects.update_or_create(
+            application_id=application.pk, defaults={"skills": skills, "tokens": tokens, "error": error}
+        )
+        return features
+
+    @classmethod
+    def for_applications(cls, applications: Iterable) -> Dict[int, Dict]:
+        """
+        Features per application id as {'skills': list, 'tokens': set,
+        'error': str, 'pending': bool}. Applications should come with
+        select_related("ai_features"). Missing ones are extracted inline and
+        stored in one bulk insert, at most AI_RANKING_INLINE_EXTRACTIONS of
+        them: the rest come back empty and pending, queued to
+        extract_application_features_task when Celery is enabled and
+        otherwise extracted by the next loads, a bounded batch at a time.
+        """
+        result = {}
+        missing = []
+        for application in applications:
+            try:
+                features = application.ai_features
+            except ApplicationFeatures.DoesNotExist:
+                missing.append((application.pk, application.resume.name))
+                continue
+            result[application.pk] = {
+                'skills': features.skills, 'tokens': set(features.tokens), 'error': features.error,
+                'pending': False,
+            }
+
+        inline = getattr(settings, "AI_RANKING_INLINE_EXTRACTIONS", 10)
+        missing, deferred = missing[:inline], missing[inline:]
+        if settings.CELERY_ENABLED:
+            cls._queue_extraction(app_id for app_id, _ in deferred)
+        for app_id, _ in deferred:
+            result[app_id] = {'skills': [], 'tokens': set(), 'error': "", 'pending': True}
+
+        if missing:
+            extracted = [extract_resume_file_features(*item) for item in missing]
+            ApplicationFeatures.objects.bulk_create(
+                [
+                    ApplicationFeatures(application_id=app_id, skills=skills, tokens=tokens, error=error)
+                    for app_id, skills, tokens, error in extracted
+                ],
+                ignore_conflicts=True,
+            )
+            for app_id, skills, tokens, error in extracted:
+                result[app_id] = {'skills': skills, 'tokens': set(tokens), 'error': error, 'pending': False}
+        return result
+
+    @staticmethod
+    def _queue_extraction(application_ids: Iterable[int]):
+        from .tasks import extract_application_features_task
+
+        # Once per application while its task is outstanding, however often
+        # the ranking is reloaded
+        for application_id in application_ids:
+            if cache.add(EXTRACTION_QUEUED_KEY.format(application_id), True, timeout=EXTRACTION_QUEUED_TIMEOUT):
+                extract_application_features_task.delay(application_id)
@@ -2,14 +2,16 @@
 AI Services for resume parsing, skill extraction, and job matching
 """
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Set, Tuple
 from collections import Counter
 
+from .matchers.skill_extractor import get_skill_pattern
+
 
 class SkillExtractor:
     """Extract skills from text using keyword matching"""
     
-    # Common tech skills database
+    # Built-in skills, used until the ai.Skill taxonomy is populated
     TECH_SKILLS = {
         'programming_languages': [
             'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'swift',
@@ -48,18 +50,7 @@ class SkillExtractor:
         Returns:
             Dictionary of skill categories and found skills
         """
-        text_lower = text.lower()
-        found_skills = {}
-        
-        for category, skills in cls.TECH_SKILLS.items():
-            found = []
-            for skill in skills:
-                if skill in text_lower:
-                    found.append(skill)
-            if found:
-                found_skills[category] = found
-        
-        return found_skills
+        return get_skill_pattern().extract(text)
     
     @classmethod
     def get_all_skills_flat(cls, text: str) -> List[str]:
@@ -165,8 +156,27 @@ class JobMatcher:
         
         return round(match_percentage, 2)
     
+    STOP_WORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
+
+    @classmethod
+    def tokenize(cls, text: str) -> Set[str]:
+        """Lowercased word set used for text similarity, without stop words"""
+        return set(re.findall(r'\w+', text.lower())) - cls.STOP_WORDS
+
     @staticmethod
-    def calculate_text_similarity(text1: str, text2: str) -> float:
+    def jaccard_similarity(words1: Set[str], words2: Set[str]) -> float:
+        """Jaccard similarity of two token sets (0-100)"""
+        if not words1 or not words2:
+            return 0.0
+
+        intersection = len(words1 & words2)
+        union = len(words1 | words2)
+
+        similarity = (intersection / union) * 100 if union > 0 else 0
+        return round(similarity, 2)
+
+    @classmethod
+    def calculate_text_similarity(cls, text1: str, text2: str) -> float:
         """
         Calculate simple text similarity using word overlap
         
@@ -177,49 +187,43 @@ class JobMatcher:
         Returns:
             Similarity score (0-100)
         """
-        # Tokenize and clean
-        words1 = set(re.findall(r'\w+', text1.lower()))
-        words2 = set(re.findall(r'\w+', text2.lower()))
-        
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        # Calculate Jaccard similarity
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-        
-        similarity = (intersection / union) * 100 if union > 0 else 0
-        return round(similarity, 2)
-    
+        return cls.jaccard_similarity(cls.tokenize(text1), cls.tokenize(text2))
+
     @classmethod
-    def match_resume_to_job(cls, resume_text: str, job_description: str, 
-                           job_requirements: str = "") -> Dict:
+    def extract_job_features(cls, job_description: str, job_requirements: str = "") -> Dict:
         """
-        Match a resume to a job posting
+        Job-side features used for matching, computed once per job version
         
-        Args:
-            resume_text: Full resume text
-            job_description: Job description text
-            job_requirements: Job requirements text
-            
         Returns:
-            Dictionary with match score and details
+            Dictionary with the job's flat skill list and token set
         """
-        # Parse resume
-        resume_data = ResumeParser.parse_resume(resume_text)
-        
-        # Extract job skills
         job_text = f"{job_description} {job_requirements}"
-        job_skills = SkillExtractor.get_all_skills_flat(job_text)
+        return {
+            'skills': SkillExtractor.get_all_skills_flat(job_text),
+            'tokens': cls.tokenize(job_text),
+        }
+
+    @classmethod
+    def extract_resume_features(cls, resume_text: str) -> Dict:
+        """Resume-side features: parsed data plus the token set"""
+        resume_data = ResumeParser.parse_resume(resume_text)
+        return {
+            'skills': resume_data['all_skills'],
+            'tokens': cls.tokenize(resume_text),
+            'parsed': resume_data,
+        }
+
+    @classmethod
+    def score_features(cls, resume_skills: List[str], resume_tokens: Set[str],
+                       job_skills: List[str], job_tokens: Set[str]) -> Dict:
+        """
+        Score precomputed resume features against precomputed job features
         
-        # Calculate matches
-        skill_match = cls.calculate_skill_match(resume_data['all_skills'], job_skills)
-        text_similarity = cls.calculate_text_similarity(resume_text, job_text)
+        Returns:
+            Dictionary with match score and details
+        """
+        skill_match = cls.calculate_skill_match(resume_skills, job_skills)
+        text_similarity = cls.jaccard_similarity(resume_tokens, job_tokens)
         
         # Calculate overall match score (weighted average)
         overall_score = (skill_match * 0.6) + (text_similarity * 0.4)
@@ -239,12 +243,30 @@ class JobMatcher:
             'skill_match': skill_match,
             'text_similarity': text_similarity,
             'match_level': match_level,
-            'matched_skills': list(set(resume_data['all_skills']) & set(job_skills)),
-            'missing_skills': list(set(job_skills) - set(resume_data['all_skills'])),
-            'resume_skills': resume_data['all_skills'],
+            'matched_skills': list(set(resume_skills) & set(job_skills)),
+            'missing_skills': list(set(job_skills) - set(resume_skills)),
+            'resume_skills': resume_skills,
             'job_skills': job_skills
         }
     
+    @classmethod
+    def match_resume_to_job(cls, resume_text: str, job_description: str, 
+                           job_requirements: str = "") -> Dict:
+        """
+        Match a resume to a job posting
+        
+        Args:
+            resume_text: Full resume text
+            job_description: Job description text
+            job_requirements: Job requirements text
+            
+        Returns:
+            Dictionary with match score and details
+        """
+        resume = cls.extract_resume_features(resume_text)
+        job = cls.extract_job_features(job_description, job_requirements)
+        return cls.score_features(resume['skills'], resume['tokens'], job['skills'], job['tokens'])
+    
     @classmethod
     def rank_candidates(cls, candidates: List[Tuple[int, str]], 
                        job_description: str, job_requirements: str = "") -> List[Dict]:
@@ -259,12 +281,31 @@ class JobMatcher:
         Returns:
             List of candidates sorted by match score
         """
+        job = cls.extract_job_features(job_description, job_requirements)
+        features = []
+        for candidate_id, resume_text in candidates:
+            resume = cls.extract_resume_features(resume_text)
+            features.append((candidate_id, resume['skills'], resume['tokens']))
+        return cls.rank_candidate_features(features, job['skills'], job['tokens'])
+
+    @classmethod
+    def rank_candidate_features(cls, candidates: List[Tuple[int, List[str], Set[str]]],
+                                job_skills: List[str], job_tokens: Set[str]) -> List[Dict]:
+        """
+        Rank candidates from precomputed features against one job's features
+        
+        Args:
+            candidates: List of tuples (candidate_id, resume_skills, resume_tokens)
+            job_skills: The job's skill list
+            job_tokens: The job's token set
+            
+        Returns:
+            List of candidates sorted by match score (stable for ties)
+        """
         ranked = []
         
-        for candidate_id, resume_text in candidates:
-            match_result = cls.match_resume_to_job(
-                resume_text, job_description, job_requirements
-            )
+        for candidate_id, resume_skills, resume_tokens in candidates:
+            match_result = cls.score_features(resume_skills, resume_tokens, job_skills, job_tokens)
             ranked.append({
                 'candidate_id': candidate_id,
                 'match_score': match_result['overall_score'],
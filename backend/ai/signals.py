@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from jobs.models import Job, JobApplication
+from .matchers.resume_matcher import bump_catalog_version
+from .matchers.skill_extractor import bump_taxonomy_version
+from .models import ApplicationFeatures, Skill, SkillAlias
+from .repository import JobFeatureRepository
+from .tasks import REFRESH_PENDING_KEY, extract_application_features_task, refresh_job_features_task
+
+# Seconds to wait for more taxonomy edits before recomputing job features
+TAXONOMY_REFRESH_DELAY = 60
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_features(sender, instance, raw=False, **kwargs):
+    """Recompute stored matching features whenever a job is created or edited."""
+    if raw:
+        return
+    JobFeatureRepository.refresh(instance)
+    # Workers rebuilding before the commit would snapshot the old catalog
+    transaction.on_commit(bump_catalog_version)
+
+
+@receiver(post_delete, sender=Job)
+def drop_job_from_catalog(sender, instance, **kwargs):
+    transaction.on_commit(bump_catalog_version)
+
+
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=SkillAlias)
+def taxonomy_changed(sender, raw=False, **kwargs):
+    """Recompile the skill pattern everywhere once the change is committed."""
+    if raw:
+        return
+    transaction.on_commit(bump_taxonomy_version)
+    if settings.CELERY_ENABLED:
+        transaction.on_commit(schedule_feature_refresh)
+
+
+def schedule_feature_refresh():
+    # One refresh per burst of edits (e.g. a taxonomy import)
+    if cache.add(REFRESH_PENDING_KEY, True, timeout=TAXONOMY_REFRESH_DELAY * 2):
+        refresh_job_features_task.apply_async(countdown=TAXONOMY_REFRESH_DELAY)
+
+
+@receiver(pre_save, sender=JobApplication)
+def track_application_resume(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    stored = None
+    if instance.pk:
+        stored = JobApplication.objects.filter(pk=instance.pk).values_list("resume", flat=True).first()
+    instance._resume_changed = stored != instance.resume.name
+
+
+@receiver(post_save, sender=JobApplication)
+def extract_application_features(sender, instance, raw=False, **kwargs):
+    """
+    Drop features of a replaced resume; with Celery, extract the new ones
+    right away, otherwise candidate ranking extracts them on demand.
+    """
+    if raw or not getattr(instance, "_resume_changed", False):
+        return
+    instance._resume_changed = False
+    ApplicationFeatures.objects.filter(application_id=instance.pk).delete()
+    if settings.CELERY_ENABLED:
+        application_id = instance.pk
+        transaction.on_commit(lambda: extract_application_features_task.delay(application_id))
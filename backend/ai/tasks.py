@@ -0,0 +1,31 @@
+from celery import shared_task
+from django.core.cache import cache
+
+from .matchers.resume_matcher import bump_catalog_version
+from .repository import ApplicationFeatureRepository, JobFeatureRepository
+
+REFRESH_PENDING_KEY = "ai:features:refresh-pending"
+
+
+@shared_task
+def refresh_job_features_task():
+    """
+    Recompute every job's stored features after the skill taxonomy changed.
+    """
+    cache.delete(REFRESH_PENDING_KEY)
+    count = JobFeatureRepository.refresh_all()
+    bump_catalog_version()
+    return count
+
+
+@shared_task
+def extract_application_features_task(application_id):
+    """
+    Extracts the resume features of a new job application ahead of ranking.
+    """
+    from jobs.models import JobApplication
+
+    application = JobApplication.objects.filter(pk=application_id).first()
+    if application is None:
+        return None
+    return ApplicationFeatureRepository.refresh(application).error or "ok"
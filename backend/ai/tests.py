@@ -1,3 +1,475 @@
-from django.test import TestCase
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+
+from ai.matchers import resume_matcher, skill_extractor
+from ai.matchers.resume_matcher import CatalogSnapshot
+from ai.matchers.skill_extractor import SkillPattern
+from ai.models import ApplicationFeatures, JobFeatures, Skill, SkillAlias
+from ai.services import JobMatcher, SkillExtractor
+from ai.tasks import extract_application_features_task
+from employers.models import Employer
+from jobs.models import Job, JobApplication
+from resumes.models import Resume
+from users.models import User
+
+RESUME_TEXT = (
+    "Jane Doe - jane@example.com\n"
+    "Backend engineer with 5 years of Python, Django and PostgreSQL.\n"
+    "Deployed services with Docker on AWS."
+)
+
+MEDIA_ROOT = tempfile.mkdtemp()
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT, CACHES=LOCMEM_CACHE,
+    AI_CATALOG_MIN_REBUILD_SECONDS=0, AI_SKILL_TAXONOMY_CHECK_SECONDS=0,
+    AI_CATALOG_BACKGROUND_REBUILD=False,
+)
+class AITestCase(APITestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        resume_matcher._snapshot = None
+        skill_extractor._pattern = None
+        self.employer_user = User.objects.create_user(
+            email="boss@example.com",
+            password="securepass123",
+            first_name="Boss",
+            last_name="Man",
+            is_employer=True
+        )
+        self.employer = Employer.objects.create(
+            user=self.employer_user,
+            company_name="NextGen Tech",
+            location="Lagos"
+        )
+        self.seeker = User.objects.create_user(
+            email="jane@example.com",
+            password="userpass123",
+            first_name="Jane",
+            last_name="Doe"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.seeker)
+
+    def create_job(self, title, description, requirements=""):
+        return Job.objects.create(
+            title=title,
+            company=self.employer,
+            location="Lagos",
+            description=description,
+            requirements=requirements,
+            employment_type="Full-time",
+            posted_by=self.employer_user
+        )
+
+    def create_resume(self, text=RESUME_TEXT):
+        # Extraction runs once the upload is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            resume = Resume.objects.create(
+                applicant=self.seeker,
+                file=SimpleUploadedFile("resume.txt", text.encode(), content_type="text/plain"),
+            )
+        resume.refresh_from_db()
+        return resume
+
+
+class JobFeaturesTests(AITestCase):
+    def test_features_are_stored_on_save_and_refreshed_on_edit(self):
+        job = self.create_job("Backend Developer", "Django APIs", "Python and PostgreSQL")
+        features = JobFeatures.objects.get(job=job)
+        self.assertEqual(sorted(features.skills), ["django", "postgresql", "python"])
+        self.assertIn("apis", features.tokens)
+
+        job.requirements = "Kubernetes"
+        job.save()
+        features.refresh_from_db()
+        self.assertIn("kubernetes", features.skills)
+        self.assertNotIn("python", features.skills)
+
+    def test_recommendations_only_parse_the_resume(self):
+        jobs = [
+            self.create_job("Backend Developer", "Django APIs", "Python and PostgreSQL"),
+            self.create_job("Data Scientist", "Machine learning with pandas", "Python"),
+            self.create_job("Designer", "Figma and user research"),
+        ]
+        resume = self.create_resume()
+
+        with patch.object(JobMatcher, "extract_job_features") as job_parsing:
+            response = self.client.get(
+                reverse("ai:job-recommendations"), {"resume_id": resume.id}
+            )
+        job_parsing.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+
+        recommendations = response.data["recommendations"]
+        self.assertEqual(recommendations[0]["job_id"], jobs[0].id)
+        for item in recommendations:
+            job = Job.objects.get(id=item["job_id"])
+            expected = JobMatcher.match_resume_to_job(RESUME_TEXT, job.description, job.requirements)
+            self.assertEqual(item["match_score"], expected["overall_score"])
+
+    def test_missing_features_are_backfilled(self):
+        job = self.create_job("Backend Developer", "Django APIs", "Python")
+        JobFeatures.objects.all().delete()
+        resume = self.create_resume()
+
+        response = self.client.post(
+            reverse("ai:match-resume-job"), {"resume_id": resume.id, "job_id": job.id}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("django", response.data["matched_skills"])
+        self.assertTrue(JobFeatures.objects.filter(job=job).exists())
+
+
+class ResumeTextTests(AITestCase):
+    def test_endpoints_use_extracted_text_not_the_file(self):
+        job = self.create_job("Backend Developer", "Django APIs", "Python")
+        resume = self.create_resume()
+
+        with patch("django.db.models.fields.files.FieldFile.open") as file_open:
+            response = self.client.post(
+                reverse("ai:match-resume-job"), {"resume_id": resume.id, "job_id": job.id}, format="json"
+            )
+        file_open.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("django", response.data["matched_skills"])
+
+    @override_settings(CELERY_ENABLED=True)
+    def test_pending_and_failed_resumes(self):
+        with patch("resumes.tasks.extract_resume_text_task.delay") as delay, \
+                self.captureOnCommitCallbacks(execute=True):
+            resume = Resume.objects.create(
+                applicant=self.seeker, file=SimpleUploadedFile("resume.txt", b"Python")
+            )
+        url = reverse("ai:job-recommendations")
+        with patch("resumes.tasks.extract_resume_text_task.delay") as requeue:
+            response = self.client.get(url, {"resume_id": resume.id})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["parse_status"], Resume.PARSE_PENDING)
+        delay.assert_called_once_with(resume.id)
+        requeue.assert_not_called()  # still queued from the upload
+
+        Resume.objects.filter(id=resume.id).update(parse_status=Resume.PARSE_FAILED, parse_error="Unreadable PDF")
+        response = self.client.get(url, {"resume_id": resume.id})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.data["detail"], "Unreadable PDF")
+
+    def test_pending_resume_nothing_queued_is_processed_on_demand(self):
+        # e.g. uploaded before text extraction existed
+        resume = Resume.objects.create(
+            applicant=self.seeker, file=SimpleUploadedFile("resume.txt", b"Python and Django")
+        )
+        self.assertEqual(resume.parse_status, Resume.PARSE_PENDING)
+
+        response = self.client.get(reverse("ai:job-recommendations"), {"resume_id": resume.id})
+        self.assertEqual(response.status_code, 200)
+        resume.refresh_from_db()
+        self.assertEqual(resume.parse_status, Resume.PARSE_DONE)
+
+
+class CandidateRankingTests(AITestCase):
+    def setUp(self):
+        super().setUp()
+        self.job = self.create_job("Backend Developer", "Django APIs on AWS", "Python, PostgreSQL, Docker")
+        self.url = reverse("ai:rank-candidates", args=[self.job.id])
+        self.client.force_authenticate(user=self.employer_user)
+
+    def apply(self, email, resume, name="resume.txt"):
+        applicant = User.objects.create_user(
+            email=email, password="userpass123", first_name=email.split("@")[0], last_name="Doe"
+        )
+        return JobApplication.objects.create(
+            job=self.job, applicant=applicant, cover_letter="Hello",
+            resume=SimpleUploadedFile(name, resume.encode()),
+        )
+
+    def create_applications(self):
+        return [
+            self.apply("weak@example.com", "Figma and user research"),
+            self.apply("strong@example.com", "Python, Django, PostgreSQL and Docker on AWS"),
+            self.apply("medium@example.com", "Python developer"),
+        ]
+
+    def test_applicants_are_ranked_best_first(self):
+        weak, strong, medium = self.create_applications()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 3)
+        ranked = response.data["results"]
+        self.assertEqual([item["application_id"] for item in ranked], [strong.id, medium.id, weak.id])
+        self.assertEqual(ranked[0]["applicant"]["email"], "strong@example.com")
+        self.assertEqual(ranked[0]["missing_skills"], [])
+
+        expected = JobMatcher.match_resume_to_job(
+            "Python developer", self.job.description, self.job.requirements
+        )["overall_score"]
+        self.assertEqual(ranked[1]["match_score"], expected)
+
+    def test_resume_features_are_cached(self):
+        self.create_applications()
+        self.client.get(self.url)
+        self.assertEqual(ApplicationFeatures.objects.filter(application__job=self.job).count(), 3)
+
+        with patch("ai.repository.extract_resume_file_features") as extract:
+            response = self.client.get(self.url, {"page_size": 2})
+        extract.assert_not_called()
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+    @override_settings(CELERY_ENABLED=True, AI_RANKING_INLINE_EXTRACTIONS=1)
+    def test_large_batches_are_queued_to_celery(self):
+        cache.clear()
+        with patch("ai.signals.extract_application_features_task.delay"):
+            self.create_applications()
+        ApplicationFeatures.objects.all().delete()
+
+        with patch("ai.tasks.extract_application_features_task.delay") as delay:
+            ranked = self.client.get(self.url).data["results"]
+            self.assertEqual(ApplicationFeatures.objects.count(), 1)
+            self.assertEqual([item["resume_pending"] for item in ranked], [False, True, True])
+            # a reload extracts the next one itself but does not queue again
+            self.client.get(self.url)
+        self.assertEqual(ApplicationFeatures.objects.count(), 2)
+        self.assertEqual(delay.call_count, 2)
+
+        for (application_id,), _ in delay.call_args_list:
+            extract_application_features_task(application_id)
+        ranked = self.client.get(self.url).data["results"]
+        self.assertFalse(any(item["resume_pending"] for item in ranked))
+        self.assertEqual(ranked[0]["applicant"]["email"], "strong@example.com")
+
+    @override_settings(AI_RANKING_INLINE_EXTRACTIONS=2)
+    def test_inline_extraction_is_bounded_without_celery(self):
+        self.create_applications()
+        ApplicationFeatures.objects.all().delete()
+
+        ranked = self.client.get(self.url).data["results"]
+        self.assertEqual(ApplicationFeatures.objects.count(), 2)
+        self.assertEqual(sorted(item["resume_pending"] for item in ranked), [False, False, True])
+
+        ranked = self.client.get(self.url).data["results"]
+        self.assertEqual(ApplicationFeatures.objects.count(), 3)
+        self.assertFalse(any(item["resume_pending"] for item in ranked))
+        self.assertEqual(ranked[0]["applicant"]["email"], "strong@example.com")
+
+    def test_unreadable_resume_is_ranked_last_with_error(self):
+        self.create_applications()
+        broken = self.apply("broken@example.com", "not a pdf", name="resume.pdf")
+
+        ranked = self.client.get(self.url).data["results"]
+        self.assertEqual(ranked[-1]["application_id"], broken.id)
+        self.assertEqual(ranked[-1]["match_score"], 0)
+        self.assertTrue(ranked[-1]["resume_error"])
+
+    def test_status_filter_and_ownership(self):
+        weak, strong, medium = self.create_applications()
+        JobApplication.objects.filter(id=strong.id).update(status=JobApplication.REJECTED)
+
+        ranked = self.client.get(self.url, {"status": JobApplication.PENDING}).data["results"]
+        self.assertEqual([item["application_id"] for item in ranked], [medium.id, weak.id])
+
+        self.client.force_authenticate(user=self.seeker)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_rank_candidates_parses_the_job_once(self):
+        with patch.object(JobMatcher, "extract_job_features", wraps=JobMatcher.extract_job_features) as parse:
+            ranked = JobMatcher.rank_candidates(
+                [(1, "Rust"), (2, "Python and Django")], "Django APIs", "Python"
+            )
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual([item["candidate_id"] for item in ranked], [2, 1])
+
+
+class SkillPatternTests(SimpleTestCase):
+    pattern = SkillPattern(SkillExtractor.TECH_SKILLS, {"k8s": "kubernetes", "postgres": "PostgreSQL"})
+
+    def test_skills_must_stand_alone(self):
+        text = "Going forward: JavaScript, Rust, c++ and C#. Also R and Go, plus ASP.NET."
+        self.assertEqual(
+            self.pattern.extract(text),
+            {"programming_languages": ["javascript", "c++", "c#", "go", "rust", "r"],
+             "web_frameworks": ["asp.net"]},
+        )
+
+    def test_multi_word_and_punctuated_skills(self):
+        skills = self.pattern.find(
+            "Machine\nlearning on AWS; CI/CD with GitHub   Actions; scikit-learn, sql server."
+        )
+        self.assertEqual(
+            skills,
+            {"machine learning", "aws", "ci/cd", "github actions", "scikit-learn", "sql server"},
+        )
+
+    def test_no_partial_words(self):
+        self.assertEqual(self.pattern.extract("Expressive springtime oracles for reactors"), {})
+
+    def test_aliases_report_their_skill(self):
+        self.assertEqual(
+            self.pattern.extract("K8s and Postgres"),
+            {"databases": ["postgresql"], "cloud_devops": ["kubernetes"]},
+        )
+
+
+class SkillTaxonomyTests(AITestCase):
+    def test_seeded_taxonomy_and_aliases(self):
+        self.assertTrue(Skill.objects.filter(name="kubernetes", category="cloud_devops").exists())
+        self.assertEqual(
+            SkillExtractor.get_all_skills_flat("Golang services on k8s with postgres"),
+            ["go", "postgresql", "kubernetes"],
+        )
+
+    def test_taxonomy_edits_apply_without_restart(self):
+        self.assertEqual(SkillExtractor.extract_skills("htmx and alpine"), {})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            htmx = Skill.objects.create(name="HTMX", category="web_frameworks")
+            SkillAlias.objects.create(skill=htmx, alias="htmx.org")
+        self.assertEqual(
+            SkillExtractor.extract_skills("htmx.org and alpine"), {"web_frameworks": ["htmx"]}
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            htmx.delete()
+        self.assertEqual(SkillExtractor.extract_skills("htmx and alpine"), {})
+
+    def test_pattern_is_compiled_once_per_version(self):
+        with patch.object(skill_extractor, "build_pattern", wraps=skill_extractor.build_pattern) as build:
+            SkillExtractor.extract_skills("python")
+            SkillExtractor.extract_skills("django")
+        self.assertEqual(build.call_count, 1)
+
+    def test_import_taxonomy_refreshes_job_features(self):
+        job = self.create_job("Frontend Developer", "Build UIs with Svelte")
+        self.assertEqual(JobFeatures.objects.get(job=job).skills, [])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "taxonomy.json")
+            with open(path, "w") as fh:
+                json.dump({"web_frameworks": {"svelte": ["sveltekit"]}}, fh)
+            call_command("import_skill_taxonomy", path, stdout=io.StringIO())
+
+        self.assertEqual(JobFeatures.objects.get(job=job).skills, ["svelte"])
+        self.assertEqual(SkillAlias.objects.get(alias="sveltekit").skill.name, "svelte")
+
+
+class CatalogSnapshotTests(SimpleTestCase):
+    def test_top_k_matches_scoring_jobs_one_by_one(self):
+        rng = random.Random(7)
+        vocabulary = [f"term{i}" for i in range(40)]
+        skills = ["python", "django", "aws", "docker", "react", "sql"]
+        jobs = [
+            (job_id, set(rng.sample(skills, rng.randint(0, 4))), set(rng.sample(vocabulary, rng.randint(0, 12))))
+            for job_id in range(1, 301)
+        ]
+        snapshot = CatalogSnapshot(
+            [job_id for job_id, _, _ in jobs],
+            [job_skills for _, job_skills, _ in jobs],
+            [job_tokens for _, _, job_tokens in jobs],
+        )
+        resume_skills = ["Python", "docker", "sql"]
+        resume_tokens = set(rng.sample(vocabulary, 15))
+
+        brute_force = {
+            job_id: JobMatcher.score_features(resume_skills, resume_tokens, job_skills, job_tokens)["overall_score"]
+            for job_id, job_skills, job_tokens in jobs
+        }
+        expected = sorted(brute_force.values(), reverse=True)[:20]
+
+        # score_features rounds its components, so allow for rounding drift
+        top = snapshot.top_k(resume_skills, resume_tokens, 20)
+        for (job_id, score), expected_score in zip(top, expected):
+            self.assertAlmostEqual(score, expected_score, delta=0.02)
+            self.assertAlmostEqual(score, brute_force[job_id], delta=0.02)
+        self.assertEqual(len(top), 20)
+
+    def test_empty_catalog(self):
+        self.assertEqual(CatalogSnapshot([], [], []).top_k(["python"], {"python"}, 5), [])
+
+    @override_settings(AI_CATALOG_MIN_REBUILD_SECONDS=0, AI_CATALOG_BACKGROUND_REBUILD=True)
+    def test_stale_catalog_is_served_while_rebuilt_in_the_background(self):
+        stale = CatalogSnapshot([1], [["python"]], [{"python"}], version="v1")
+        fresh = CatalogSnapshot([1, 2], [["python"], []], [{"python"}, set()], version="v2")
+        resume_matcher._snapshot = stale
+        self.addCleanup(setattr, resume_matcher, "_snapshot", None)
+
+        with patch.object(resume_matcher, "_catalog_version", return_value="v2"), \
+                patch.object(resume_matcher, "build_snapshot", return_value=fresh) as build:
+            self.assertIs(resume_matcher.get_catalog(), stale)
+            for thread in threading.enumerate():
+                if thread.name == "catalog-rebuild":
+                    thread.join()
+            self.assertIs(resume_matcher.get_catalog(), fresh)
+
+        build.assert_called_once_with("v2")
+
+
+class JobRecommendationCatalogTests(AITestCase):
+    def test_recommendations_cover_the_whole_catalog(self):
+        for i in range(60):
+            self.create_job(f"Designer {i}", "Figma and user research")
+        best = self.create_job("Backend Developer", "Django APIs on AWS", "Python, PostgreSQL, Docker")
+        resume = self.create_resume()
+
+        response = self.client.get(reverse("ai:job-recommendations"), {"resume_id": resume.id, "limit": 3})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["recommendations"][0]["job_id"], best.id)
+        self.assertEqual(len(response.data["recommendations"]), 3)
+
+    def test_catalog_follows_job_writes(self):
+        job = self.create_job("Designer", "Figma and user research")
+        resume = self.create_resume()
+        url = reverse("ai:job-recommendations")
+
+        first = self.client.get(url, {"resume_id": resume.id}).data["recommendations"][0]
+        self.assertEqual(first["matched_skills"], [])
+
+        job.requirements = "Python and Django"
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+        first = self.client.get(url, {"resume_id": resume.id}).data["recommendations"][0]
+        self.assertIn("django", first["matched_skills"])
+
+        job.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+        self.assertEqual(self.client.get(url, {"resume_id": resume.id}).data["recommendations"], [])
+
+    def test_catalog_moves_only_once_job_writes_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            job = self.create_job("Designer", "Figma and user research")
+            job.delete()
+        self.assertEqual(callbacks.count(resume_matcher.bump_catalog_version), 2)
+
+    def test_snapshot_backfills_features_in_bulk(self):
+        for i in range(20):
+            self.create_job(f"Designer {i}", "Figma and user research")
+        JobFeatures.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            snapshot = resume_matcher.build_snapshot()
+        self.assertLess(len(queries), 10)
+        self.assertEqual(len(snapshot.job_ids), 20)
+        self.assertEqual(JobFeatures.objects.count(), 20)
@@ -8,4 +8,5 @@ urlpatterns = [
     path("extract-skills/", views.extract_skills, name="extract-skills"),
     path("match-resume-job/", views.match_resume_to_job, name="match-resume-job"),
     path("job-recommendations/", views.get_job_recommendations, name="job-recommendations"),
+    path("jobs/<int:job_id>/rank-candidates/", views.rank_job_candidates, name="rank-candidates"),
 ]
@@ -1,13 +1,39 @@
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 
 from .services import ResumeParser, JobMatcher, SkillExtractor
-from jobs.models import Job
+from .repository import ApplicationFeatureRepository, JobFeatureRepository
+from .matchers.resume_matcher import get_catalog
+from jobs.models import Job, JobApplication
 from resumes.models import Resume
+from resumes.services import ResumeService
+
+
+def _unparsed_resume_response(resume):
+    """
+    Error response for a resume whose text is not available yet (extraction
+    still queued) or could not be extracted; None when the text is ready.
+    A pending resume nothing has queued is processed now (inline when
+    Celery is off).
+    """
+    ResumeService.ensure_processed(resume)
+    if resume.parse_status == Resume.PARSE_PENDING:
+        return Response(
+            {'error': 'Resume is still being processed', 'parse_status': resume.parse_status},
+            status=status.HTTP_409_CONFLICT
+        )
+    if resume.parse_status == Resume.PARSE_FAILED:
+        return Response(
+            {'error': 'Resume could not be read', 'detail': resume.parse_error,
+             'parse_status': resume.parse_status},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+    return None
 
 
 @extend_schema(
@@ -178,7 +204,7 @@ def match_resume_to_job(request):
     
     # Get job
     try:
-        job = Job.objects.get(id=job_id)
+        job = Job.objects.select_related('ai_features').get(id=job_id)
     except Job.DoesNotExist:
         return Response(
             {'error': 'Job not found'},
@@ -188,15 +214,16 @@ def match_resume_to_job(request):
     # Get resume text
     if resume_id:
         try:
-            resume = Resume.objects.get(id=resume_id, user=request.user)
-            # Assuming Resume model has a way to get text content
-            # You may need to adjust this based on your Resume model
-            resume_text = getattr(resume, 'content', '') or str(resume.file.read().decode('utf-8', errors='ignore') if resume.file else '')
+            resume = Resume.objects.get(id=resume_id, applicant=request.user)
         except Resume.DoesNotExist:
             return Response(
                 {'error': 'Resume not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        unparsed = _unparsed_resume_response(resume)
+        if unparsed:
+            return unparsed
+        resume_text = resume.text
     
     if not resume_text:
         return Response(
@@ -204,11 +231,12 @@ def match_resume_to_job(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Calculate match
-    match_result = JobMatcher.match_resume_to_job(
-        resume_text=resume_text,
-        job_description=job.description,
-        job_requirements=job.requirements or ""
+    # Calculate match against the job's stored features
+    resume_features = JobMatcher.extract_resume_features(resume_text)
+    job_features = JobFeatureRepository.for_jobs([job])[job.id]
+    match_result = JobMatcher.score_features(
+        resume_features['skills'], resume_features['tokens'],
+        job_features['skills'], job_features['tokens']
     )
     
     return Response(match_result, status=status.HTTP_200_OK)
@@ -272,24 +300,36 @@ def get_job_recommendations(request):
     
     # Get resume
     try:
-        resume = Resume.objects.get(id=resume_id, user=request.user)
-        resume_text = getattr(resume, 'content', '') or str(resume.file.read().decode('utf-8', errors='ignore') if resume.file else '')
+        resume = Resume.objects.get(id=resume_id, applicant=request.user)
     except Resume.DoesNotExist:
         return Response(
             {'error': 'Resume not found'},
             status=status.HTTP_404_NOT_FOUND
         )
+    unparsed = _unparsed_resume_response(resume)
+    if unparsed:
+        return unparsed
+    resume_text = resume.text
+    
+    # Parse the resume once
+    resume_features = JobMatcher.extract_resume_features(resume_text)
     
-    # Get active jobs
-    jobs = Job.objects.filter(is_active=True)[:50]  # Limit to 50 for performance
+    # Score it against every active job in one vectorized pass; a few spare
+    # candidates cover jobs deactivated since the catalog snapshot was built
+    top = get_catalog().top_k(resume_features['skills'], resume_features['tokens'], limit * 2)
+    jobs = list(
+        Job.objects.filter(id__in=[job_id for job_id, _ in top], is_active=True)
+        .select_related('company', 'ai_features')
+    )
+    job_features = JobFeatureRepository.for_jobs(jobs)
     
-    # Calculate match scores
+    # Full match details for the shortlisted jobs only
     recommendations = []
     for job in jobs:
-        match_result = JobMatcher.match_resume_to_job(
-            resume_text=resume_text,
-            job_description=job.description,
-            job_requirements=job.requirements or ""
+        features = job_features[job.id]
+        match_result = JobMatcher.score_features(
+            resume_features['skills'], resume_features['tokens'],
+            features['skills'], features['tokens']
         )
         
         recommendations.append({
@@ -303,9 +343,115 @@ def get_job_recommendations(request):
         })
     
     # Sort by match score and limit
-    recommendations.sort(key=lambda x: x['match_score'], reverse=True)
+    recommendations.sort(key=lambda x: (x['match_score'], x['job_id']), reverse=True)
     recommendations = recommendations[:limit]
     
     return Response({
         'recommendations': recommendations
     }, status=status.HTTP_200_OK)
+
+
+class CandidateRankingPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+@extend_schema(
+    tags=['AI'],
+    summary='Rank job applicants',
+    description=(
+        'Rank every applicant of one of your jobs by how well their resume matches it, '
+        'best first. Employers only.'
+    ),
+    parameters=[
+        OpenApiParameter(
+            name='status',
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description='Only rank applications with this status (e.g. Pending)',
+            required=False
+        ),
+        OpenApiParameter(name='page', type=OpenApiTypes.INT, location=OpenApiParameter.QUERY, required=False),
+        OpenApiParameter(name='page_size', type=OpenApiTypes.INT, location=OpenApiParameter.QUERY, required=False),
+    ],
+    responses={
+        200: {
+            'description': 'Ranked applicants',
+            'examples': {
+                'application/json': {
+                    'count': 1,
+                    'next': None,
+                    'previous': None,
+                    'results': [
+                        {
+                            'application_id': 12,
+                            'applicant': {'id': 7, 'name': 'Jane Doe', 'email': 'jane@example.com'},
+                            'status': 'Pending',
+                            'applied_at': '2025-01-01T10:00:00Z',
+                            'match_score': 72.4,
+                            'match_level': 'Good',
+                            'matched_skills': ['python', 'django'],
+                            'missing_skills': ['aws'],
+                            'resume_error': ''
+                        }
+                    ]
+                }
+            }
+        }
+    }
+)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def rank_job_candidates(request, job_id):
+    """
+    Rank all applicants for a job. Job features are read once, resume
+    features come from ApplicationFeatures (extracted on first use, a few
+    per request; the rest are ranked as pending, queued with Celery).
+    """
+    try:
+        job = Job.objects.select_related('ai_features').get(id=job_id, posted_by=request.user)
+    except Job.DoesNotExist:
+        return Response(
+            {'error': 'Job not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    applications = JobApplication.objects.filter(job=job).select_related('applicant', 'ai_features')
+    status_filter = request.query_params.get('status')
+    if status_filter:
+        applications = applications.filter(status=status_filter)
+    applications = {application.id: application for application in applications}
+    
+    job_features = JobFeatureRepository.for_jobs([job])[job.id]
+    resume_features = ApplicationFeatureRepository.for_applications(applications.values())
+    ranked = JobMatcher.rank_candidate_features(
+        [(app_id, f['skills'], f['tokens']) for app_id, f in resume_features.items()],
+        job_features['skills'], job_features['tokens']
+    )
+    # Equal scores: earlier applications first
+    ranked.sort(key=lambda item: (-item['match_score'], applications[item['candidate_id']].applied_at))
+    
+    paginator = CandidateRankingPagination()
+    page = paginator.paginate_queryset(ranked, request)
+    results = []
+    for item in page:
+        application = applications[item['candidate_id']]
+        applicant = application.applicant
+        results.append({
+            'application_id': application.id,
+            'applicant': {
+                'id': applicant.id,
+                'name': f"{applicant.first_name} {applicant.last_name}".strip(),
+                'email': applicant.email,
+            },
+            'status': application.status,
+            'applied_at': application.applied_at,
+            'match_score': item['match_score'],
+            'match_level': item['match_level'],
+            'matched_skills': sorted(item['matched_skills']),
+            'missing_skills': sorted(item['missing_skills']),
+            'resume_error': resume_features[application.id]['error'],
+            'resume_pending': resume_features[application.id]['pending'],
+        })
+    return paginator.get_paginated_response(results)
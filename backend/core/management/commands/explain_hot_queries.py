@@ -0,0 +1,81 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from jobs.models import Job, JobApplication, SavedJob
+from notifications.models import Notification
+
+# Indexes added for the querysets below (jobs 0007, notifications 0002)
+HOT_QUERY_INDEXES = [
+    "job_active_feed_idx",
+    "job_poster_active_idx",
+    "app_job_status_idx",
+    "app_applicant_idx",
+    "savedjob_user_idx",
+    "notif_user_created_idx",
+    "notif_user_unread_idx",
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+def hot_querysets(user_id, job_id):
+    """The first-page querysets behind the job, application, saved-job and notification endpoints."""
+    return {
+        "job feed (JobViewSet, anonymous/seeker)": Job.objects.filter(is_active=True).order_by("-posted_at", "-id")[:10],
+        "employer jobs (JobViewSet, employer)": Job.objects.filter(is_active=True, posted_by_id=user_id).order_by("-posted_at")[:10],
+        "applications by job+status (JobApplicationViewSet)": JobApplication.objects.filter(
+            job_id=job_id, status=JobApplication.PENDING
+        ).order_by("-applied_at")[:10],
+        "seeker applications (JobApplicationViewSet)": JobApplication.objects.filter(applicant_id=user_id).order_by("-applied_at")[:10],
+        "saved jobs (SavedJobViewSet)": SavedJob.objects.filter(user_id=user_id).order_by("-saved_at")[:10],
+        "notifications (NotificationViewSet)": Notification.objects.filter(user_id=user_id)[:20],
+        "unread notifications": Notification.objects.filter(user_id=user_id, is_read=False)[:20],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Print query plans (and timings) for the hot job/application/notification "
+        "querysets with the composite indexes, and with --compare also without them. "
+        "The 'without' pass drops the indexes inside a transaction that is rolled "
+        "back; on Postgres that takes table locks, so run it against a copy of the data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, default=1, help="User id to plug into the querysets.")
+        parser.add_argument("--job", type=int, default=1, help="Job id to plug into the querysets.")
+        parser.add_argument("--compare", action="store_true", help="Also show plans with the indexes dropped.")
+        parser.add_argument("--analyze", action="store_true", help="Use EXPLAIN ANALYZE (Postgres only).")
+
+    def handle(self, *args, **options):
+        if options["compare"]:
+            try:
+                with transaction.atomic():
+                    with connection.cursor() as cursor:
+                        for name in HOT_QUERY_INDEXES:
+                            cursor.execute(f"DROP INDEX IF EXISTS {connection.ops.quote_name(name)}")
+                    self._report("WITHOUT composite indexes", options)
+                    raise _Rollback
+            except _Rollback:
+                pass
+
+        self._report("WITH composite indexes", options)
+
+    def _report(self, heading, options):
+        explain_options = {}
+        if options["analyze"] and connection.vendor == "postgresql":
+            explain_options = {"analyze": True, "buffers": True}
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"== {heading} =="))
+        for label, queryset in hot_querysets(options["user"], options["job"]).items():
+            start = time.perf_counter()
+            list(queryset)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            self.stdout.write(self.style.SUCCESS(f"-- {label} ({elapsed_ms:.2f} ms)"))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write("")
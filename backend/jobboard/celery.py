@@ -12,7 +12,7 @@ app = Celery("jobboard")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Auto-discover tasks in all installed apps
-app.autodiscover_tasks(["users", "jobs", "resumes", "employers", "scraper"])
+app.autodiscover_tasks(["users", "jobs", "resumes", "employers", "scraper", "ai"])
 
 @app.task(bind=True)
 def debug_task(self):
@@ -54,6 +54,18 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "Africa/Lagos"
 
+# -----------------------
+# CACHE
+# -----------------------
+# Redis (separate DB from the Celery broker) by default; set
+# CACHE_URL=locmemcache:// to run without Redis.
+CACHES = {"default": env.cache("CACHE_URL", default="redis://localhost:6379/1")}
+CACHES["default"].setdefault("KEY_PREFIX", "jobboard")
+
+# Seconds an anonymous job list/detail response stays cached. Entries are
+# also invalidated on Job/JobTag/Employer writes (see jobs/cache.py).
+JOBS_CACHE_TIMEOUT = env.int("JOBS_CACHE_TIMEOUT", default=300)
+
 # -----------------------
 # INSTALLED APPS
 # -----------------------
@@ -168,6 +180,38 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 10,
 }
 
+# -----------------------
+# JOB SEARCH
+# -----------------------
+# "auto" uses Postgres full-text search (GIN-indexed tsvector) when the
+# database is Postgres and the in-process inverted index otherwise.
+# Explicit values: "postgres", "inverted_index". The inverted index is
+# for tests and local development; it ranks at most this many matches.
+JOBS_SEARCH_BACKEND = env("JOBS_SEARCH_BACKEND", default="auto")
+JOBS_SEARCH_MAX_RESULTS = env.int("JOBS_SEARCH_MAX_RESULTS", default=500)
+
+# -----------------------
+# AI RECOMMENDATIONS
+# -----------------------
+# Each worker keeps an in-memory scoring matrix of all active jobs and
+# rebuilds it after job writes, but at most once per this many seconds.
+AI_CATALOG_MIN_REBUILD_SECONDS = env.int("AI_CATALOG_MIN_REBUILD_SECONDS", default=30)
+# Rebuild in a background thread, serving the previous matrix meanwhile.
+AI_CATALOG_BACKGROUND_REBUILD = env.bool("AI_CATALOG_BACKGROUND_REBUILD", default=True)
+# How often a worker checks whether the skill taxonomy (ai.Skill) changed.
+AI_SKILL_TAXONOMY_CHECK_SECONDS = env.int("AI_SKILL_TAXONOMY_CHECK_SECONDS", default=5)
+# Candidate ranking extracts at most this many uncached application
+# resumes per request; the rest are queued to the workers with Celery,
+# or left to the following requests without it.
+AI_RANKING_INLINE_EXTRACTIONS = env.int("AI_RANKING_INLINE_EXTRACTIONS", default=10)
+
+# -----------------------
+# SCRAPER
+# -----------------------
+# Redis holding the per-domain request rate buckets shared by all scraper
+# workers (scraper/throttle.py). Empty keeps a separate budget per process.
+SCRAPER_RATE_LIMIT_URL = env("SCRAPER_RATE_LIMIT_URL", default=REDIS_URL)
+
 # -----------------------
 # SIMPLE JWT SETTINGS
 # -----------------------
@@ -0,0 +1,153 @@
+"""
+Response cache for anonymous job list and detail requests.
+
+Keys are versioned instead of deleted: every list key embeds the current
+list version and every detail key the current version of that job, so
+bumping a version (on Job/JobTag/Employer writes, see jobs.signals)
+makes the old entries unreachable and they simply expire. No key scans,
+no global flush.
+
+Hit/miss counters live in the same cache so they are shared by all
+workers; see JobViewSet.cache_stats. Any cache error degrades to an
+uncached response rather than failing the request.
+"""
+
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+LIST_VERSION_KEY = "jobs:list:version"
+DETAIL_VERSION_KEY = "jobs:detail:{job_id}:version"
+STATS_KEY = "jobs:cache:{event}"
+
+
+def _timeout():
+    return getattr(settings, "JOBS_CACHE_TIMEOUT", 300)
+
+
+def _get_version(key):
+    version = cache.get(key)
+    if version is None:
+        # Millisecond timestamps never repeat a version that was evicted
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def _record(event):
+    key = STATS_KEY.format(event=event)
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 0, timeout=None)
+            cache.incr(key)
+    except Exception:
+        logger.warning("Could not record job cache %s", event, exc_info=True)
+
+
+def normalized_params(request):
+    """Query params as a stable string: sorted keys and values, blanks dropped."""
+    items = []
+    for key in sorted(request.query_params):
+        values = sorted(v for v in request.query_params.getlist(key) if v != "")
+        items.extend(f"{key}={value}" for value in values)
+    return "&".join(items)
+
+
+def list_cache_key(request):
+    # Host is part of the key because pagination links are absolute URLs
+    digest = hashlib.sha1(
+        f"{request.get_host()}?{normalized_params(request)}".encode()
+    ).hexdigest()
+    return f"jobs:list:v{_get_version(LIST_VERSION_KEY)}:{digest}"
+
+
+def detail_cache_key(request, job_id):
+    version = _get_version(DETAIL_VERSION_KEY.format(job_id=job_id))
+    return f"jobs:detail:{job_id}:v{version}"
+
+
+def invalidate_job_lists():
+    try:
+        _bump_version(LIST_VERSION_KEY)
+    except Exception:
+        logger.warning("Could not invalidate cached job lists", exc_info=True)
+
+
+def invalidate_jobs(job_ids):
+    """Invalidate the detail entries for `job_ids` and every list page."""
+    try:
+        for job_id in job_ids:
+            _bump_version(DETAIL_VERSION_KEY.format(job_id=job_id))
+        _bump_version(LIST_VERSION_KEY)
+    except Exception:
+        logger.warning("Could not invalidate cached jobs %s", list(job_ids), exc_info=True)
+
+
+def get_cache_stats():
+    hits = cache.get(STATS_KEY.format(event="hit")) or 0
+    misses = cache.get(STATS_KEY.format(event="miss")) or 0
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+    }
+
+
+class JobResponseCacheMixin:
+    """
+    Serve list/retrieve for anonymous users from the response cache.
+    Authenticated responses carry per-user flags (has_applied, is_saved)
+    and are never cached.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(
+            request, lambda: list_cache_key(request), super().list, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        job_id = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return self._cached_response(
+            request, lambda: detail_cache_key(request, job_id), super().retrieve, *args, **kwargs
+        )
+
+    def _cached_response(self, request, make_key, handler, *args, **kwargs):
+        if request.user.is_authenticated:
+            return handler(request, *args, **kwargs)
+
+        try:
+            key = make_key()
+            data = cache.get(key)
+        except Exception:
+            logger.warning("Job response cache unavailable", exc_info=True)
+            return handler(request, *args, **kwargs)
+
+        if data is not None:
+            _record("hit")
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            try:
+                cache.set(key, response.data, timeout=_timeout())
+            except Exception:
+                logger.warning("Could not store job response in cache", exc_info=True)
+            _record("miss")
+        response["X-Cache"] = "MISS"
+        return response
@@ -1,6 +1,9 @@
 # filters.py (create this inside your jobs app)
 import django_filters
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
 from .models import Job
+from .search import get_search_backend
 
 class JobFilter(django_filters.FilterSet):
     title = django_filters.CharFilter(field_name="title", lookup_expr="icontains")
@@ -10,3 +13,33 @@ class JobFilter(django_filters.FilterSet):
     class Meta:
         model = Job
         fields = ["title", "location", "company", "employment_type", "tags"]
+
+
+class JobSearchFilter(BaseFilterBackend):
+    """
+    Full-text `?search=` for jobs, served by the configured search backend
+    (see jobs.search) and ordered by relevance. An explicit `?ordering=`
+    still wins because OrderingFilter runs after this backend.
+    """
+
+    search_param = api_settings.SEARCH_PARAM
+
+    def get_search_query(self, request):
+        return request.query_params.get(self.search_param, "").strip()
+
+    def filter_queryset(self, request, queryset, view):
+        query = self.get_search_query(request)
+        if not query:
+            return queryset
+        return get_search_backend().search(queryset, query)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Full-text search over title, tags, company, location, requirements and description.",
+                "schema": {"type": "string"},
+            }
+        ]
@@ -0,0 +1,143 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from users.models import User
+from employers.models import Employer
+from jobs.models import Job, JobTag
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class JobResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.employer_user = User.objects.create_user(
+            email="boss@example.com",
+            password="securepass123",
+            first_name="Boss",
+            last_name="Man",
+            is_employer=True
+        )
+        self.employer = Employer.objects.create(
+            user=self.employer_user,
+            company_name="NextGen Tech",
+            location="Lagos"
+        )
+        self.job = Job.objects.create(
+            title="Backend Developer",
+            company=self.employer,
+            location="Remote",
+            description="Work with Django",
+            requirements="Python",
+            employment_type="Full-time",
+            posted_by=self.employer_user
+        )
+        self.anon = APIClient()
+        self.list_url = reverse("jobs:job-list")
+        self.detail_url = reverse("jobs:job-detail", args=[self.job.id])
+
+    def test_anonymous_list_is_served_from_cache(self):
+        first = self.anon.get(self.list_url, {"location": "Remote"})
+        self.assertEqual(first["X-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            second = self.anon.get(self.list_url, {"location": "Remote"})
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.data, first.data)
+
+    def test_query_params_are_normalized(self):
+        self.anon.get(self.list_url, {"location": "Remote", "ordering": "-posted_at"})
+        response = self.anon.get(self.list_url + "?ordering=-posted_at&location=Remote&search=")
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_job_save_invalidates_list_and_detail(self):
+        self.anon.get(self.list_url)
+        self.anon.get(self.detail_url)
+
+        self.job.title = "Platform Engineer"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+
+        listing = self.anon.get(self.list_url)
+        detail = self.anon.get(self.detail_url)
+        self.assertEqual(listing["X-Cache"], "MISS")
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(detail.data["title"], "Platform Engineer")
+
+    def test_cache_moves_only_once_the_write_commits(self):
+        self.anon.get(self.detail_url)
+
+        self.job.title = "Platform Engineer"
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.job.save()
+            # a request racing the transaction still sees the cached entry
+            self.assertEqual(self.anon.get(self.detail_url)["X-Cache"], "HIT")
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.anon.get(self.detail_url)["X-Cache"], "MISS")
+
+    def test_other_jobs_detail_survives_unrelated_write(self):
+        other = Job.objects.create(
+            title="Designer", company=self.employer, location="Lagos",
+            description="Figma", requirements="UI", employment_type="Full-time",
+            posted_by=self.employer_user
+        )
+        self.anon.get(self.detail_url)
+        other.title = "Senior Designer"
+        with self.captureOnCommitCallbacks(execute=True):
+            other.save()
+        self.assertEqual(self.anon.get(self.detail_url)["X-Cache"], "HIT")
+
+    def test_employer_and_tag_changes_invalidate_their_jobs(self):
+        tag = JobTag.objects.create(name="python")
+        self.job.tags.add(tag)
+        self.anon.get(self.detail_url)
+
+        tag.name = "python3"
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.save()
+        detail = self.anon.get(self.detail_url)
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(detail.data["tags"][0]["name"], "python3")
+
+        self.employer.company_name = "NextGen Labs"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employer.save()
+        detail = self.anon.get(self.detail_url)
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(detail.data["company"]["company_name"], "NextGen Labs")
+
+    def test_clearing_a_tag_from_its_side_invalidates_its_jobs(self):
+        tag = JobTag.objects.create(name="python")
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.job_set.add(self.job)
+        self.anon.get(self.detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.job_set.clear()
+        detail = self.anon.get(self.detail_url)
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(detail.data["tags"], [])
+
+    def test_authenticated_responses_are_not_cached(self):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(
+            email="user@example.com", password="userpass123", first_name="A", last_name="B"
+        ))
+        client.get(self.list_url)
+        response = client.get(self.list_url)
+        self.assertNotIn("X-Cache", response)
+
+    def test_cache_stats_count_hits_and_misses(self):
+        self.anon.get(self.list_url)
+        self.anon.get(self.list_url)
+        self.anon.get(self.list_url)
+
+        admin = User.objects.create_superuser(email="admin@example.com", password="adminpass123")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        stats = client.get(reverse("jobs:job-cache-stats")).data
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
@@ -1,9 +1,11 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from users.models import User
 from employers.models import Employer
-from jobs.models import Job
+from jobs.models import Job, JobApplication, JobTag, SavedJob
 
 class JobTests(APITestCase):
     def setUp(self):
@@ -108,6 +110,62 @@ class JobTests(APITestCase):
         self.assertEqual(response.data[0]["title"], "Backend Developer")
         self.assertEqual(response.data[1]["title"], "Frontend Developer")
 
+    # -----------------------------
+    # APPLIED / SAVED FLAGS
+    # -----------------------------
+    def test_list_reports_applied_and_saved_flags(self):
+        JobApplication.objects.create(
+            job=self.job1, applicant=self.regular_user, cover_letter="Hi", resume="resumes/cv.pdf"
+        )
+        SavedJob.objects.create(job=self.job2, user=self.regular_user)
+
+        response = self.user_client.get(reverse("jobs:job-list"))
+        flags = {
+            job["id"]: (job["has_applied"], job["is_saved"])
+            for job in response.data["results"]
+        }
+        self.assertEqual(flags[self.job1.id], (True, False))
+        self.assertEqual(flags[self.job2.id], (False, True))
+
+    def test_flags_are_computed_in_the_page_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.user_client.get(reverse("jobs:job-list"))
+        flag_queries = [
+            q["sql"] for q in ctx.captured_queries
+            if "jobs_jobapplication" in q["sql"] or "jobs_savedjob" in q["sql"]
+        ]
+        # One page query carries both EXISTS subqueries
+        self.assertEqual(len(flag_queries), 1)
+
+    # -----------------------------
+    # QUERY COUNT
+    # -----------------------------
+    def test_list_query_count_is_constant_per_page(self):
+        tag = JobTag.objects.create(name="python")
+        for i in range(5):
+            job = Job.objects.create(
+                title=f"Engineer {i}",
+                company=self.employer,
+                location="Remote",
+                description="Python services",
+                requirements="Python",
+                employment_type="Full-time",
+                posted_by=self.employer_user
+            )
+            job.tags.add(tag)
+
+        url = reverse("jobs:job-list")
+        # COUNT(*), the page (with company/user join and flag subqueries), tags prefetch
+        with self.assertNumQueries(3):
+            response = self.user_client.get(url)
+        self.assertEqual(len(response.data["results"]), 7)
+
+    def test_detail_query_count(self):
+        self.job1.tags.add(JobTag.objects.create(name="django"))
+        with self.assertNumQueries(2):
+            response = self.user_client.get(reverse("jobs:job-detail", args=[self.job1.id]))
+        self.assertEqual(response.data["company"]["user_email"], "boss@example.com")
+
     # -----------------------------
     # CREATE (Employer only)
     # -----------------------------
@@ -0,0 +1,139 @@
+from decimal import Decimal
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from users.models import User
+from employers.models import Employer
+from jobs.models import Job
+
+
+class JobCursorPaginationTests(APITestCase):
+    def setUp(self):
+        self.employer_user = User.objects.create_user(
+            email="boss@example.com",
+            password="securepass123",
+            first_name="Boss",
+            last_name="Man",
+            is_employer=True
+        )
+        self.employer = Employer.objects.create(
+            user=self.employer_user,
+            company_name="NextGen Tech",
+            location="Lagos"
+        )
+        self.regular_user = User.objects.create_user(
+            email="user@example.com",
+            password="userpass123",
+            first_name="Regular",
+            last_name="User"
+        )
+
+        # Duplicate and missing salaries exercise the id tie-breaker and NULL handling
+        salaries = [500000, None, 300000, 500000, None, 700000, 300000, 500000]
+        self.jobs = [
+            Job.objects.create(
+                title=f"Engineer {i}",
+                company=self.employer,
+                location="Remote",
+                description="Build things",
+                requirements="Experience",
+                max_salary=salary,
+                employment_type="Full-time",
+                posted_by=self.employer_user
+            )
+            for i, salary in enumerate(salaries)
+        ]
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.regular_user)
+        self.url = reverse("jobs:job-list")
+
+    def _walk(self, params):
+        """Follow `next` links to the end, then `previous` links back."""
+        forward, pages = [], []
+        response = self.client.get(self.url, {"pagination": "cursor", "page_size": 3, **params})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data["count"], len(self.jobs))
+            page = [job["id"] for job in response.data["results"]]
+            forward.extend(page)
+            pages.append(page)
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        backward = [pages[-1]]
+        while response.data["previous"]:
+            response = self.client.get(response.data["previous"])
+            backward.append([job["id"] for job in response.data["results"]])
+        self.assertEqual(backward, list(reversed(pages)))
+        return forward
+
+    def _sorted_ids(self, key, descending):
+        present = sorted(
+            (j for j in self.jobs if key(j) is not None),
+            key=lambda j: (key(j), j.id),
+            reverse=descending,
+        )
+        missing = sorted(
+            (j for j in self.jobs if key(j) is None),
+            key=lambda j: j.id,
+            reverse=descending,
+        )
+        return [j.id for j in present + missing]
+
+    def test_default_feed_is_newest_first(self):
+        expected = self._sorted_ids(lambda j: j.posted_at, descending=True)
+        self.assertEqual(self._walk({}), expected)
+
+    def test_salary_orderings_cover_every_job_once(self):
+        for ordering, descending in (("max_salary", False), ("-max_salary", True)):
+            with self.subTest(ordering=ordering):
+                expected = self._sorted_ids(lambda j: j.max_salary, descending)
+                self.assertEqual(self._walk({"ordering": ordering}), expected)
+
+    def test_company_name_ordering(self):
+        expected = self._sorted_ids(lambda j: j.company.company_name, descending=False)
+        self.assertEqual(self._walk({"ordering": "company__company_name"}), expected)
+
+    def test_cursor_page_does_not_use_offset(self):
+        response = self.client.get(self.url, {"pagination": "cursor", "page_size": 3})
+        with self.assertNumQueries(3) as ctx:
+            self.client.get(response.data["next"])
+        self.assertFalse(any("OFFSET" in q["sql"] for q in ctx.captured_queries))
+
+    def test_invalid_or_mismatched_cursor_is_rejected(self):
+        response = self.client.get(self.url, {"pagination": "cursor", "cursor": "garbage"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        first = self.client.get(self.url, {"pagination": "cursor", "page_size": 3})
+        cursor = parse_qs(urlparse(first.data["next"]).query)["cursor"][0]
+        response = self.client.get(
+            self.url, {"pagination": "cursor", "cursor": cursor, "ordering": "max_salary"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_reports_capped_count(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], len(self.jobs))
+        self.assertFalse(response.data["count_is_capped"])
+        self.assertEqual(Decimal(response.data["results"][0]["max_salary"]), Decimal(500000))
+
+    def test_pages_past_the_count_cap_point_to_cursor_mode(self):
+        with patch("jobs.pagination.COUNT_CAP", 4):
+            response = self.client.get(self.url, {"page_size": 2, "page": 2})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.data["count_is_capped"])
+            self.assertIsNone(response.data["next"])
+
+            response = self.client.get(self.url, {"page_size": 2, "page": 3})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            self.assertIn("pagination=cursor", str(response.data["detail"]))
+
+        # past the end of an uncapped list is still a plain 404
+        response = self.client.get(self.url, {"page_size": 2, "page": 5})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("pagination=cursor", str(response.data["detail"]))
@@ -0,0 +1,125 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from users.models import User
+from employers.models import Employer
+from jobs.models import Job, JobTag, JobSearchDocument
+from jobs.search import InvertedIndexSearchBackend, bump_index_version, get_search_backend
+
+
+class JobSearchTests(APITestCase):
+    def setUp(self):
+        get_search_backend().reset()
+
+        self.employer_user = User.objects.create_user(
+            email="boss@example.com",
+            password="securepass123",
+            first_name="Boss",
+            last_name="Man",
+            is_employer=True
+        )
+        self.employer = Employer.objects.create(
+            user=self.employer_user,
+            company_name="NextGen Tech",
+            location="Lagos"
+        )
+        self.regular_user = User.objects.create_user(
+            email="user@example.com",
+            password="userpass123",
+            first_name="Regular",
+            last_name="User"
+        )
+
+        self.python_title = self._create_job(
+            title="Python Engineer",
+            description="Build internal tooling",
+            requirements="2+ years experience",
+        )
+        self.python_description = self._create_job(
+            title="Backend Engineer",
+            description="Services written mostly in Python and Go",
+            requirements="3+ years experience",
+        )
+        self.frontend = self._create_job(
+            title="Frontend Developer",
+            description="React + Next.js",
+            requirements="2+ years experience",
+        )
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.regular_user)
+        self.url = reverse("jobs:job-list")
+
+    def _create_job(self, **kwargs):
+        return Job.objects.create(
+            company=self.employer,
+            location="Remote",
+            employment_type="Full-time",
+            posted_by=self.employer_user,
+            **kwargs
+        )
+
+    def _search(self, query):
+        response = self.client.get(self.url, {"search": query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [job["id"] for job in response.data["results"]]
+
+    def test_saving_job_builds_search_document(self):
+        document = JobSearchDocument.objects.get(job=self.python_title)
+        self.assertIn("Python Engineer", document.weighted_a)
+        self.assertIn("NextGen Tech", document.weighted_b)
+
+    def test_title_match_ranks_above_description_match(self):
+        ids = self._search("python")
+        self.assertEqual(ids, [self.python_title.id, self.python_description.id])
+
+    def test_terms_are_prefixes_and_all_must_match(self):
+        self.assertEqual(self._search("fronte"), [self.frontend.id])
+        self.assertEqual(self._search("python go"), [self.python_description.id])
+        self.assertEqual(self._search("python cobol"), [])
+
+    def test_search_matches_company_and_tags(self):
+        tag = JobTag.objects.create(name="fintech")
+        self.frontend.tags.add(tag)
+        self.assertEqual(self._search("fintech"), [self.frontend.id])
+        self.assertEqual(len(self._search("nextgen")), 3)
+
+    def test_clearing_a_tag_from_its_side_reindexes_its_jobs(self):
+        tag = JobTag.objects.create(name="fintech")
+        tag.job_set.add(self.frontend, self.python_title)
+        self.assertEqual(len(self._search("fintech")), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.job_set.clear()
+        self.assertEqual(self._search("fintech"), [])
+
+    def test_index_follows_edits_and_deletes(self):
+        self.frontend.title = "Rust Developer"
+        self.frontend.save()
+        self.assertEqual(self._search("rust"), [self.frontend.id])
+        self.assertEqual(self._search("frontend"), [])
+
+        self.frontend.delete()
+        self.assertEqual(self._search("rust"), [])
+
+    def test_explicit_ordering_overrides_relevance(self):
+        response = self.client.get(self.url, {"search": "python", "ordering": "posted_at"})
+        ids = [job["id"] for job in response.data["results"]]
+        self.assertEqual(ids, [self.python_title.id, self.python_description.id])
+
+    def test_inverted_index_ranks_a_bounded_candidate_set(self):
+        backend = InvertedIndexSearchBackend()
+        with override_settings(JOBS_SEARCH_MAX_RESULTS=1):
+            ids = list(backend.search(Job.objects.all(), "python").values_list("id", flat=True))
+        self.assertEqual(ids, [self.python_title.id])
+
+    def test_inverted_index_reloads_after_writes_elsewhere(self):
+        backend = InvertedIndexSearchBackend()
+        self.assertFalse(backend.search(Job.objects.all(), "rust").exists())
+
+        # as written by another worker: no index call in this process
+        JobSearchDocument.objects.filter(job=self.frontend).update(weighted_a="Rust Developer")
+        bump_index_version()
+        ids = list(backend.search(Job.objects.all(), "rust").values_list("id", flat=True))
+        self.assertEqual(ids, [self.frontend.id])
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job
+from jobs.search import update_search_document
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search document for every job."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--active-only",
+            action="store_true",
+            help="Only rebuild documents for active jobs.",
+        )
+
+    def handle(self, *args, **options):
+        jobs = Job.objects.select_related("company").order_by("pk")
+        if options.get("active_only"):
+            jobs = jobs.filter(is_active=True)
+
+        count = 0
+        for job in jobs.iterator(chunk_size=500):
+            update_search_document(job)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search documents for {count} jobs."))
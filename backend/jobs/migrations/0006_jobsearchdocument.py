@@ -0,0 +1,72 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:47
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_gin_index(apps, schema_editor):
+    # tsvector/GIN only exist on Postgres; SQLite uses the in-process index
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS jobs_searchdoc_vector_gin "
+        "ON jobs_jobsearchdocument USING GIN (vector)"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS jobs_searchdoc_vector_gin")
+
+
+def backfill_search_documents(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    JobSearchDocument = apps.get_model("jobs", "JobSearchDocument")
+
+    # The weighting as of this migration (jobs.search.build_document_fields
+    # then), kept here so later changes to it do not rewrite history
+    documents = []
+    for job in Job.objects.select_related("company").prefetch_related("tags").iterator(chunk_size=500):
+        documents.append(JobSearchDocument(
+            job_id=job.pk,
+            weighted_a=" ".join([job.title or "", *(tag.name for tag in job.tags.all())]).strip(),
+            weighted_b=" ".join([job.company.company_name or "", job.location or ""]).strip(),
+            weighted_c=job.requirements or "",
+            weighted_d=job.description or "",
+        ))
+    JobSearchDocument.objects.bulk_create(documents, batch_size=500)
+
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            "UPDATE jobs_jobsearchdocument SET vector = "
+            "setweight(to_tsvector('simple', coalesce(weighted_a, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(weighted_b, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(weighted_c, '')), 'C') || "
+            "setweight(to_tsvector('simple', coalesce(weighted_d, '')), 'D')"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_savedjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSearchDocument',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='jobs.job')),
+                ('weighted_a', models.TextField(blank=True, default='')),
+                ('weighted_b', models.TextField(blank=True, default='')),
+                ('weighted_c', models.TextField(blank=True, default='')),
+                ('weighted_d', models.TextField(blank=True, default='')),
+                ('vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_gin_index, drop_gin_index),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
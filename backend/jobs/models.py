@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 
 
 # -----------------------------
@@ -47,10 +49,49 @@ class Job(models.Model):
     is_active = models.BooleanField(default=True)
     posted_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Public feed: active jobs, newest first (JobViewSet, recommendations)
+            models.Index(
+                fields=["-posted_at", "-id"],
+                condition=Q(is_active=True),
+                name="job_active_feed_idx",
+            ),
+            # Employer dashboard: own jobs, newest first
+            models.Index(
+                fields=["posted_by", "is_active", "-posted_at"],
+                name="job_poster_active_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.title} at {self.company}"
 
 
+# -----------------------------
+# Job Search Document
+# -----------------------------
+class JobSearchDocument(models.Model):
+    """
+    Denormalized full-text document for a job, split by ranking weight.
+    Kept in sync by jobs.signals; `vector` is only populated on Postgres,
+    where it is backed by a GIN index.
+    """
+
+    job = models.OneToOneField(
+        Job, on_delete=models.CASCADE, primary_key=True, related_name="search_document"
+    )
+    weighted_a = models.TextField(blank=True, default="")  # title, tags
+    weighted_b = models.TextField(blank=True, default="")  # company name, location
+    weighted_c = models.TextField(blank=True, default="")  # requirements
+    weighted_d = models.TextField(blank=True, default="")  # description
+    vector = SearchVectorField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Search document for job {self.job_id}"
+
+
 # -----------------------------
 # Job Application Model
 # -----------------------------
@@ -76,6 +117,14 @@ class JobApplication(models.Model):
 
     class Meta:
         unique_together = ("job", "applicant")  # Prevent duplicate applications
+        indexes = [
+            # Employer review: ?job=&status= ordered by -applied_at
+            models.Index(
+                fields=["job", "status", "-applied_at"], name="app_job_status_idx"
+            ),
+            # Seeker history: own applications, newest first
+            models.Index(fields=["applicant", "-applied_at"], name="app_applicant_idx"),
+        ]
 
     def __str__(self):
         return f"{self.applicant} -> {self.job}"
@@ -93,6 +142,9 @@ class SavedJob(models.Model):
 
     class Meta:
         unique_together = ("job", "user")  # Prevent duplicate saves
+        indexes = [
+            models.Index(fields=["user", "-saved_at"], name="savedjob_user_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} saved {self.job}"
@@ -0,0 +1,268 @@
+"""
+Pagination for the job feed.
+
+Two modes share one pagination class so clients can pick per request:
+
+- page numbers (default, `?page=N`), with the total count capped so large
+  boards do not pay for a full COUNT(*) on every page; pages past the cap
+  answer 404 with a message pointing to cursor mode;
+- keyset/cursor (`?pagination=cursor`, then follow `next`/`previous`),
+  which seeks on the active ordering plus `id` instead of using OFFSET.
+
+The keyset mode follows whatever ordering the filter backends left on the
+queryset (`?ordering=` from OrderingFilter, search relevance, or the
+default `-posted_at`), so it works with every exposed ordering field.
+"""
+
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, Paginator as DjangoPaginator
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+COUNT_CAP = 10000
+
+
+def capped_count(queryset, cap=COUNT_CAP):
+    """
+    Count rows up to `cap` (+1 to know the cap was hit). Runs
+    SELECT COUNT(*) FROM (SELECT id ... LIMIT cap + 1), which stops
+    scanning early instead of counting the whole filtered table.
+    """
+    return queryset.order_by().values("pk")[: cap + 1].count()
+
+
+class CappedCountPaginator(DjangoPaginator):
+    """Django paginator whose count never exceeds COUNT_CAP."""
+
+    beyond_cap_message = "only the first {cap} results are paged by number, use ?pagination=cursor to go further"
+
+    @cached_property
+    def _capped_count(self):
+        return capped_count(self.object_list, COUNT_CAP)
+
+    @cached_property
+    def count(self):
+        return min(self._capped_count, COUNT_CAP)
+
+    @cached_property
+    def count_is_capped(self):
+        return self._capped_count > COUNT_CAP
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.count_is_capped and int(number) > self.num_pages:
+                # The rows exist, num_pages just stops at the cap
+                raise EmptyPage(self.beyond_cap_message.format(cap=COUNT_CAP))
+            raise
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over the queryset's current ordering with
+    `id` appended as a tie-breaker. The cursor is an opaque token holding
+    the ordering it was issued for and the key values of the boundary row.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+
+    # -- ordering -----------------------------------------------------
+    @staticmethod
+    def get_ordering(queryset):
+        ordering = [o for o in queryset.query.order_by if isinstance(o, str)]
+        if not ordering:
+            ordering = ["-posted_at"]
+        if not any(o.lstrip("-") in ("id", "pk") for o in ordering):
+            # Same direction as the leading key keeps the default index usable
+            ordering.append("-id" if ordering[0].startswith("-") else "id")
+        return ordering
+
+    @staticmethod
+    def _reverse(ordering):
+        return [o[1:] if o.startswith("-") else f"-{o}" for o in ordering]
+
+    @staticmethod
+    def _order_expressions(ordering, nulls_first=False):
+        # NULL salaries sort last going forward, so first when seeking backwards
+        nulls = {"nulls_first": True} if nulls_first else {"nulls_last": True}
+        return [
+            F(o[1:]).desc(**nulls) if o.startswith("-") else F(o).asc(**nulls)
+            for o in ordering
+        ]
+
+    # -- cursor encoding ----------------------------------------------
+    @staticmethod
+    def _resolve_field(model, path):
+        try:
+            field = None
+            for part in path.split("__"):
+                field = model._meta.get_field(part)
+                model = field.related_model or model
+            return field
+        except FieldDoesNotExist:
+            return None  # annotation, e.g. search_rank
+
+    def _key_values(self, obj, ordering):
+        values = []
+        for o in ordering:
+            value = obj
+            for part in o.lstrip("-").split("__"):
+                value = getattr(value, part, None)
+                if value is None:
+                    break
+            if value is not None and not isinstance(value, (int, float, str, bool)):
+                value = str(value)
+            values.append(value)
+        return values
+
+    def _encode(self, ordering, values, reverse):
+        payload = json.dumps({"o": ordering, "v": values, "r": reverse}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode(self, token, ordering, model):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+            if payload["o"] != ordering or len(payload["v"]) != len(ordering):
+                raise ValueError("cursor was issued for a different ordering")
+            values = []
+            for o, raw in zip(ordering, payload["v"]):
+                field = self._resolve_field(model, o.lstrip("-"))
+                values.append(field.to_python(raw) if field and raw is not None else raw)
+            return values, bool(payload["r"])
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    # -- seek predicate -----------------------------------------------
+    def _after(self, model, ordering, values, nulls_first=False):
+        """
+        Q matching rows strictly after `values` in `ordering`:
+        (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...  honouring where NULLs sort.
+        """
+        clauses = []
+        equal = Q()
+        for o, value in zip(ordering, values):
+            name = o.lstrip("-")
+            field = self._resolve_field(model, name)
+            nullable = field is None or field.null
+            if value is None:
+                if nulls_first:
+                    # Every non-NULL value follows the NULL block
+                    clauses.append(equal & Q(**{f"{name}__isnull": False}))
+                equal &= Q(**{f"{name}__isnull": True})
+                continue
+            lookup = "lt" if o.startswith("-") else "gt"
+            following = Q(**{f"{name}__{lookup}": value})
+            if nullable and not nulls_first:
+                following |= Q(**{f"{name}__isnull": True})
+            clauses.append(equal & following)
+            equal &= Q(**{name: value})
+        return reduce(or_, clauses) if clauses else Q(pk__in=[])
+
+    # -- BasePagination -----------------------------------------------
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        token = request.query_params.get(self.cursor_query_param)
+
+        reverse = False
+        seek_ordering = self.ordering
+        if token:
+            values, reverse = self._decode(token, self.ordering, queryset.model)
+            if reverse:
+                seek_ordering = self._reverse(self.ordering)
+            queryset = queryset.filter(
+                self._after(queryset.model, seek_ordering, values, nulls_first=reverse)
+            )
+
+        expressions = self._order_expressions(seek_ordering, nulls_first=reverse)
+        rows = list(queryset.order_by(*expressions)[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.page = rows
+        self.has_next = bool(token) if reverse else has_more
+        self.has_previous = has_more if reverse else bool(token)
+        return rows
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        token = self._encode(self.ordering, self._key_values(self.page[-1], self.ordering), False)
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, token)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        token = self._encode(self.ordering, self._key_values(self.page[0], self.ordering), True)
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, token)
+
+
+class JobPagination(PageNumberPagination):
+    """
+    Page-number pagination with a capped count, switchable per request to
+    keyset pagination with `?pagination=cursor`.
+    """
+
+    django_paginator_class = CappedCountPaginator
+    invalid_page_message = "Invalid page {page_number}: {message}."
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    mode_query_param = "pagination"
+    cursor_mode = "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if request.query_params.get(self.mode_query_param) == self.cursor_mode:
+            page_size = self.get_page_size(request)
+            if not page_size:
+                return None
+            self.count_queryset = queryset
+            self.keyset = KeysetPagination(page_size)
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is None:
+            paginator = self.page.paginator
+            return Response(
+                {
+                    "count": paginator.count,
+                    "count_is_capped": paginator.count_is_capped,
+                    "next": self.get_next_link(),
+                    "previous": self.get_previous_link(),
+                    "results": data,
+                }
+            )
+
+        count = capped_count(self.count_queryset)
+        return Response(
+            {
+                "count": min(count, COUNT_CAP),
+                "count_is_capped": count > COUNT_CAP,
+                "next": self.keyset.get_next_link(),
+                "previous": self.keyset.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_capped"] = {"type": "boolean"}
+        return response_schema
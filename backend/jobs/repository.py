@@ -0,0 +1,38 @@
+from django.db.models import BooleanField, Exists, OuterRef, Value
+
+from .models import Job, JobApplication, SavedJob
+
+
+class JobRepository:
+    """
+    Repository layer for job querysets shared by the job endpoints.
+    """
+
+    @staticmethod
+    def serializer_queryset():
+        """
+        Jobs with every relation JobSerializer renders loaded up front:
+        company and its user (EmployerSerializer.user_email) in the join,
+        tags in a single prefetch query per page.
+        """
+        return Job.objects.select_related("company__user").prefetch_related("tags")
+
+    @staticmethod
+    def with_user_flags(queryset, user):
+        """
+        Annotate `has_applied_flag` and `is_saved_flag` for `user` on every
+        job in one query (EXISTS subqueries) instead of two lookups per job.
+        Employers and anonymous users always get False.
+        """
+        if not user.is_authenticated or getattr(user, "is_employer", False):
+            return queryset.annotate(
+                has_applied_flag=Value(False, output_field=BooleanField()),
+                is_saved_flag=Value(False, output_field=BooleanField()),
+            )
+
+        return queryset.annotate(
+            has_applied_flag=Exists(
+                JobApplication.objects.filter(job=OuterRef("pk"), applicant=user)
+            ),
+            is_saved_flag=Exists(SavedJob.objects.filter(job=OuterRef("pk"), user=user)),
+        )
@@ -0,0 +1,335 @@
+"""
+Full-text search for jobs.
+
+Every job owns a JobSearchDocument holding its text split into four
+ranking weights (A: title + tags, B: company + location, C: requirements,
+D: description). Two backends answer `?search=` queries against it:
+
+- PostgresSearchBackend: a tsvector column behind a GIN index, ranked
+  with ts_rank.
+- InvertedIndexSearchBackend: an in-process inverted index built from the
+  same documents, used on SQLite (tests, local development). Each process
+  keeps its own copy and reloads it when another one has written (a
+  version stamp in the cache), and at most JOBS_SEARCH_MAX_RESULTS of the
+  best matches are handed to the database to rank.
+
+Both treat every query term as a prefix and require all terms to match,
+which mirrors the substring behaviour of the SearchFilter they replace.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Case, F, FloatField, Value, When
+
+SEARCH_CONFIG = "simple"
+INDEX_VERSION_KEY = "jobs:search:index-version"
+
+# Same defaults Postgres uses for ts_rank weights {D, C, B, A}
+FIELD_WEIGHTS = {
+    "weighted_a": 1.0,
+    "weighted_b": 0.4,
+    "weighted_c": 0.2,
+    "weighted_d": 0.1,
+}
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, the unit both backends index and query on."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def build_document_fields(
+    title: str,
+    tags: Iterable[str],
+    company_name: str,
+    location: str,
+    requirements: str,
+    description: str,
+) -> Dict[str, str]:
+    """Split a job's searchable text into the weighted document fields."""
+    return {
+        "weighted_a": " ".join([title or "", *tags]).strip(),
+        "weighted_b": " ".join([company_name or "", location or ""]).strip(),
+        "weighted_c": requirements or "",
+        "weighted_d": description or "",
+    }
+
+
+def _index_version():
+    try:
+        return cache.get(INDEX_VERSION_KEY)
+    except Exception:
+        return None
+
+
+def bump_index_version():
+    """Mark every process's inverted index as stale."""
+    try:
+        cache.set(INDEX_VERSION_KEY, time.time_ns(), timeout=None)
+    except Exception:
+        pass
+
+
+class BaseSearchBackend:
+    """Interface shared by the search backends."""
+
+    def search(self, queryset, query: str):
+        """Restrict `queryset` to jobs matching `query`, best match first."""
+        raise NotImplementedError
+
+    def index_document(self, document) -> None:
+        """Called after a JobSearchDocument has been written."""
+
+    def index_documents(self, documents) -> None:
+        """Called after JobSearchDocuments have been bulk-written."""
+        for document in documents:
+            self.index_document(document)
+
+    def remove_job(self, job_id: int) -> None:
+        """Called after a job has been deleted."""
+
+    def reset(self) -> None:
+        """Drop any process-local state."""
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """tsvector + GIN index search, ranked with ts_rank."""
+
+    def search(self, queryset, query: str):
+        terms = tokenize(query)
+        if not terms:
+            return queryset
+
+        ts_query = SearchQuery(
+            " & ".join(f"{term}:*" for term in terms),
+            search_type="raw",
+            config=SEARCH_CONFIG,
+        )
+        return (
+            queryset.filter(search_document__vector=ts_query)
+            .annotate(search_rank=SearchRank(F("search_document__vector"), ts_query))
+            .order_by("-search_rank", "-posted_at")
+        )
+
+    def index_document(self, document) -> None:
+        self.index_documents([document])
+
+    def index_documents(self, documents) -> None:
+        from .models import JobSearchDocument
+
+        JobSearchDocument.objects.filter(pk__in=[document.pk for document in documents]).update(
+            vector=(
+                SearchVector("weighted_a", weight="A", config=SEARCH_CONFIG)
+                + SearchVector("weighted_b", weight="B", config=SEARCH_CONFIG)
+                + SearchVector("weighted_c", weight="C", config=SEARCH_CONFIG)
+                + SearchVector("weighted_d", weight="D", config=SEARCH_CONFIG)
+            )
+        )
+
+
+class InvertedIndexSearchBackend(BaseSearchBackend):
+    """
+    In-process inverted index over JobSearchDocument rows.
+
+    Postings map token -> {job_id: weighted term frequency}. The index is
+    loaded lazily on the first query and then kept current by the
+    signal-driven index_document/remove_job calls. Those also bump the
+    index version once committed, and a process whose index was loaded at
+    another version reloads it before its next query, so writes made by
+    other workers are seen too. Meant for tests and local development:
+    reloads read every document.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._version = None
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._doc_tokens: Dict[int, set] = {}
+        self._sorted_tokens: Optional[List[str]] = None
+
+    def reset(self) -> None:
+        """Drop the in-memory index; it is rebuilt on the next query."""
+        with self._lock:
+            self._loaded = False
+            self._postings = defaultdict(dict)
+            self._doc_tokens = {}
+            self._sorted_tokens = None
+
+    def _add(self, job_id: int, fields: Dict[str, str]) -> None:
+        self._discard(job_id)
+        weights: Dict[str, float] = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(fields.get(field, "")):
+                weights[token] += weight
+        for token, weight in weights.items():
+            self._postings[token][job_id] = weight
+        self._doc_tokens[job_id] = set(weights)
+        self._sorted_tokens = None
+
+    def _discard(self, job_id: int) -> None:
+        for token in self._doc_tokens.pop(job_id, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(job_id, None)
+            if not postings:
+                del self._postings[token]
+        self._sorted_tokens = None
+
+    def _ensure_loaded(self) -> None:
+        version = _index_version()
+        if self._loaded:
+            # Without a version stamp (cache down/cold) keep what we have
+            if version is None or version == self._version:
+                return
+            self.reset()
+        from .models import JobSearchDocument
+
+        rows = JobSearchDocument.objects.values_list("job_id", *FIELD_WEIGHTS)
+        for job_id, *texts in rows.iterator():
+            self._add(job_id, dict(zip(FIELD_WEIGHTS, texts)))
+        self._loaded = True
+        self._version = version
+
+    def _expand(self, term: str) -> List[str]:
+        """All indexed tokens starting with `term`."""
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        tokens = self._sorted_tokens
+        start = bisect.bisect_left(tokens, term)
+        end = bisect.bisect_left(tokens, term + "\uffff")
+        return tokens[start:end]
+
+    def score(self, query: str) -> Dict[int, float]:
+        """Relevance score per matching job id (all terms must match)."""
+        terms = tokenize(query)
+        if not terms:
+            return {}
+
+        with self._lock:
+            self._ensure_loaded()
+            total_docs = max(len(self._doc_tokens), 1)
+            scores: Optional[Dict[int, float]] = None
+
+            for term in terms:
+                term_scores: Dict[int, float] = defaultdict(float)
+                for token in self._expand(term):
+                    postings = self._postings[token]
+                    idf = math.log(1 + total_docs / len(postings))
+                    for job_id, weight in postings.items():
+                        term_scores[job_id] += weight * idf
+
+                if scores is None:
+                    scores = dict(term_scores)
+                else:
+                    scores = {
+                        job_id: score + term_scores[job_id]
+                        for job_id, score in scores.items()
+                        if job_id in term_scores
+                    }
+                if not scores:
+                    return {}
+
+            return scores
+
+    def search(self, queryset, query: str):
+        if not tokenize(query):
+            return queryset
+
+        scores = self.score(query)
+        if not scores:
+            return queryset.none()
+        # Bounds the CASE and IN lists below however broad the query is
+        limit = getattr(settings, "JOBS_SEARCH_MAX_RESULTS", 500)
+        if len(scores) > limit:
+            scores = dict(heapq.nlargest(limit, scores.items(), key=itemgetter(1)))
+
+        rank = Case(
+            *[When(pk=job_id, then=Value(score)) for job_id, score in scores.items()],
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+        return (
+            queryset.filter(pk__in=scores.keys())
+            .annotate(search_rank=rank)
+            .order_by("-search_rank", "-posted_at")
+        )
+
+    def index_document(self, document) -> None:
+        self.index_documents([document])
+
+    def index_documents(self, documents) -> None:
+        with self._lock:
+            if self._loaded:
+                for document in documents:
+                    self._add(
+                        document.job_id,
+                        {field: getattr(document, field) for field in FIELD_WEIGHTS},
+                    )
+        transaction.on_commit(bump_index_version)
+
+    def remove_job(self, job_id: int) -> None:
+        with self._lock:
+            self._discard(job_id)
+        transaction.on_commit(bump_index_version)
+
+
+BACKENDS = {
+    "postgres": PostgresSearchBackend,
+    "inverted_index": InvertedIndexSearchBackend,
+}
+
+_backend: Optional[BaseSearchBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_search_backend() -> BaseSearchBackend:
+    """
+    Return the process-wide search backend. JOBS_SEARCH_BACKEND selects
+    one explicitly; "auto" picks Postgres when the database supports it.
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                name = getattr(settings, "JOBS_SEARCH_BACKEND", "auto")
+                if name == "auto":
+                    name = (
+                        "postgres"
+                        if connection.vendor == "postgresql"
+                        else "inverted_index"
+                    )
+                _backend = BACKENDS[name]()
+    return _backend
+
+
+def update_search_document(job):
+    """Rebuild the search document for `job` and push it to the backend."""
+    from .models import JobSearchDocument
+
+    fields = build_document_fields(
+        title=job.title,
+        tags=job.tags.values_list("name", flat=True),
+        company_name=job.company.company_name,
+        location=job.location,
+        requirements=job.requirements,
+        description=job.description,
+    )
+    document, _ = JobSearchDocument.objects.update_or_create(job=job, defaults=fields)
+    get_search_backend().index_document(document)
+    return document
@@ -54,26 +54,31 @@ class JobSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["posted_by", "posted_at", "has_applied", "is_saved"]
 
-    def get_has_applied(self, obj):
+    def _is_seeker(self):
         request = self.context.get("request")
-        if (
+        return bool(
             request
             and request.user.is_authenticated
             and not getattr(request.user, "is_employer", False)
-        ):
+        )
+
+    def get_has_applied(self, obj):
+        # Precomputed for the whole page by JobRepository.with_user_flags
+        if hasattr(obj, "has_applied_flag"):
+            return obj.has_applied_flag
+        if self._is_seeker():
             return JobApplication.objects.filter(
-                job=obj, applicant=request.user
+                job=obj, applicant=self.context["request"].user
             ).exists()
         return False
 
     def get_is_saved(self, obj):
-        request = self.context.get("request")
-        if (
-            request
-            and request.user.is_authenticated
-            and not getattr(request.user, "is_employer", False)
-        ):
-            return SavedJob.objects.filter(job=obj, user=request.user).exists()
+        if hasattr(obj, "is_saved_flag"):
+            return obj.is_saved_flag
+        if self._is_seeker():
+            return SavedJob.objects.filter(
+                job=obj, user=self.context["request"].user
+            ).exists()
         return False
 
 
@@ -0,0 +1,129 @@
+"""
+Signal handlers that keep derived job data (the search document and the
+anonymous response cache) in step with Job, JobTag and Employer writes.
+Cache versions move only once the write commits, so a concurrent request
+cannot cache the old rows under the new version.
+"""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from employers.models import Employer
+from .cache import invalidate_job_lists, invalidate_jobs
+from .models import Job, JobTag
+from .search import get_search_backend, update_search_document
+
+
+@receiver(post_save, sender=Job)
+def index_job_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    update_search_document(instance)
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job_on_delete(sender, instance, **kwargs):
+    get_search_backend().remove_job(instance.pk)
+
+
+@receiver(m2m_changed, sender=Job.tags.through)
+def index_job_on_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        update_search_document(instance)
+        return
+    # A tag was attached to / detached from jobs from the tag's side
+    # (a clear from that side is handled by refresh_jobs_on_tag_clear)
+    jobs = Job.objects.filter(pk__in=pk_set) if pk_set else Job.objects.none()
+    for job in jobs.select_related("company"):
+        update_search_document(job)
+
+
+@receiver(m2m_changed, sender=Job.tags.through)
+def refresh_jobs_on_tag_clear(sender, instance, action, reverse, **kwargs):
+    """
+    tag.job_set.clear(): post_clear carries no pk_set and the through rows
+    are gone by then, so the jobs are collected at pre_clear.
+    """
+    if not reverse:
+        return
+    if action == "pre_clear":
+        instance._cleared_job_ids = list(instance.job_set.values_list("pk", flat=True))
+    elif action == "post_clear":
+        job_ids = instance.__dict__.pop("_cleared_job_ids", [])
+        if job_ids:
+            transaction.on_commit(lambda: _refresh_jobs(job_ids))
+
+
+def _refresh_jobs(job_ids):
+    for job in Job.objects.filter(pk__in=job_ids).select_related("company"):
+        update_search_document(job)
+    invalidate_jobs(job_ids)
+
+
+@receiver(post_save, sender=JobTag)
+def index_jobs_on_tag_rename(sender, instance, created, raw=False, **kwargs):
+    if raw or created:
+        return
+    for job in instance.job_set.select_related("company"):
+        update_search_document(job)
+
+
+@receiver(post_save, sender=Employer)
+def index_jobs_on_employer_change(sender, instance, created, raw=False, **kwargs):
+    if raw or created:
+        return
+    for job in instance.jobs.select_related("company"):
+        update_search_document(job)
+
+
+# -----------------------------
+# Response cache invalidation
+# -----------------------------
+def _invalidate_jobs_on_commit(job_ids):
+    job_ids = list(job_ids)  # read now: the rows may be gone by commit
+    transaction.on_commit(lambda: invalidate_jobs(job_ids))
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_cache(sender, instance, **kwargs):
+    _invalidate_jobs_on_commit([instance.pk])
+
+
+@receiver(m2m_changed, sender=Job.tags.through)
+def invalidate_job_cache_on_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        _invalidate_jobs_on_commit([instance.pk])
+    elif pk_set:
+        _invalidate_jobs_on_commit(pk_set)
+
+
+@receiver(post_save, sender=JobTag)
+def invalidate_tag_jobs_cache(sender, instance, created, **kwargs):
+    if created:
+        return  # a new tag is not attached to any job yet
+    _invalidate_jobs_on_commit(instance.job_set.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=JobTag)
+def invalidate_tag_jobs_cache_on_delete(sender, instance, **kwargs):
+    # The through rows are gone by post_delete, so collect jobs now
+    _invalidate_jobs_on_commit(instance.job_set.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Employer)
+def invalidate_employer_jobs_cache(sender, instance, created, **kwargs):
+    if created:
+        return
+    _invalidate_jobs_on_commit(instance.jobs.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Employer)
+def invalidate_employer_jobs_cache_on_delete(sender, instance, **kwargs):
+    # Cascaded Job deletes bump their own entries; lists may still embed the employer
+    transaction.on_commit(invalidate_job_lists)
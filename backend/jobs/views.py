@@ -1,51 +1,53 @@
 from rest_framework import viewsets, filters, generics
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser, IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.pagination import (
-    PageNumberPagination,
-)  # Import PageNumberPagination
-from .models import Job, JobApplication, SavedJob
+from .models import JobApplication, SavedJob
 from .serializers import JobSerializer, JobApplicationSerializer, SavedJobSerializer
 from .permissions import IsEmployer, IsEmployerOrApplicant
-from .filters import JobFilter
+from .repository import JobRepository
+from .cache import JobResponseCacheMixin, get_cache_stats
+from .filters import JobFilter, JobSearchFilter
+from .pagination import JobPagination
 
 
 # -----------------------------
 # Job ViewSet
 # -----------------------------
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(JobResponseCacheMixin, viewsets.ModelViewSet):
     queryset = (
-        Job.objects.filter(is_active=True)
-        .select_related("company")
+        JobRepository.serializer_queryset()
+        .filter(is_active=True)
         .order_by("-posted_at")
-    )  # Select related company
+    )  # company, company.user and tags loaded up front
     serializer_class = JobSerializer
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        JobSearchFilter,  # ranked full-text search, see jobs/search.py
         filters.OrderingFilter,
     ]
     filterset_class = JobFilter
-    search_fields = [
-        "title",
-        "description",
-        "requirements",
-        "company__company_name",
-        "location",
-    ]  # Update search fields
     ordering_fields = [
         "posted_at",
         "min_salary",
         "max_salary",
         "company__company_name",
     ]  # Update ordering fields
-    pagination_class = PageNumberPagination  # built-in DRF pagination
+    pagination_class = JobPagination  # page numbers, or keyset with ?pagination=cursor
 
     def get_permissions(self):
         if self.action in ["create", "update", "partial_update", "destroy"]:
             return [IsEmployer()]
+        if self.action == "cache_stats":
+            return [IsAdminUser()]
         return [IsAuthenticatedOrReadOnly()]
 
+    @action(detail=False, methods=["get"], url_path="cache-stats")
+    def cache_stats(self, request):
+        """Hit/miss counters of the anonymous job response cache."""
+        return Response(get_cache_stats())
+
     def perform_create(self, serializer):
         # Ensure the posted_by user is an employer
         if not self.request.user.is_employer:
@@ -62,7 +64,7 @@ class JobViewSet(viewsets.ModelViewSet):
             qs = qs.filter(posted_by=self.request.user)
 
         # Filtering is now handled by DjangoFilterBackend and JobFilter
-        return qs
+        return JobRepository.with_user_flags(qs, self.request.user)
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -163,11 +165,14 @@ class SavedJobViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-class JobDetailView(generics.RetrieveAPIView):
-    queryset = Job.objects.all()
+class JobDetailView(JobResponseCacheMixin, generics.RetrieveAPIView):
+    queryset = JobRepository.serializer_queryset()
     serializer_class = JobSerializer
     lookup_field = "id"
 
+    def get_queryset(self):
+        return JobRepository.with_user_flags(super().get_queryset(), self.request.user)
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context["request"] = self.request
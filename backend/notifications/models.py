@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -32,6 +33,16 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Inbox: a user's notifications, newest first
+            models.Index(fields=["user", "-created_at"], name="notif_user_created_idx"),
+            # Unread badge / mark_all_read touch only unread rows
+            models.Index(
+                fields=["user", "-created_at"],
+                condition=Q(is_read=False),
+                name="notif_user_unread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.title}"
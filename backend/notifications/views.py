@@ -25,5 +25,6 @@ class NotificationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["post"])
     def mark_all_read(self, request):
-        self.get_queryset().update(is_read=True)
+        # Only rewrite unread rows (served by the partial unread index)
+        self.get_queryset().filter(is_read=False).update(is_read=True)
         return Response({"message": "All notifications marked as read"})
@@ -0,0 +1,80 @@
+"""
+Plain-text extraction from uploaded resumes.
+
+Files are read from storage as streams: PDFs page by page through pypdf,
+DOCX by iterating over word/document.xml inside the zip, so a large upload
+is never decoded into one blob. Output is capped at MAX_TEXT_CHARS.
+"""
+
+import zipfile
+
+from lxml import etree
+
+MAX_TEXT_CHARS = 200_000
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class ResumeExtractionError(Exception):
+    pass
+
+
+def _extract_pdf(fh):
+    try:
+        from pypdf import PdfReader
+    except ImportError:  # pragma: no cover - pypdf is in requirements.txt
+        raise ResumeExtractionError("PDF support requires the pypdf package")
+
+    try:
+        reader = PdfReader(fh)
+        for page in reader.pages:
+            yield page.extract_text() or ""
+    except Exception as exc:
+        # Malformed files also surface as KeyError, ValueError, ... from pypdf
+        raise ResumeExtractionError(f"Unreadable PDF: {exc}")
+
+
+def _extract_docx(fh):
+    try:
+        with zipfile.ZipFile(fh) as archive, archive.open("word/document.xml") as document:
+            paragraph = []
+            for event, element in etree.iterparse(document, events=("end",)):
+                if element.tag == f"{_W}t" and element.text:
+                    paragraph.append(element.text)
+                elif element.tag == f"{_W}tab":
+                    paragraph.append("\t")
+                elif element.tag == f"{_W}p":
+                    yield "".join(paragraph)
+                    paragraph = []
+                    element.clear()
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as exc:
+        raise ResumeExtractionError(f"Unreadable DOCX: {exc}")
+
+
+def _extract_text_file(fh):
+    for chunk in fh.chunks():
+        yield chunk.decode("utf-8", errors="ignore")
+
+
+EXTRACTORS = {
+    "pdf": _extract_pdf,
+    "docx": _extract_docx,
+    "txt": _extract_text_file,
+}
+
+
+def extract_text(field_file) -> str:
+    """Text of a stored resume file (a FieldFile), joined line by line."""
+    extension = field_file.name.rsplit(".", 1)[-1].lower() if "." in field_file.name else ""
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise ResumeExtractionError(f"Unsupported resume format: .{extension or '?'}")
+
+    parts, size = [], 0
+    with field_file.open("rb") as fh:
+        for part in extractor(fh):
+            parts.append(part)
+            size += len(part) + 1
+            if size >= MAX_TEXT_CHARS:
+                break
+    return "\n".join(parts)[:MAX_TEXT_CHARS].strip()
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from resumes.models import Resume
+from resumes.services import ResumeService
+
+
+class Command(BaseCommand):
+    help = (
+        "Extract and parse resumes that have not been processed yet "
+        "(e.g. uploaded before the extraction pipeline existed)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Reprocess every resume, including parsed ones.")
+        parser.add_argument("--failed", action="store_true", help="Also retry resumes whose extraction failed.")
+
+    def handle(self, *args, **options):
+        resumes = Resume.objects.all()
+        if not options["all"]:
+            statuses = [Resume.PARSE_PENDING]
+            if options["failed"]:
+                statuses.append(Resume.PARSE_FAILED)
+            resumes = resumes.filter(parse_status__in=statuses)
+
+        results = {}
+        for resume_id in resumes.values_list("pk", flat=True).iterator():
+            resume = ResumeService.process_resume(resume_id)
+            if resume is not None:
+                results[resume.parse_status] = results.get(resume.parse_status, 0) + 1
+
+        summary = ", ".join(f"{count} {state}" for state, count in sorted(results.items())) or "nothing to do"
+        self.stdout.write(self.style.SUCCESS(f"Processed resumes: {summary}."))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0002_resume_title'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='parse_error',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='parse_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='parsed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='text',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
@@ -3,6 +3,15 @@ from django.conf import settings
 
 
 class Resume(models.Model):
+    PARSE_PENDING = "pending"
+    PARSE_DONE = "done"
+    PARSE_FAILED = "failed"
+    PARSE_STATUS_CHOICES = [
+        (PARSE_PENDING, "Pending"),
+        (PARSE_DONE, "Done"),
+        (PARSE_FAILED, "Failed"),
+    ]
+
     applicant = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="resumes"
     )
@@ -10,4 +19,9 @@ class Resume(models.Model):
     title = models.CharField(max_length=200, default="Untitled Resume")
     file = models.FileField(upload_to="resumes/")  # PDFs or DOCX
     uploaded_at = models.DateTimeField(auto_now_add=True)
-    parsed_data = models.JSONField(null=True, blank=True)  # stub for future AI parsing
+    # Filled by the extraction pipeline after upload (see resumes.services)
+    text = models.TextField(blank=True, default="")
+    parsed_data = models.JSONField(null=True, blank=True)
+    parse_status = models.CharField(max_length=10, choices=PARSE_STATUS_CHOICES, default=PARSE_PENDING)
+    parse_error = models.CharField(max_length=255, blank=True, default="")
+    parsed_at = models.DateTimeField(null=True, blank=True)
@@ -1,3 +1,9 @@
+import shutil
+import tempfile
+import zipfile
+from unittest.mock import patch
+
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
@@ -6,8 +12,52 @@ from resumes.models import Resume
 from io import BytesIO
 from django.core.files.uploadedfile import SimpleUploadedFile
 
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_docx(*paragraphs):
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>",
+        )
+    return buffer.getvalue()
+
+
+def make_pdf(text):
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+    ]
+    out = BytesIO(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
 class ResumeTests(APITestCase):
 
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
     def setUp(self):
         self.user = User.objects.create_user(
             email="applicant@example.com",
@@ -18,6 +68,14 @@ class ResumeTests(APITestCase):
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
+    def upload(self, name, content, content_type):
+        url = reverse("resumes:resume-list")
+        file = SimpleUploadedFile(name, content, content_type=content_type)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, {"file": file}, format="multipart")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Resume.objects.get(id=response.data["id"])
+
     def test_upload_resume(self):
         url = reverse("resumes:resume-list")
         file = SimpleUploadedFile("resume.pdf", b"file_content", content_type="application/pdf")
@@ -25,3 +83,53 @@ class ResumeTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Resume.objects.count(), 1)
         self.assertEqual(Resume.objects.first().applicant, self.user)
+
+    def test_docx_upload_is_extracted_and_parsed(self):
+        resume = self.upload(
+            "resume.docx",
+            make_docx("Jane Doe - jane@example.com", "5 years of Python and Django"),
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        )
+        self.assertEqual(resume.parse_status, Resume.PARSE_DONE)
+        self.assertEqual(resume.text, "Jane Doe - jane@example.com\n5 years of Python and Django")
+        self.assertEqual(resume.parsed_data["email"], "jane@example.com")
+        self.assertEqual(resume.parsed_data["experience_years"], 5)
+        self.assertIn("django", resume.parsed_data["all_skills"])
+
+    def test_pdf_upload_is_extracted(self):
+        resume = self.upload("resume.pdf", make_pdf("Kubernetes and Terraform"), "application/pdf")
+        self.assertEqual(resume.parse_status, Resume.PARSE_DONE)
+        self.assertIn("Kubernetes and Terraform", resume.text)
+
+    def test_unreadable_file_is_marked_failed(self):
+        resume = self.upload("resume.pdf", b"file_content", "application/pdf")
+        self.assertEqual(resume.parse_status, Resume.PARSE_FAILED)
+        self.assertTrue(resume.parse_error)
+
+        response = self.client.get(reverse("resumes:resume-detail", args=[resume.id]))
+        self.assertEqual(response.data["parse_status"], Resume.PARSE_FAILED)
+
+    def test_extractor_errors_mark_the_resume_failed(self):
+        with patch("pypdf.PdfReader", side_effect=KeyError("/Root")):
+            resume = self.upload("resume.pdf", make_pdf("Python"), "application/pdf")
+        self.assertEqual(resume.parse_status, Resume.PARSE_FAILED)
+        self.assertIn("Unreadable PDF", resume.parse_error)
+
+    def test_replacing_the_file_reparses(self):
+        resume = self.upload("resume.docx", make_docx("Python"), "application/octet-stream")
+        self.assertIn("python", resume.parsed_data["all_skills"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("resumes:resume-detail", args=[resume.id]),
+                {"file": SimpleUploadedFile("cv.docx", make_docx("Rust"))},
+                format="multipart",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        resume.refresh_from_db()
+        self.assertEqual(resume.parsed_data["all_skills"], ["rust"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(reverse("resumes:resume-detail", args=[resume.id]), {"title": "CV"})
+        resume.refresh_from_db()
+        self.assertEqual(resume.parse_status, Resume.PARSE_DONE)
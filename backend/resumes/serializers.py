@@ -5,5 +5,5 @@ from .models import Resume
 class ResumeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Resume
-        fields = ["id", "title", "file", "uploaded_at", "parsed_data"]
-        read_only_fields = ["uploaded_at", "parsed_data"]
+        fields = ["id", "title", "file", "uploaded_at", "parsed_data", "parse_status", "parse_error"]
+        read_only_fields = ["uploaded_at", "parsed_data", "parse_status", "parse_error"]
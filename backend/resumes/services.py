@@ -1,3 +1,7 @@
+PROCESSING_QUEUED_KEY = "resumes:processing-queued:{}"
+PROCESSING_QUEUED_TIMEOUT = 300
+
+
 class ResumeService:
     ALLOWED_EXTENSIONS = ["pdf", "docx"]
 
@@ -14,4 +18,64 @@ class ResumeService:
         #Create resume linked to authenticated user
         from .models import Resume
         resume = Resume.objects.create(applicant=request.user, file=file)
-        return resume
\ No newline at end of file
+        return resume
+
+    @staticmethod
+    def process_resume(resume_id):
+        """
+        Extract the text of a resume's file, parse it and store both on the
+        resume, so readers never have to open the file again.
+        """
+        from django.utils import timezone
+        from ai.services import ResumeParser
+        from .extraction import extract_text
+        from .models import Resume
+
+        resume = Resume.objects.filter(pk=resume_id).first()
+        if resume is None:
+            return None
+
+        try:
+            text = extract_text(resume.file)
+        except Exception as exc:  # ResumeExtractionError, OSError or an extractor bug
+            resume.parse_status = Resume.PARSE_FAILED
+            resume.parse_error = str(exc)[:255]
+            resume.save(update_fields=["parse_status", "parse_error"])
+            return resume
+
+        resume.text = text
+        resume.parsed_data = ResumeParser.parse_resume(text)
+        resume.parse_status = Resume.PARSE_DONE
+        resume.parse_error = ""
+        resume.parsed_at = timezone.now()
+        resume.save(update_fields=["text", "parsed_data", "parse_status", "parse_error", "parsed_at"])
+        return resume
+
+    @staticmethod
+    def schedule_processing(resume_id):
+        """Run extraction on a Celery worker, or inline when Celery is off."""
+        from django.conf import settings
+        from django.core.cache import cache
+        from .tasks import extract_resume_text_task
+
+        if settings.CELERY_ENABLED:
+            # Once while the task is outstanding, however often it is asked for
+            if cache.add(PROCESSING_QUEUED_KEY.format(resume_id), True, timeout=PROCESSING_QUEUED_TIMEOUT):
+                extract_resume_text_task.delay(resume_id)
+        else:
+            ResumeService.process_resume(resume_id)
+
+    @staticmethod
+    def ensure_processed(resume):
+        """
+        Schedule a resume that is still pending, such as one uploaded before
+        text extraction existed that nothing ever queued. Returns the resume,
+        reloaded in case it was processed inline.
+        """
+        from .models import Resume
+
+        if resume.parse_status != Resume.PARSE_PENDING:
+            return resume
+        ResumeService.schedule_processing(resume.pk)
+        resume.refresh_from_db()
+        return resume
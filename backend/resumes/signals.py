@@ -0,0 +1,32 @@
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Resume
+from .services import ResumeService
+
+
+@receiver(pre_save, sender=Resume)
+def reset_parsed_data_on_new_file(sender, instance, raw=False, update_fields=None, **kwargs):
+    """A new or replaced file invalidates the extracted text."""
+    if raw or (update_fields is not None and "file" not in update_fields):
+        return
+    if instance.pk:
+        stored = Resume.objects.filter(pk=instance.pk).values_list("file", flat=True).first()
+        if stored == instance.file.name:
+            return
+
+    instance.text = ""
+    instance.parsed_data = None
+    instance.parse_status = Resume.PARSE_PENDING
+    instance.parse_error = ""
+    instance.parsed_at = None
+    instance._needs_processing = True
+
+
+@receiver(post_save, sender=Resume)
+def schedule_resume_processing(sender, instance, **kwargs):
+    if getattr(instance, "_needs_processing", False):
+        instance._needs_processing = False
+        resume_id = instance.pk
+        transaction.on_commit(lambda: ResumeService.schedule_processing(resume_id))
@@ -1,5 +1,12 @@
 from celery import shared_task
 
+from .services import ResumeService
+
+
 @shared_task
-def sample_task():
-    print("This is a stub task. Replace with real logic later.")
+def extract_resume_text_task(resume_id):
+    """
+    Extracts and parses an uploaded resume, storing the results on it.
+    """
+    resume = ResumeService.process_resume(resume_id)
+    return resume.parse_status if resume else None
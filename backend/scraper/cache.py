@@ -0,0 +1,51 @@
+"""
+Conditional GET for the scraped job list.
+
+A version in the cache moves whenever ScrapedJob rows change: after every
+chunk ScrapedJobRepository or JobPromoter commits (bulk writes send no
+signals) and on any other save or delete (scraper.signals). A list response's
+ETag is a digest of that version and the request (host, because
+pagination links are absolute, and normalized query params), so a client
+revalidating with If-None-Match gets a 304 without the list being
+queried or serialized. If the cache is unavailable, responses simply
+carry no ETag.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Optional
+
+from django.core.cache import cache
+
+from jobs.cache import normalized_params
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "scraper:jobs:version"
+
+
+def invalidate_scraped_jobs():
+    try:
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            cache.set(VERSION_KEY, int(time.time() * 1000), timeout=None)
+    except Exception:
+        logger.warning("Could not invalidate scraped job ETags", exc_info=True)
+
+
+def list_etag(request) -> Optional[str]:
+    try:
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            # Millisecond timestamps never repeat a version that was evicted
+            cache.add(VERSION_KEY, int(time.time() * 1000), timeout=None)
+            version = cache.get(VERSION_KEY)
+    except Exception:
+        logger.warning("Scraped job ETag version unavailable", exc_info=True)
+        return None
+    if version is None:
+        return None
+    digest = hashlib.sha1(f"{version}:{request.get_host()}?{normalized_params(request)}".encode()).hexdigest()
+    return f'"{digest}"'
@@ -7,12 +7,117 @@ DEFAULT_SEARCH = {
     "location": "Lagos"
 }
 
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# ScraperService runs enabled sites concurrently on a bounded thread pool.
+# A site gets up to MAX_ATTEMPTS tries (exponential backoff between them)
+# within its "timeout" seconds (DEFAULT_SITE_TIMEOUT when unset).
+MAX_WORKERS = 4
+MAX_ATTEMPTS = 3
+DEFAULT_SITE_TIMEOUT = 120
+
+# Retries wait a random time of up to RETRY_BACKOFF_BASE * 2 ** attempt
+# seconds (at most RETRY_BACKOFF_MAX). A site whose attempts fail
+# BREAKER_FAILURES times in a row is skipped for BREAKER_COOLDOWN seconds,
+# then probed by a single run (scraper.throttle.CircuitBreaker).
+RETRY_BACKOFF_BASE = 2
+RETRY_BACKOFF_MAX = 60
+BREAKER_FAILURES = 5
+BREAKER_COOLDOWN = 900
+
+# Requests to one domain share a token bucket across all workers
+# (scraper.throttle): RATE_LIMIT_PER_SECOND on average (or the domain's
+# entry in RATE_LIMIT_DOMAINS) with bursts of RATE_LIMIT_BURST. A 429/503
+# halves the domain's rate, down to RATE_LIMIT_MIN_PER_SECOND, and pauses
+# it for its Retry-After (capped at RATE_LIMIT_MAX_PAUSE seconds); each
+# successful response wins back RATE_LIMIT_RECOVERY of the full rate.
+RATE_LIMIT_PER_SECOND = 2.0
+RATE_LIMIT_BURST = 4
+RATE_LIMIT_MIN_PER_SECOND = 0.1
+RATE_LIMIT_RECOVERY = 0.05
+RATE_LIMIT_MAX_PAUSE = 300
+RATE_LIMIT_DOMAINS = {
+    "www.linkedin.com": 0.5,
+    "www.glassdoor.com": 0.5,
+}
+
+# Scraped jobs stream from the site threads to the database writer through
+# a queue of at most PIPELINE_BUFFER records and are written
+# PIPELINE_CHUNK_SIZE at a time (scraper.pipeline).
+PIPELINE_BUFFER = 1000
+PIPELINE_CHUNK_SIZE = 500
+
+# Static-HTML sites are fetched with scraper.fetcher.AsyncFetcher: up to
+# FETCH_CONCURRENCY open connections, FETCH_PER_HOST per host, and
+# FETCH_TIMEOUT seconds per page. Paginated sites fetch "max_pages" pages
+# at once, page n being first_page + n * page_step.
+FETCH_CONCURRENCY = 20
+FETCH_PER_HOST = 4
+FETCH_TIMEOUT = 15
+
+# Result pages are parsed with scraper.parsers.markup: "lxml" (fast) or
+# "bs4" (BeautifulSoup, more forgiving), per site with "html_parser" in
+# JOB_SITES, else HTML_PARSER.
+HTML_PARSER = "lxml"
+
+# Browser-based sites lease Chrome instances from scraper.driver_pool: at
+# most DRIVER_POOL_SIZE per worker process, each quit after DRIVER_MAX_PAGES
+# page loads. A scraper waits up to DRIVER_ACQUIRE_TIMEOUT seconds for one.
+DRIVER_POOL_SIZE = 2
+DRIVER_MAX_PAGES = 50
+DRIVER_ACQUIRE_TIMEOUT = 60
+
+# How a browser-based site loads its result pages ("render" in JOB_SITES,
+# scraper.parsers.base_scraper.BrowserScraper): "browser" (Chrome, the
+# default), "http" (plain HTTP only) or "auto" (plain HTTP, and Chrome only
+# when the HTML has no job cards without JavaScript). The strategy used and
+# its cost are recorded per site on each ScrapeRun.
+
+# Near-duplicate detection at ingest (scraper.dedup): MinHash signatures of
+# DEDUP_NUM_PERM values in DEDUP_BANDS LSH bands; candidates whose estimated
+# similarity reaches DEDUP_THRESHOLD are treated as the same posting.
+DEDUP_NUM_PERM = 64
+DEDUP_BANDS = 16
+DEDUP_THRESHOLD = 0.7
+
+# Incremental runs (scraper.incremental) stop paginating a site at the first
+# results page that is unchanged since the last run (304 or same checksum)
+# or whose listings are at least INCREMENTAL_STOP_RATIO already seen. Per
+# source, the newest INCREMENTAL_SEEN_LIMIT listing URLs and
+# INCREMENTAL_PAGE_LIMIT page validators are kept.
+INCREMENTAL_STOP_RATIO = 0.5
+INCREMENTAL_SEEN_LIMIT = 5000
+INCREMENTAL_PAGE_LIMIT = 200
+
+# After each scrape run, new ScrapedJob rows are promoted into the job board
+# (scraper.promotion), PROMOTION_CHUNK_SIZE per transaction. Each Job is
+# tagged with up to PROMOTION_MAX_TAGS skills found in its title and text.
+PROMOTE_SCRAPED_JOBS = True
+PROMOTION_CHUNK_SIZE = 200
+PROMOTION_MAX_TAGS = 8
+
+# A ScrapeRun still queued or running SCRAPE_RUN_TIMEOUT seconds after it
+# was requested has lost its worker (with Celery off, a thread of a process
+# that has since restarted) and is marked failed when its status is read.
+SCRAPE_RUN_TIMEOUT = 3600
+
 JOB_SITES = {
     "jobberman": {
         "base_url": "https://www.jobberman.com/jobs",
         "query_param": "q",
         "location_param": "l",
         "pagination_param": "page",
+        "first_page": 1,
+        "max_pages": 3,
+        "parser": "scraper.parsers.jobberman_scraper.JobbermanScraper",
+        "render": "auto",
+        "timeout": 90,
         "enabled": True
     },
     "linkedin": {
@@ -20,6 +125,10 @@ JOB_SITES = {
         "query_param": "keywords",
         "location_param": "location",
         "pagination_param": "start",
+        "page_step": 25,
+        "parser": "scraper.parsers.linkedin_scraper.LinkedInScraper",
+        "render": "auto",
+        "timeout": 120,
         "enabled": False
     },
     "indeed": {
@@ -27,6 +136,11 @@ JOB_SITES = {
         "query_param": "q",
         "location_param": "l",
         "pagination_param": "start",
+        "first_page": 0,
+        "page_step": 10,
+        "max_pages": 5,
+        "parser": "scraper.parsers.indeed_scraper.IndeedScraper",
+        "timeout": 30,
         "enabled": False
     },
     "glassdoor": {
@@ -36,8 +150,12 @@ JOB_SITES = {
             "title": ".jobLink",
             "company": ".jobEmployerName",
             "location": ".subtle.loc",
-            "url": ".jobLink"
+            "url": ".jobLink",
+            "description": ".jobDesc"
         },
+        "parser": "scraper.parsers.glassdoor_scraper.GlassdoorScraper",
+        "render": "browser",
+        "timeout": 120,
         "enabled": False
     }
 }
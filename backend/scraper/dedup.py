@@ -0,0 +1,175 @@
+"""
+Duplicate detection for scraped postings.
+
+Exact duplicates share a fingerprint: a hash of the canonicalized title,
+company and location plus a hash of the description's word shingles, so
+"Sr. Python Dev" at "NextGen Ltd" and "Senior Python Developer" at
+"NextGen" fingerprint the same. ScrapedJob.fingerprint has a unique index.
+
+Near duplicates (the same job reposted by another site with a reworded
+title or description) are found with MinHash + LSH: each posting gets a
+DEDUP_NUM_PERM-value MinHash signature over its title terms, location
+terms and description shingles, split into DEDUP_BANDS bands. Each band, salted with
+the canonical company, is hashed to a bucket key; postings sharing any
+bucket are candidates, and a candidate whose signatures agree on at least
+DEDUP_THRESHOLD of the positions (the estimated Jaccard similarity) is a
+duplicate. Buckets are stored in ScrapedJobBucket so lookups at ingest
+time are an indexed IN query rather than pairwise comparisons. Postings
+without a description (several sources list none) are only ever exact
+duplicates: title and location alone cannot tell a repost from the same
+role opened again elsewhere.
+"""
+
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit, urlunsplit
+
+import numpy as np
+
+from scraper.config import DEDUP_BANDS, DEDUP_NUM_PERM, DEDUP_THRESHOLD
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+TITLE_SYNONYMS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior",
+    "dev": "developer", "devs": "developers", "eng": "engineer", "engr": "engineer",
+    "mgr": "manager", "mgmt": "management", "admin": "administrator",
+    "asst": "assistant", "assoc": "associate", "exec": "executive",
+    "sw": "software", "ops": "operations", "qa": "quality assurance",
+}
+
+COMPANY_SUFFIXES = {
+    "ltd", "limited", "inc", "incorporated", "llc", "plc", "corp",
+    "corporation", "co", "company", "gmbh",
+}
+
+# Modulus of the MinHash permutations: a Mersenne prime small enough that
+# a * x + b never overflows uint64 for 31-bit inputs
+_PRIME = np.uint64((1 << 31) - 1)
+
+
+def canonical_url(url) -> Optional[str]:
+    """Canonical form of a job URL (lower-cased scheme and host, no fragment), or None if unusable."""
+    url = str(url or "").strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return None
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+def tokens(text) -> List[str]:
+    return _TOKEN.findall(str(text or "").lower())
+
+
+def canonical_title(title) -> str:
+    return " ".join(TITLE_SYNONYMS.get(token, token) for token in tokens(title))
+
+
+def canonical_company(company) -> str:
+    words = tokens(company)
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def canonical_location(location) -> str:
+    return " ".join(tokens(location))
+
+
+def shingles(words: List[str], size: int = 3) -> Set[str]:
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def description_digest(description) -> str:
+    """Order-independent hash of the description's word 3-shingles ('' if empty)."""
+    description_shingles = shingles(tokens(description))
+    if not description_shingles:
+        return ""
+    return hashlib.sha1("\n".join(sorted(description_shingles)).encode()).hexdigest()[:16]
+
+
+def fingerprint(record: Dict) -> str:
+    """Exact-duplicate key of a normalized ScrapedJob record."""
+    parts = (
+        canonical_title(record.get("title")),
+        canonical_company(record.get("company_name")),
+        canonical_location(record.get("location")),
+        description_digest(record.get("description")),
+    )
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def features(record: Dict) -> Set[str]:
+    """The set MinHash is taken over: title terms and bigrams, location terms, description shingles."""
+    title = canonical_title(record.get("title")).split()
+    result = {f"t:{token}" for token in title}
+    result.update(f"t:{bigram}" for bigram in shingles(title, 2) if " " in bigram)
+    result.update(f"l:{token}" for token in tokens(record.get("location")))
+    result.update(f"d:{shingle}" for shingle in shingles(tokens(record.get("description"))))
+    return result
+
+
+def _hash31(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little") % int(_PRIME)
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = None, bands: int = None, seed: int = 1):
+        self.num_perm = num_perm or DEDUP_NUM_PERM
+        self.bands = bands or DEDUP_BANDS
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.rows = self.num_perm // self.bands
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_PRIME), self.num_perm).astype(np.uint64)
+        self._b = rng.randint(0, int(_PRIME), self.num_perm).astype(np.uint64)
+
+    def signature(self, feature_set: Iterable[str]) -> List[int]:
+        values = np.fromiter((_hash31(feature) for feature in feature_set), dtype=np.uint64)
+        if not values.size:
+            return [int(_PRIME)] * self.num_perm
+        hashed = (values[:, None] * self._a + self._b) % _PRIME
+        return hashed.min(axis=0).tolist()
+
+    def bucket_keys(self, signature: List[int], company: str = "") -> List[str]:
+        """One key per band; only postings of the same canonical company can share one."""
+        keys = []
+        for band in range(self.bands):
+            values = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.md5(f"{company}|{values}".encode()).hexdigest()[:16]
+            keys.append(f"{band}:{digest}")
+        return keys
+
+    @staticmethod
+    def similarity(first: List[int], second: List[int]) -> float:
+        if not first or len(first) != len(second):
+            return 0.0
+        return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+class LSHIndex:
+    """In-memory bucket index over (ident, signature) pairs."""
+
+    def __init__(self, threshold: float = None):
+        self.threshold = DEDUP_THRESHOLD if threshold is None else threshold
+        self._buckets: Dict[str, List] = {}
+
+    def match(self, keys: List[str], signature: List[int], exclude: str = None) -> Optional[str]:
+        """Ident of the first indexed posting similar enough to `signature`."""
+        for key in keys:
+            for ident, candidate in self._buckets.get(key, ()):
+                if ident == exclude:
+                    continue
+                if MinHasher.similarity(signature, candidate) >= self.threshold:
+                    return ident
+        return None
+
+    def add(self, keys: List[str], ident: str, signature: List[int]):
+        for key in keys:
+            self._buckets.setdefault(key, []).append((ident, signature))
@@ -0,0 +1,168 @@
+"""
+DriverPool - headless Chrome instances shared by the browser-based
+scrapers of one worker process.
+
+Starting Chrome is the most expensive step of a scrape, so drivers are
+kept warm and handed out again (most recently used first). A driver is
+checked with a trivial script before being handed out, reset
+(cookies cleared, blank page) when returned, and quit once it has loaded
+DRIVER_MAX_PAGES pages so long-lived browsers do not accumulate memory.
+The chromedriver binary is resolved once per process. Page loads wait
+for their domain's slot in the pool's rate limiter (scraper.throttle).
+"""
+
+import atexit
+import functools
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from scraper.config import DRIVER_ACQUIRE_TIMEOUT, DRIVER_MAX_PAGES, DRIVER_POOL_SIZE, HEADERS
+from scraper.throttle import get_rate_limiter
+
+
+class DriverPoolExhausted(Exception):
+    pass
+
+
+@functools.lru_cache(maxsize=1)
+def chromedriver_path() -> Optional[str]:
+    """Path of the chromedriver binary, downloaded at most once per process.
+    None lets Selenium Manager locate one instead."""
+    try:
+        return ChromeDriverManager().install()
+    except Exception as e:
+        print(f"[DriverPool] webdriver-manager unavailable ({e}); using Selenium Manager.")
+        return None
+
+
+def chrome_options(headless: bool = True) -> Options:
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"user-agent={HEADERS.get('User-Agent')}")
+    return options
+
+
+def create_driver(headless: bool = True):
+    path = chromedriver_path()
+    service = Service(path) if path else Service()
+    return webdriver.Chrome(service=service, options=chrome_options(headless))
+
+
+class PooledDriver:
+    """A pooled WebDriver that counts (and rate-limits) page loads; everything else is delegated."""
+
+    def __init__(self, driver, limiter=None):
+        self._driver = driver
+        self._limiter = limiter
+        self.pages = 0
+
+    def get(self, url):
+        if self._limiter is not None:
+            self._limiter.wait(url)
+        self.pages += 1
+        return self._driver.get(url)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+class DriverPool:
+    def __init__(self, size: int = None, max_pages: int = None, factory=create_driver, limiter=None):
+        self.size = size or DRIVER_POOL_SIZE
+        self.max_pages = max_pages or DRIVER_MAX_PAGES
+        self.factory = factory
+        self.limiter = limiter
+        self._idle: List[PooledDriver] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self.created = 0
+
+    def _healthy(self, driver: PooledDriver) -> bool:
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _discard(self, driver: PooledDriver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _take(self) -> PooledDriver:
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                self.created += 1
+                return PooledDriver(self.factory(), self.limiter)
+            if self._healthy(driver):
+                return driver
+            self._discard(driver)
+
+    def _give_back(self, driver: PooledDriver, broken: bool):
+        if broken or driver.pages >= self.max_pages:
+            self._discard(driver)
+            return
+        try:
+            driver.delete_all_cookies()
+            driver._driver.get("about:blank")
+        except Exception:
+            self._discard(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    @contextmanager
+    def driver(self, timeout: float = None):
+        """
+        Lease a driver for one scrape. At most `size` drivers are out at
+        once; waits up to `timeout` seconds for one to be returned.
+        """
+        timeout = DRIVER_ACQUIRE_TIMEOUT if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise DriverPoolExhausted(f"No browser free after {timeout}s")
+        driver = None
+        broken = False
+        try:
+            driver = self._take()
+            yield driver
+        except Exception:
+            # The page may be in any state; do not hand it to the next scraper.
+            # (GeneratorExit from a scraper closed early is not a failure.)
+            broken = True
+            raise
+        finally:
+            if driver is not None:
+                self._give_back(driver, broken)
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+
+_pool: Optional[DriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """The process-wide pool, created on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = DriverPool(limiter=get_rate_limiter())
+                atexit.register(_pool.close)
+    return _pool
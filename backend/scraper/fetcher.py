@@ -0,0 +1,135 @@
+"""
+AsyncFetcher - concurrent HTTP fetching for static-HTML scrapers.
+
+Callers outside an event loop (scrapers run in ScraperService's worker
+threads) use fetch_pages(). The fetcher keeps its own event loop and one
+aiohttp session on it from the first call until close(), so every batch
+of a scraper's run (the waves of an incremental run included) goes
+through the same connection pool, kept alive between requests to the same
+host. The connector caps open connections overall and per host, which is
+what keeps a paginated fan-out polite. aiohttp advertises and
+transparently decodes gzip/deflate responses. Async callers use
+fetch_all(), which opens a session for the batch on their loop.
+
+With a limiter (scraper.throttle.RateLimiter) every request first waits
+for its domain's rate-limit slot, and the response status is fed back so
+a throttled domain slows down. The limiter may talk to Redis, so it is
+called off the event loop.
+
+A request may carry extra headers as a third element, which is how
+incremental runs send If-None-Match / If-Modified-Since; a 304 answer is
+reported as not_modified rather than as an error.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+import aiohttp
+
+from scraper.config import FETCH_CONCURRENCY, FETCH_PER_HOST, FETCH_TIMEOUT, HEADERS
+
+PageRequest = Tuple[str, Optional[Dict]]  # optionally (url, params, headers)
+
+
+def request_url(url: str, params: Optional[Dict] = None) -> str:
+    """Stable key of a (url, params) request, e.g. for per-page crawl state."""
+    if not params:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: Optional[int] = None
+    text: str = ""
+    error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status == 200
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class AsyncFetcher:
+    def __init__(self, headers: Dict = None, limit: int = None,
+                 limit_per_host: int = None, timeout: float = None, limiter=None):
+        self.headers = HEADERS if headers is None else headers
+        self.limiter = limiter
+        self.limit = limit or FETCH_CONCURRENCY
+        self.limit_per_host = limit_per_host or FETCH_PER_HOST
+        self.timeout = timeout or FETCH_TIMEOUT
+        self._runner: Optional[asyncio.Runner] = None
+        self._client: Optional[aiohttp.ClientSession] = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit, limit_per_host=self.limit_per_host, keepalive_timeout=30
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, params: Optional[Dict],
+                     headers: Optional[Dict] = None) -> FetchResult:
+        if self.limiter is not None:
+            delay = await asyncio.to_thread(self.limiter.reserve, url)
+            if delay:
+                await asyncio.sleep(delay)
+        try:
+            async with session.get(url, params=params, headers=headers) as response:
+                text = await response.text(errors="replace")
+                if self.limiter is not None:
+                    await asyncio.to_thread(
+                        self.limiter.feedback, url, response.status, response.headers.get("Retry-After")
+                    )
+                return FetchResult(
+                    url=str(response.url), status=response.status, text=text,
+                    error=None if response.status in (200, 304) else f"HTTP {response.status}",
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return FetchResult(url=url, error=f"{type(e).__name__}: {e}")
+
+    async def fetch_all(self, requests: Sequence[PageRequest]) -> List[FetchResult]:
+        """Fetch every (url, params[, headers]) concurrently; results keep request order."""
+        async with self._session() as session:
+            return await asyncio.gather(*(self._fetch(session, *request) for request in requests))
+
+    async def _fetch_kept_alive(self, requests: Sequence[PageRequest]) -> List[FetchResult]:
+        if self._client is None:
+            self._client = self._session()
+        return await asyncio.gather(*(self._fetch(self._client, *request) for request in requests))
+
+    def fetch_pages(self, requests: Sequence[PageRequest]) -> List[FetchResult]:
+        """Blocking fetch_all for code that is not async, reusing the fetcher's session."""
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        return self._runner.run(self._fetch_kept_alive(requests))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the session and loop used by fetch_pages (reopened on the next call)."""
+        if self._runner is None:
+            return
+        try:
+            if self._client is not None:
+                self._runner.run(self._client.close())
+        finally:
+            self._runner.close()
+            self._runner = self._client = None
@@ -0,0 +1,103 @@
+"""
+CrawlSession - what a scraper knows about a source from previous runs.
+
+ScraperService loads one session per site for incremental runs and hands
+it to the scraper as `scraper.crawl`. Scrapers use it to stop paginating
+early: a results page that is unchanged since last time (answered 304 to
+the conditional GET built from its stored ETag/Last-Modified, or with the
+same body checksum) or that is mostly made of listings already seen means
+everything after it was ingested before.
+
+State stored in the database (CrawlState) is only read during a run.
+Validators of the pages fetched and the new listing URLs (passed to saw()
+as jobs stream in) are collected separately and written back by
+CrawlStateRepository.save once the site's jobs have been ingested, so a
+failed ingest is simply re-scraped.
+"""
+
+import hashlib
+from typing import Dict, Iterable, List, Optional
+
+from django.utils import timezone
+
+from scraper.config import INCREMENTAL_PAGE_LIMIT, INCREMENTAL_SEEN_LIMIT, INCREMENTAL_STOP_RATIO
+from scraper.dedup import canonical_url
+
+
+def page_checksum(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+class CrawlSession:
+    def __init__(self, source: str, seen_urls: Iterable[str] = (), pages: Dict = None):
+        self.source = source
+        self.seen_urls: List[str] = list(seen_urls)
+        self.pages: Dict[str, Dict] = dict(pages or {})
+        self._seen = set(self.seen_urls)
+        self.new_urls: Dict[str, None] = {}  # ordered set, newest first
+        self.fetched: Dict[str, Dict] = {}
+        self.pages_unchanged = 0
+
+    def begin_attempt(self):
+        """Forget pages recorded by a failed attempt of this run."""
+        self.fetched = {}
+        self.pages_unchanged = 0
+
+    # ---- listings ----
+
+    def saw(self, job: Dict):
+        url = canonical_url(job.get("url"))
+        if url and url not in self._seen and len(self.new_urls) < INCREMENTAL_SEEN_LIMIT:
+            self.new_urls.setdefault(url)
+
+    def is_known(self, url) -> bool:
+        return canonical_url(url) in self._seen
+
+    def reached_known(self, jobs: List[Dict]) -> bool:
+        """True if this page's listings were mostly ingested by earlier runs."""
+        urls = [url for url in (canonical_url(job.get("url")) for job in jobs) if url]
+        if not urls:
+            return False
+        known = sum(url in self._seen for url in urls)
+        return known / len(urls) >= INCREMENTAL_STOP_RATIO
+
+    # ---- results pages ----
+
+    def request_headers(self, page_url: str) -> Optional[Dict]:
+        """Conditional-GET headers for a page fetched by an earlier run."""
+        page = self.pages.get(page_url) or {}
+        headers = {}
+        if page.get("etag"):
+            headers["If-None-Match"] = page["etag"]
+        if page.get("last_modified"):
+            headers["If-Modified-Since"] = page["last_modified"]
+        return headers or None
+
+    def page_unchanged(self, page_url: str, result) -> bool:
+        if result.not_modified:
+            unchanged = page_url in self.pages
+        else:
+            stored = self.pages.get(page_url) or {}
+            unchanged = result.ok and stored.get("checksum") == page_checksum(result.text)
+        if unchanged:
+            self.pages_unchanged += 1
+        return unchanged
+
+    def record_page(self, page_url: str, result):
+        self.fetched[page_url] = {
+            "etag": result.etag,
+            "last_modified": result.last_modified,
+            "checksum": page_checksum(result.text),
+        }
+
+    # ---- persistence ----
+
+    def updated_state(self) -> Dict:
+        """CrawlState fields after a successful run."""
+        new_urls = list(self.new_urls)
+        seen_urls = (new_urls + self.seen_urls)[:INCREMENTAL_SEEN_LIMIT]
+
+        pages = {url: page for url, page in self.pages.items() if url not in self.fetched}
+        pages.update(self.fetched)  # most recently fetched last
+        pages = dict(list(pages.items())[-INCREMENTAL_PAGE_LIMIT:])
+        return {"seen_urls": seen_urls, "pages": pages, "last_run_at": timezone.now()}
@@ -0,0 +1,97 @@
+"""
+Parser benchmark over the fixture result pages in scraper/scrapper_tests/html.
+
+The pages are synthetic, not captured from the sites: hand-written
+markup following each scraper's result-card selectors (25 cards, one
+missing a required field), padded with inline scripts and styles to the
+weight of a real results page. Each page's .json holds the jobs its
+scraper is expected to parse from it.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from scraper.config import JOB_SITES
+from scraper.parsers.markup import HTML_PARSERS
+
+CORPUS_DIR = Path(__file__).resolve().parents[2] / "scrapper_tests" / "html"
+
+
+def load_corpus(sources=None):
+    """(source, page name, html, expected jobs) for every fixture page."""
+    pages = []
+    for directory in sorted(CORPUS_DIR.iterdir()):
+        if not directory.is_dir() or directory.name not in JOB_SITES:
+            continue
+        if sources and directory.name not in sources:
+            continue
+        for page in sorted(directory.glob("*.html")):
+            expected = page.with_suffix(".json")
+            pages.append((
+                directory.name, page.stem, page.read_text(encoding="utf-8"),
+                json.loads(expected.read_text(encoding="utf-8")) if expected.exists() else None,
+            ))
+    return pages
+
+
+class Command(BaseCommand):
+    help = (
+        "Time each scraper's parse_page on the synthetic fixture result pages "
+        "in scraper/scrapper_tests/html, with every HTML parser, and check the "
+        "parsed jobs against the expected ones. No network or browser."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", action="append", choices=sorted(JOB_SITES), help="Only these sources.")
+        parser.add_argument("--parser", action="append", choices=HTML_PARSERS, help="Only these HTML parsers.")
+        parser.add_argument("--runs", type=int, default=50, help="Parses of each page.")
+        parser.add_argument(
+            "--max-ms", type=float, default=None,
+            help="Fail if any median parse time (ms per page) is above this.",
+        )
+
+    def handle(self, *args, **options):
+        pages = load_corpus(options["source"])
+        if not pages:
+            raise CommandError(f"No fixture pages in {CORPUS_DIR}")
+        parsers = options["parser"] or HTML_PARSERS
+        problems = []
+
+        for source, name, html, expected in pages:
+            scraper = import_string(JOB_SITES[source]["parser"])("developer", "Lagos")
+            medians = {}
+            for html_parser in parsers:
+                scraper.html_parser = html_parser
+                jobs = scraper.parse_page(html)
+                if expected is not None and jobs != expected:
+                    problems.append(
+                        f"{source}/{name} [{html_parser}]: {len(jobs)} jobs parsed, "
+                        f"{len(expected)} expected, or fields differ"
+                    )
+                timings = []
+                for _ in range(options["runs"]):
+                    start = time.perf_counter()
+                    scraper.parse_page(html)
+                    timings.append((time.perf_counter() - start) * 1000)
+                timings.sort()
+                medians[html_parser] = timings[len(timings) // 2]
+                self.stdout.write(
+                    f"{source:>10} {name:<12} {html_parser:>5}: {len(jobs):>3} jobs, "
+                    f"median {medians[html_parser]:.2f} ms, max {timings[-1]:.2f} ms "
+                    f"({len(html) / 1024:.0f} KiB)"
+                )
+                if options["max_ms"] is not None and medians[html_parser] > options["max_ms"]:
+                    problems.append(
+                        f"{source}/{name} [{html_parser}]: median {medians[html_parser]:.2f} ms "
+                        f"> {options['max_ms']} ms"
+                    )
+            if "lxml" in medians and "bs4" in medians:
+                self.stdout.write(f"{'':>10} {name:<12} lxml is {medians['bs4'] / medians['lxml']:.1f}x bs4")
+
+        if problems:
+            raise CommandError("\n".join(problems))
+        self.stdout.write(self.style.SUCCESS(f"{len(pages)} pages parsed as expected"))
@@ -0,0 +1,125 @@
+import hashlib
+import re
+
+import numpy as np
+from django.db import migrations
+
+# scraper.dedup as of this migration (64 permutations in 16 bands), kept
+# here so later changes to it do not rewrite history
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+_PRIME = np.uint64((1 << 31) - 1)
+NUM_PERM = 64
+BANDS = 16
+
+TITLE_SYNONYMS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior",
+    "dev": "developer", "devs": "developers", "eng": "engineer", "engr": "engineer",
+    "mgr": "manager", "mgmt": "management", "admin": "administrator",
+    "asst": "assistant", "assoc": "associate", "exec": "executive",
+    "sw": "software", "ops": "operations", "qa": "quality assurance",
+}
+
+COMPANY_SUFFIXES = {
+    "ltd", "limited", "inc", "incorporated", "llc", "plc", "corp",
+    "corporation", "co", "company", "gmbh",
+}
+
+
+def tokens(text):
+    return _TOKEN.findall(str(text or "").lower())
+
+
+def canonical_title(title):
+    return " ".join(TITLE_SYNONYMS.get(token, token) for token in tokens(title))
+
+
+def canonical_company(company):
+    words = tokens(company)
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def shingles(words, size=3):
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def fingerprint(job):
+    description_shingles = shingles(tokens(job.description))
+    digest = (
+        hashlib.sha1("\n".join(sorted(description_shingles)).encode()).hexdigest()[:16]
+        if description_shingles else ""
+    )
+    parts = (
+        canonical_title(job.title),
+        canonical_company(job.company_name),
+        " ".join(tokens(job.location)),
+        digest,
+    )
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def features(job):
+    title = canonical_title(job.title).split()
+    result = {f"t:{token}" for token in title}
+    result.update(f"t:{bigram}" for bigram in shingles(title, 2) if " " in bigram)
+    result.update(f"l:{token}" for token in tokens(job.location))
+    result.update(f"d:{shingle}" for shingle in shingles(tokens(job.description)))
+    return result
+
+
+def _hash31(value):
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little") % int(_PRIME)
+
+
+def signature(feature_set, a, b):
+    values = np.fromiter((_hash31(feature) for feature in feature_set), dtype=np.uint64)
+    if not values.size:
+        return [int(_PRIME)] * NUM_PERM
+    return ((values[:, None] * a + b) % _PRIME).min(axis=0).tolist()
+
+
+def bucket_keys(minhash, company):
+    rows = NUM_PERM // BANDS
+    return [
+        f"{band}:{hashlib.md5(f'{company}|{minhash[band * rows:(band + 1) * rows]}'.encode()).hexdigest()[:16]}"
+        for band in range(BANDS)
+    ]
+
+
+def backfill(apps, schema_editor):
+    ScrapedJob = apps.get_model("scraper", "ScrapedJob")
+    ScrapedJobBucket = apps.get_model("scraper", "ScrapedJobBucket")
+    rng = np.random.RandomState(1)
+    a = rng.randint(1, int(_PRIME), NUM_PERM).astype(np.uint64)
+    b = rng.randint(0, int(_PRIME), NUM_PERM).astype(np.uint64)
+    seen = set()
+    jobs = ScrapedJob.objects.order_by("id").only(
+        "id", "title", "company_name", "location", "description"
+    )
+    for job in jobs.iterator(chunk_size=500):
+        key = fingerprint(job)
+        if key in seen:
+            # Existing exact duplicates keep no fingerprint (the column is unique)
+            continue
+        seen.add(key)
+        minhash = signature(features(job), a, b)
+        ScrapedJob.objects.filter(pk=job.pk).update(fingerprint=key, minhash=minhash)
+        ScrapedJobBucket.objects.bulk_create(
+            ScrapedJobBucket(job_id=job.pk, key=bucket)
+            for bucket in bucket_keys(minhash, canonical_company(job.company_name))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0002_scraped_job_dedup"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
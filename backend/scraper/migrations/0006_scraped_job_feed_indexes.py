@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0005_scrape_run'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='scrapedjob',
+            index=models.Index(fields=['source_website', '-created_at', '-id'], name='scrapedjob_source_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scrapedjob',
+            index=models.Index(fields=['-created_at', '-id'], name='scrapedjob_feed_idx'),
+        ),
+    ]
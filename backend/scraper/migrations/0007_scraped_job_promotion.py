@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_hot_query_indexes'),
+        ('scraper', '0006_scraped_job_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='job',
+            field=models.OneToOneField(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='scraped_from', to='jobs.job'),
+        ),
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='promoted_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='scraperun',
+            name='promoted',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
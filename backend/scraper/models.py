@@ -1,4 +1,6 @@
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 class ScrapedJob(models.Model):
     title = models.CharField(max_length=255)
@@ -8,8 +10,101 @@ class ScrapedJob(models.Model):
     job_url = models.URLField(unique=True)
     posted_date = models.DateField(blank=True, null=True)
     source_website = models.CharField(max_length=100, blank=True, null=True)
+    # Duplicate detection (scraper.dedup); set by ScrapedJobRepository.ingest
+    fingerprint = models.CharField(max_length=64, unique=True, null=True, blank=True, editable=False)
+    minhash = models.JSONField(default=list, blank=True, editable=False)
+    # Set once promoted into the job board (scraper.promotion)
+    job = models.OneToOneField(
+        "jobs.Job", on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="scraped_from"
+    )
+    promoted_at = models.DateTimeField(blank=True, null=True, editable=False, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Newest-first keyset pages of the scraped job list, per source and overall
+            models.Index(fields=["source_website", "-created_at", "-id"], name="scrapedjob_source_feed_idx"),
+            models.Index(fields=["-created_at", "-id"], name="scrapedjob_feed_idx"),
+        ]
+
     def __str__(self):
         return f"{self.title} at {self.company_name}"
+
+
+class ScrapedJobBucket(models.Model):
+    """One LSH band of a scraped job's MinHash signature (see scraper.dedup)."""
+
+    job = models.ForeignKey(ScrapedJob, on_delete=models.CASCADE, related_name="lsh_buckets")
+    key = models.CharField(max_length=24, db_index=True)
+
+    def __str__(self):
+        return f"{self.key} -> {self.job_id}"
+
+
+class CrawlState(models.Model):
+    """
+    Incremental crawl bookkeeping for one source (see scraper.incremental):
+    the most recently seen listing URLs, newest first, and per results-page
+    validators {page url: {"etag", "last_modified", "checksum"}}.
+    """
+
+    source = models.CharField(max_length=100, unique=True)
+    seen_urls = models.JSONField(default=list, blank=True)
+    pages = models.JSONField(default=dict, blank=True)
+    last_run_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Crawl state of {self.source}"
+
+
+class ScrapeRun(models.Model):
+    """
+    One background scrape (see scraper.runs): what was asked for, how far
+    it got per source and what it wrote. `sites` maps each source to its
+    progress, {"status", "jobs_found"}, plus the ScraperService site report
+    (error, attempts, duration, ...) once the source is done.
+    """
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    keyword = models.CharField(max_length=255, blank=True, default="")
+    location = models.CharField(max_length=255, blank=True, default="")
+    full_refresh = models.BooleanField(default=False)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="scrape_runs"
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True)
+    task_id = models.CharField(max_length=255, blank=True, default="")
+    sites = models.JSONField(default=dict, blank=True)
+    jobs_found = models.PositiveIntegerField(default=0)
+    inserted = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    promoted = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    @property
+    def duration(self):
+        if self.started_at is None:
+            return None
+        return ((self.finished_at or timezone.now()) - self.started_at).total_seconds()
+
+    def __str__(self):
+        return f"Scrape run {self.pk} ({self.status})"
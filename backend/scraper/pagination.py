@@ -0,0 +1,50 @@
+"""
+Cursor pagination for the scraped job list.
+
+The table grows with every scrape, so the list never counts or offsets:
+pages seek on (created_at, id), newest first, using jobs.pagination's
+KeysetPagination and the scrapedjob_feed indexes. Clients follow the
+`next`/`previous` links; `?page_size=` picks the page size up to 100.
+"""
+
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from jobs.pagination import KeysetPagination
+
+
+class ScrapedJobPagination(KeysetPagination):
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def __init__(self):
+        super().__init__(api_settings.PAGE_SIZE)
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return api_settings.PAGE_SIZE
+        return min(page_size, self.max_page_size) if page_size > 0 else api_settings.PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -1,31 +1,230 @@
 
 """
 BaseScraper defines the common interface for all job scrapers.
-Each subclass must implement the `fetch_jobs` method.
+Each subclass must implement the `iter_jobs` generator, yielding jobs as
+they are parsed so ScraperService can stream them to the database;
+`fetch_jobs` collects them into a list.
+
+For incremental runs ScraperService sets `crawl` to the source's
+CrawlSession (scraper.incremental); paginating scrapers stop once
+`reached_known(page_jobs)` says they are back among ingested listings.
+
+Scrapers turn a results page's HTML into jobs in parse_page(html), with
+browser-based scrapers parsing the rendered page source, so parsing is
+the same offline (see scrapper_tests/html) as in a live run. parse_html
+parses with the scraper's `html_parser` (scraper.parsers.markup), taken
+from its JOB_SITES entry when not set on the scraper.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from scraper.parsers.markup import Node, parse_html
+
 
 class BaseScraper(ABC):
+    crawl = None
+    site_name: str = ""
+    html_parser: str = None
+
     def __init__(self, keyword: str, location: str):
         self.keyword = keyword
         self.location = location
 
+    def parse_html(self, html: str) -> Node:
+        from scraper.config import HTML_PARSER, JOB_SITES
+
+        parser = self.html_parser or JOB_SITES.get(self.site_name, {}).get("html_parser", HTML_PARSER)
+        return parse_html(html, parser)
+
+    def parse_page(self, html: str) -> List[Dict]:
+        """Job dicts (see iter_jobs) found in one results page."""
+        raise NotImplementedError
+
+    def reached_known(self, page_jobs: List[Dict]) -> bool:
+        return self.crawl is not None and self.crawl.reached_known(page_jobs)
+
     @abstractmethod
-    def fetch_jobs(self) -> List[Dict]:
+    def iter_jobs(self) -> Iterator[Dict]:
         """
         Scrape job listings from a specific site.
-        Must return a list of dictionaries, each representing a job:
-        [
+        Must yield dictionaries, each representing a job:
             {
                 "title": "Software Engineer",
                 "company": "ABC Ltd",
                 "location": "Lagos",
                 "source": "Indeed",
                 "url": "https://..."
-            },
-            ...
-        ]
+            }
+        """
+
+    def fetch_jobs(self) -> List[Dict]:
+        return list(self.iter_jobs())
+
+
+class PageFetchError(Exception):
+    """The first results page could not be fetched."""
+
+
+class NoJobCards(Exception):
+    """The first results page has no job cards in its HTML."""
+
+
+class StaticHTMLScraper(BaseScraper):
+    """
+    Base for sites whose search results are plain HTML. Subclasses name
+    their JOB_SITES entry and implement parse_page(html); this class builds
+    the paginated search URLs, fetches them concurrently through
+    AsyncFetcher (paced by the shared per-domain rate limiter) and yields
+    the parsed pages up to the first empty one.
+
+    Incremental runs fetch the pages in waves as wide as the fetcher's
+    per-host limit (so no concurrency is lost), send conditional GETs, and
+    stop at the first unchanged page or page of already-seen listings.
+    """
+
+    def __init__(self, keyword: str, location: str, max_pages: int = None, fetcher=None):
+        super().__init__(keyword, location)
+        from scraper.config import JOB_SITES
+        from scraper.fetcher import AsyncFetcher
+        from scraper.throttle import get_rate_limiter
+
+        self.site = JOB_SITES[self.site_name]
+        self.max_pages = max_pages or self.site.get("max_pages", 1)
+        # A fetcher made here is closed here, once the pages are read
+        self._owns_fetcher = fetcher is None
+        self.fetcher = fetcher or AsyncFetcher(limiter=get_rate_limiter())
+
+    @abstractmethod
+    def parse_page(self, html: str) -> List[Dict]:
+        """Job dicts (see iter_jobs) found in one results page."""
+
+    def page_requests(self) -> List[Tuple[str, Dict]]:
+        params = {
+            self.site["query_param"]: self.keyword,
+            self.site["location_param"]: self.location,
+        }
+        first, step = self.site.get("first_page", 0), self.site.get("page_step", 1)
+        requests = []
+        for n in range(self.max_pages):
+            page_params = dict(params)
+            if n or first:
+                page_params[self.site["pagination_param"]] = first + n * step
+            requests.append((self.site["base_url"], page_params))
+        return requests
+
+    def iter_jobs(self) -> Iterator[Dict]:
+        yield from self.iter_html_pages()
+
+    def fetched(self, pages):
+        """Called with each wave of fetched pages (e.g. to account for them)."""
+
+    def iter_html_pages(self, cards_required: bool = False) -> Iterator[Dict]:
         """
-        pass
+        Jobs of page_requests() fetched over plain HTTP, page by page.
+        Raises PageFetchError if the first page fails, and NoJobCards if it
+        has no jobs and `cards_required`, both before yielding anything.
+        """
+        try:
+            yield from self._iter_fetched_pages(cards_required)
+        finally:
+            if self._owns_fetcher:
+                self.fetcher.close()
+
+    def _iter_fetched_pages(self, cards_required: bool) -> Iterator[Dict]:
+        from scraper.fetcher import request_url
+
+        requests = self.page_requests()
+        wave = self.fetcher.limit_per_host if self.crawl else len(requests)
+        for start in range(0, len(requests), wave):
+            batch = [(url, params, request_url(url, params)) for url, params in requests[start:start + wave]]
+            pages = self.fetcher.fetch_pages([
+                (url, params, self.crawl.request_headers(key) if self.crawl else None)
+                for url, params, key in batch
+            ])
+            self.fetched(pages)
+            if start == 0 and pages[0].error:
+                raise PageFetchError(f"Failed to fetch page: {pages[0].error}")
+
+            for n, ((url, params, key), page) in enumerate(zip(batch, pages), start):
+                if self.crawl and self.crawl.page_unchanged(key, page):
+                    return
+                if not page.ok:
+                    print(f"[{self.site_name}] Skipping {page.url}: {page.error}")
+                    return
+                page_jobs = self.parse_page(page.text)
+                if not page_jobs:
+                    if n == 0 and cards_required:
+                        raise NoJobCards("no job cards in the HTML")
+                    return
+                yield from page_jobs
+                if self.crawl:
+                    self.crawl.record_page(key, page)
+                    if self.crawl.reached_known(page_jobs):
+                        return
+
+
+class BrowserScraper(StaticHTMLScraper):
+    """
+    Base for sites scraped with Chrome that may not need it. The "render"
+    entry of the site's JOB_SITES config says how result pages are loaded:
+
+    - "browser" (default_render): Chrome from the DriverPool, browser_jobs();
+    - "http": plain HTTP, exactly as a StaticHTMLScraper (streamed page by
+      page, with conditional GETs and early stops on incremental runs);
+    - "auto": the same, except that Chrome takes over when the first page
+      cannot be fetched or its HTML has no job cards (they are rendered by
+      script). Nothing has been yielded by then, so nothing is repeated.
+
+    Each run leaves the strategy used and its cost in `render_stats`
+    (reported per site on the ScrapeRun): pages, bytes and seconds over
+    HTTP, seconds in the browser, and why HTTP fell back, if it did.
+    """
+
+    default_render = "browser"
+
+    def __init__(self, keyword: str, location: str, max_pages: int = None, pool=None, fetcher=None):
+        super().__init__(keyword, location, max_pages=max_pages, fetcher=fetcher)
+        from scraper.driver_pool import get_driver_pool
+
+        self.render = self.site.get("render", self.default_render)
+        self.pool = pool or get_driver_pool()
+        self.render_stats: Optional[Dict] = None
+
+    @abstractmethod
+    def browser_jobs(self) -> Iterator[Dict]:
+        """Jobs from result pages rendered by a pooled Chrome."""
+
+    def fetched(self, pages):
+        self.render_stats["http_pages"] += len(pages)
+        self.render_stats["http_bytes"] += sum(len(page.text.encode("utf-8")) for page in pages)
+
+    def iter_jobs(self) -> Iterator[Dict]:
+        self.render_stats = stats = {"strategy": self.render, "fallback": None}
+        if self.render in ("http", "auto"):
+            stats.update(strategy="http", http_pages=0, http_bytes=0)
+            started = time.monotonic()
+            jobs = self.iter_html_pages(cards_required=self.render == "auto")
+            try:
+                try:
+                    first = next(jobs, None)
+                except (PageFetchError, NoJobCards) as e:
+                    if self.render == "http":
+                        raise
+                    stats["fallback"] = str(e)
+                else:
+                    if first is not None:
+                        yield first
+                        yield from jobs
+                    return
+            finally:
+                stats["http_seconds"] = round(time.monotonic() - started, 2)
+            print(f"[{self.site_name}] Falling back to the browser: {stats['fallback']}")
+
+        stats["strategy"] = "browser"
+        started = time.monotonic()
+        try:
+            yield from self.browser_jobs()
+        finally:
+            stats["browser_seconds"] = round(time.monotonic() - started, 2)
@@ -1,61 +1,73 @@
 # scraper/services/glassdoor_scraper.py
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+from typing import Dict, List
+from urllib.parse import urljoin
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 import time
 
-class GlassdoorScraper:
+from scraper.fetcher import request_url
+from .base_scraper import BrowserScraper
+
+
+class GlassdoorScraper(BrowserScraper):
     """
     Scraper for Glassdoor job listings.
+    Cards are found with the "selectors" of the glassdoor JOB_SITES entry.
     """
+    site_name = "glassdoor"
     BASE_URL = "https://www.glassdoor.com/Job/jobs.htm"
 
-    def __init__(self, keyword: str, location: str, max_pages: int = 2):
-        self.keyword = keyword
-        self.location = location
-        self.max_pages = max_pages
+    def __init__(self, keyword: str, location: str, max_pages: int = 2, pool=None, fetcher=None):
+        super().__init__(keyword, location, max_pages=max_pages, pool=pool, fetcher=fetcher)
+        self.selectors = self.site["selectors"]
 
-        # Configure headless Chrome
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        self.driver = webdriver.Chrome(service=Service(), options=chrome_options)
+    def page_requests(self):
+        return [
+            (self.BASE_URL, {
+                "sc.keyword": self.keyword, "locT": "C", "locId": 0, "locKeyword": self.location, "p": page,
+            })
+            for page in range(1, self.max_pages + 1)
+        ]
 
-    def scrape(self):
+    def browser_jobs(self):
         """
         Scrape jobs from Glassdoor.
-        Returns a list of dicts with job info.
+        Yields dicts with job info, page by page.
         """
-        jobs = []
+        with self.pool.driver() as self.driver:
+            yield from self._scrape_pages()
 
-        for page in range(1, self.max_pages + 1):
-            url = f"{self.BASE_URL}?sc.keyword={self.keyword}&locT=C&locId=0&locKeyword={self.location}&p={page}"
-            self.driver.get(url)
+    def _scrape_pages(self):
+        for url, params in self.page_requests():
+            self.driver.get(request_url(url, params))
             time.sleep(2)  # wait for page to load
 
-            job_cards = self.driver.find_elements(By.CLASS_NAME, "react-job-listing")
-            if not job_cards:
+            if not self.driver.find_elements(By.CSS_SELECTOR, self.selectors["job_card"]):
                 break
 
-            for card in job_cards:
-                try:
-                    title = card.find_element(By.CLASS_NAME, "jobLink").text
-                    company = card.find_element(By.CLASS_NAME, "jobHeader").text
-                    location_elem = card.find_element(By.CLASS_NAME, "loc")
-                    location = location_elem.text if location_elem else self.location
-                    summary = card.find_element(By.CLASS_NAME, "jobDesc").text
-
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "description": summary,
-                        "source": "Glassdoor",
-                    })
-                except Exception as e:
-                    print(f"Skipping job card due to error: {e}")
-
-        self.driver.quit()
+            page_jobs = self.parse_page(self.driver.page_source)
+            yield from page_jobs
+            if self.reached_known(page_jobs):
+                break
+
+    def parse_page(self, html: str) -> List[Dict]:
+        selectors = self.selectors
+        jobs = []
+        for card in self.parse_html(html).select(selectors["job_card"]):
+            title_el = card.select_one(selectors["title"])
+            company_el = card.select_one(selectors["company"])
+            if title_el is None or company_el is None:
+                continue
+            location_el = card.select_one(selectors["location"])
+            description_el = card.select_one(selectors["description"])
+            link_el = card.select_one(selectors["url"])
+            href = link_el.get("href") if link_el is not None else None
+            jobs.append({
+                "title": title_el.text,
+                "company": company_el.text,
+                "location": location_el.text if location_el is not None else self.location,
+                "description": description_el.text if description_el is not None else "",
+                "source": "Glassdoor",
+                "url": urljoin(self.BASE_URL, href) if href else None,
+            })
         return jobs
@@ -1,29 +1,22 @@
 # scraper/parsers/indeed_scraper.py
 """
 IndeedScraper - scrapes job postings from Indeed Nigeria.
-Uses BeautifulSoup (HTML parsing) and requests.
+Result pages are fetched concurrently by StaticHTMLScraper and parsed
+with the site's HTML parser (scraper.parsers.markup).
 """
 
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict
-from .base_scraper import BaseScraper
-from scraper.config import HEADERS, JOB_SOURCES
+from urllib.parse import urljoin
+from .base_scraper import StaticHTMLScraper
 
 
-class IndeedScraper(BaseScraper):
-    def fetch_jobs(self) -> List[Dict]:
-        url_template = JOB_SOURCES["indeed"]["url"]
-        url = url_template.format(keyword=self.keyword, location=self.location)
+class IndeedScraper(StaticHTMLScraper):
+    site_name = "indeed"
 
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch page: {response.status_code}")
-
-        soup = BeautifulSoup(response.text, "html.parser")
+    def parse_page(self, html: str) -> List[Dict]:
         jobs = []
 
-        for job_card in soup.select(".job_seen_beacon"):
+        for job_card in self.parse_html(html).select(".job_seen_beacon"):
             title_el = job_card.select_one(".jobTitle span")
             company_el = job_card.select_one(".companyName")
             location_el = job_card.select_one(".companyLocation")
@@ -31,12 +24,23 @@ class IndeedScraper(BaseScraper):
             if not title_el or not company_el:
                 continue
 
+            # Each listing needs its own URL: it is the ScrapedJob key and
+            # what incremental runs recognise already-seen listings by
+            link_el = job_card.select_one(".jobTitle a[href]")
+            job_key = job_card.get("data-jk") or (link_el.get("data-jk") if link_el else None)
+            if link_el:
+                url = urljoin(self.site["base_url"], link_el.get("href"))
+            elif job_key:
+                url = urljoin(self.site["base_url"], f"/viewjob?jk={job_key}")
+            else:
+                continue
+
             jobs.append({
-                "title": title_el.text.strip(),
-                "company": company_el.text.strip(),
-                "location": location_el.text.strip() if location_el else "N/A",
+                "title": title_el.text,
+                "company": company_el.text,
+                "location": location_el.text if location_el else "N/A",
                 "source": "Indeed",
-                "url": "https://ng.indeed.com"  # Can extract detail link later
+                "url": url,
             })
 
         return jobs
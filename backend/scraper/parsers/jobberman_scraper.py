@@ -1,57 +1,53 @@
 # scraper/jobberman_scraper.py
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from typing import Dict, List
+from urllib.parse import urljoin
 
+from scraper.fetcher import request_url
+from .base_scraper import BrowserScraper
 
-class JobbermanScraper:
+
+class JobbermanScraper(BrowserScraper):
     """
     Handles scraping job listings from Jobberman.
+    The result cards are static HTML, so the site is configured to try
+    plain HTTP before Chrome (see BrowserScraper); both page through the
+    search URLs built from the jobberman JOB_SITES entry.
     """
+    site_name = "jobberman"
+    BASE_URL = "https://www.jobberman.com/jobs"
 
-    def __init__(self, keyword=None, location=None):
-        self.keyword = keyword or ""
-        self.location = location or ""
-
-    def _init_driver(self):
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    def __init__(self, keyword=None, location=None, max_pages=None, pool=None, fetcher=None):
+        super().__init__(keyword or "", location or "", max_pages=max_pages, pool=pool, fetcher=fetcher)
 
-    def scrape(self):
+    def browser_jobs(self):
         """
-        Scrape job listings from Jobberman search results page.
-        Returns a list of dictionaries with job info.
+        Scrape job listings from Jobberman search results pages.
+        Yields dictionaries with job info, page by page.
         """
-        driver = self._init_driver()
-        try:
-            url = f"https://www.jobberman.com/jobs?keyword={self.keyword}&location={self.location}"
-            driver.get(url)
-
-            job_elements = driver.find_elements(By.CSS_SELECTOR, "div.job-list-item")
-
-            jobs = []
-            for elem in job_elements:
-                try:
-                    title_el = elem.find_element(By.CSS_SELECTOR, ".job-title")
-                    company_el = elem.find_element(By.CSS_SELECTOR, ".company-name")
-                    link_el = elem.find_element(By.CSS_SELECTOR, "a")
-
-                    job = {
-                        "title": title_el.text.strip(),
-                        "company": company_el.text.strip() if company_el else "",
-                        "link": link_el.get_attribute("href"),
-                        "source": "jobberman",
-                    }
-                    jobs.append(job)
-                except Exception:
-                    continue
-
-            return jobs
-        finally:
-            driver.quit()
+        with self.pool.driver() as driver:
+            for url, params in self.page_requests():
+                driver.get(request_url(url, params))
+                page_jobs = self.parse_page(driver.page_source)
+                if not page_jobs:
+                    break
+                yield from page_jobs
+                if self.reached_known(page_jobs):
+                    break
+
+    def parse_page(self, html: str) -> List[Dict]:
+        jobs = []
+        for card in self.parse_html(html).select("div.job-list-item"):
+            title_el = card.select_one(".job-title")
+            company_el = card.select_one(".company-name")
+            link_el = card.select_one("a")
+            if title_el is None or company_el is None or link_el is None:
+                continue
+            href = link_el.get("href")
+            jobs.append({
+                "title": title_el.text,
+                "company": company_el.text,
+                "url": urljoin(self.BASE_URL, href) if href else None,
+                "source": "jobberman",
+            })
+        return jobs
@@ -6,61 +6,50 @@ and extract a list of job dictionaries.
 This scraper is designed to be used in headless mode and to be robust to
 delays in page loading by using explicit waits.
 
+The Chrome instance is leased from the worker's DriverPool and goes back
+to it afterwards, so consecutive runs reuse a warm browser. With "render"
+set to "auto" the public (guest) result pages are first requested over
+plain HTTP, and Chrome is only used when they come back without job cards.
+
 IMPORTANT: This file requires the `selenium` and `webdriver-manager` packages
 for real runs. Unit tests mock the driver so they don't need a real browser.
 """
 
-from typing import List, Dict
-from .base_scraper import BaseScraper
-from scraper.config import HEADERS
+from typing import Dict, Iterator, List
+from urllib.parse import urljoin
+from .base_scraper import BrowserScraper
+from scraper.fetcher import request_url
 import time
 
 # selenium imports
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-# webdriver-manager will install the chromedriver automatically at runtime
-from webdriver_manager.chrome import ChromeDriverManager
+class LinkedInScraper(BrowserScraper):
+    site_name = "linkedin"
+    # Public (guest) result pages, as served over plain HTTP, and the
+    # signed-in app's results list, as rendered in Chrome
+    CARD_SELECTOR = ".jobs-search__results-list li, .jobs-search-results__list li"
 
-class LinkedInScraper(BaseScraper):
-    def __init__(self, keyword: str, location: str, headless: bool = True, max_pages: int = 1):
+    def __init__(self, keyword: str, location: str, headless: bool = True, max_pages: int = 1, pool=None,
+                 fetcher=None):
         """
         :param keyword: job keyword to search for
         :param location: location string
-        :param headless: run Chrome in headless mode
+        :param headless: kept for compatibility; pooled drivers are always headless
         :param max_pages: how many pages to paginate (default 1 for safety)
+        :param pool: DriverPool to lease from (the process-wide pool by default)
+        :param fetcher: AsyncFetcher for plain HTTP pages (a rate-limited one by default)
         """
-        super().__init__(keyword, location)
+        super().__init__(keyword, location, max_pages=max_pages, pool=pool, fetcher=fetcher)
         self.headless = headless
-        self.max_pages = max_pages
-
-    def _init_driver(self):
-        """Initialize a headless Chrome driver using webdriver-manager."""
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new" if hasattr(options, "add_argument") else "--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(f"user-agent={HEADERS.get('User-Agent')}")
-        # create driver via webdriver-manager's ChromeDriverManager
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        return driver
 
-    def fetch_jobs(self) -> List[Dict]:
-        """Main entry that returns a list of job dicts from LinkedIn search results."""
-        jobs: List[Dict] = []
-        search_url = f"https://www.linkedin.com/jobs/search/?keywords={self.keyword}&location={self.location}"
-
-        driver = None
-        try:
-            driver = self._init_driver()
+    def browser_jobs(self) -> Iterator[Dict]:
+        """Yields job dicts from LinkedIn search results rendered in Chrome, page by page."""
+        with self.pool.driver() as driver:
             driver.set_page_load_timeout(20)
-            driver.get(search_url)
+            driver.get(request_url(*self.page_requests()[0]))
 
             # Wait for job results container to be present
             wait = WebDriverWait(driver, 10)
@@ -68,38 +57,18 @@ class LinkedInScraper(BaseScraper):
 
             # simple pagination loop (safe with small max_pages)
             for page in range(self.max_pages):
-                # find job cards; LinkedIn uses job-card containers
-                job_cards = driver.find_elements(By.CSS_SELECTOR, ".jobs-search-results__list li")
-
-                for el in job_cards:
-                    try:
-                        # title
-                        title_el = el.find_element(By.CSS_SELECTOR, "h3")
-                        # company
-                        company_el = el.find_element(By.CSS_SELECTOR, "h4")
-                        # location
-                        location_el = el.find_element(By.CSS_SELECTOR, ".job-search-card__location")
-                        # link (if anchor present)
-                        link_el = el.find_elements(By.CSS_SELECTOR, "a")
-                        url = link_el[0].get_attribute("href") if link_el else None
-
-                        job = {
-                            "title": title_el.text.strip(),
-                            "company": company_el.text.strip(),
-                            "location": location_el.text.strip(),
-                            "source": "LinkedIn",
-                            "url": url,
-                        }
-                        jobs.append(job)
-                    except Exception:
-                        # skip element on parsing issues; be defensive
-                        continue
+                page_jobs = self.parse_page(driver.page_source)
+                yield from page_jobs
+                # incremental runs: the rest was ingested by an earlier run
+                if self.reached_known(page_jobs) or page + 1 == self.max_pages:
+                    break
 
                 # try to go to next page if available (safe break if not)
                 try:
                     next_btn = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Page next']")
                     if "artdeco-button--disabled" in next_btn.get_attribute("class"):
                         break
+                    job_cards = driver.find_elements(By.CSS_SELECTOR, self.CARD_SELECTOR)
                     next_btn.click()
                     # wait for new page results to render
                     time.sleep(1)  # short sleep; explicit waits above are preferred but LinkedIn dynamic content varies
@@ -107,8 +76,22 @@ class LinkedInScraper(BaseScraper):
                 except Exception:
                     break
 
-        finally:
-            if driver:
-                driver.quit()
-
+    def parse_page(self, html: str) -> List[Dict]:
+        """Job dicts from the rendered results list; cards missing a field are skipped."""
+        jobs: List[Dict] = []
+        for card in self.parse_html(html).select(self.CARD_SELECTOR):
+            title_el = card.select_one("h3")
+            company_el = card.select_one("h4")
+            location_el = card.select_one(".job-search-card__location")
+            if title_el is None or company_el is None or location_el is None:
+                continue
+            link_el = card.select_one("a")
+            href = link_el.get("href") if link_el is not None else None
+            jobs.append({
+                "title": title_el.text,
+                "company": company_el.text,
+                "location": location_el.text,
+                "source": "LinkedIn",
+                "url": urljoin("https://www.linkedin.com/", href) if href else None,
+            })
         return jobs
@@ -0,0 +1,171 @@
+"""
+One small selection API over two HTML parsers, so a scraper's parse_page
+is written once and can run on either:
+
+- "lxml": libxml2's HTML parser. Selectors are translated to XPath once
+  and compiled; several times faster than BeautifulSoup on result pages.
+- "bs4": BeautifulSoup with the stdlib "html.parser" (selectors run by
+  soupsieve), the more forgiving of the two on badly broken markup.
+
+parse_html(html, parser) returns the document as a Node: select(css),
+select_one(css), get(attr) and text, whitespace-collapsed as Selenium's
+WebElement.text is. Only the CSS the scrapers need is supported: type,
+class, id and attribute ([attr], [attr=value]) selectors, combined with
+descendant and child (>) combinators, and comma-separated groups. Each
+scraper picks its parser with its JOB_SITES "html_parser" entry
+(HTML_PARSER when unset); the benchmark_scraper_parsers command compares
+both on the fixture result pages.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+HTML_PARSERS = ("lxml", "bs4")
+
+_COMPOUND = re.compile(
+    r"(?P<tag>\*|[a-zA-Z][\w-]*)?"
+    r"(?P<rest>(?:\.[\w-]+|#[\w-]+|\[[\w-]+(?:=(?:\"[^\"]*\"|'[^']*'|[\w-]+))?\])*)$"
+)
+_TOKEN = re.compile(r"(?:[^\s>\[]+|\[[^\]]*\])+|>")
+_SIMPLE = re.compile(r"\.([\w-]+)|#([\w-]+)|\[([\w-]+)(?:=(\"[^\"]*\"|'[^']*'|[\w-]+))?\]")
+
+
+def _collapse(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def _compound_to_xpath(compound: str) -> str:
+    match = _COMPOUND.match(compound)
+    if not compound or match is None:
+        raise ValueError(f"Unsupported selector: {compound!r}")
+    predicates = []
+    for cls, id_, attr, value in _SIMPLE.findall(match.group("rest")):
+        if cls:
+            predicates.append(
+                f"contains(concat(' ', normalize-space(@class), ' '), {_xpath_literal(f' {cls} ')})"
+            )
+        elif id_:
+            predicates.append(f"@id = {_xpath_literal(id_)}")
+        elif value:
+            if value[0] in "'\"":
+                value = value[1:-1]
+            predicates.append(f"@{attr} = {_xpath_literal(value)}")
+        else:
+            predicates.append(f"@{attr}")
+    return (match.group("tag") or "*").lower() + "".join(f"[{p}]" for p in predicates)
+
+
+@lru_cache(maxsize=256)
+def css_to_xpath(selector: str) -> str:
+    """XPath, relative to the context node, matching `selector` below it."""
+    if "," in selector:
+        # Group: matches come back once each, in document order, as in soupsieve
+        return " | ".join(css_to_xpath(part) for part in selector.split(","))
+    tokens = _TOKEN.findall(selector)
+    steps, axis = [], "descendant::"
+    for token in tokens:
+        if token == ">":
+            if axis != "descendant::" or not steps:
+                raise ValueError(f"Unsupported selector: {selector!r}")
+            axis = ""
+            continue
+        steps.append(axis + _compound_to_xpath(token))
+        axis = "descendant::"
+    if not steps or axis == "":
+        raise ValueError(f"Unsupported selector: {selector!r}")
+    return "/".join(steps)
+
+
+class Node:
+    __slots__ = ()
+
+    def select(self, css: str) -> List["Node"]:
+        raise NotImplementedError
+
+    def select_one(self, css: str) -> Optional["Node"]:
+        raise NotImplementedError
+
+    def get(self, attr: str, default=None) -> Optional[str]:
+        raise NotImplementedError
+
+    @property
+    def text(self) -> str:
+        raise NotImplementedError
+
+
+class LxmlNode(Node):
+    __slots__ = ("element",)
+
+    def __init__(self, element):
+        self.element = element
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _xpath(css: str):
+        from lxml import etree
+
+        return etree.XPath(css_to_xpath(css))
+
+    def select(self, css):
+        if self.element is None:
+            return []
+        return [LxmlNode(element) for element in self._xpath(css)(self.element)]
+
+    def select_one(self, css):
+        found = self._xpath(css)(self.element) if self.element is not None else []
+        return LxmlNode(found[0]) if found else None
+
+    def get(self, attr, default=None):
+        return self.element.get(attr, default) if self.element is not None else default
+
+    @property
+    def text(self):
+        return _collapse(self.element.text_content()) if self.element is not None else ""
+
+
+class SoupNode(Node):
+    __slots__ = ("tag",)
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def select(self, css):
+        return [SoupNode(tag) for tag in self.tag.select(css)]
+
+    def select_one(self, css):
+        tag = self.tag.select_one(css)
+        return SoupNode(tag) if tag is not None else None
+
+    def get(self, attr, default=None):
+        value = self.tag.get(attr, default)
+        return " ".join(value) if isinstance(value, list) else value
+
+    @property
+    def text(self):
+        return _collapse(self.tag.get_text())
+
+
+def parse_html(html: str, parser: str = "lxml") -> Node:
+    if parser == "lxml":
+        import lxml.html
+        from lxml.etree import ParserError
+
+        try:
+            return LxmlNode(lxml.html.document_fromstring(html))
+        except ParserError:  # empty document
+            return LxmlNode(None)
+    if parser == "bs4":
+        from bs4 import BeautifulSoup
+
+        return SoupNode(BeautifulSoup(html, "html.parser"))
+    raise ValueError(f"Unknown HTML parser {parser!r}; expected one of {HTML_PARSERS}")
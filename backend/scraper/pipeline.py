@@ -0,0 +1,47 @@
+"""
+Streaming scrape -> ingest pipeline.
+
+    scraper threads: fetch -> parse -> yield job
+        | bounded queue (PIPELINE_BUFFER, ScraperService.iter_jobs)
+    caller thread:   normalize -> dedup -> write a chunk (JobIngestor)
+
+Nothing holds the whole scrape in memory: the queue blocks the scrapers
+when the writer falls behind, and the ingestor buffers at most one chunk.
+Each chunk is committed as soon as it is written, so a run that dies half
+way keeps everything written until then. When a site finishes, the
+buffer is flushed and (for incremental runs) that site's crawl state is
+saved, since all of its jobs are now in the database.
+
+Given a ScrapeRun, the pipeline also records its progress: jobs found
+per site and the ingest totals after every chunk, and each site's report
+when it finishes (see scraper.runs).
+"""
+
+from typing import Dict
+
+from scraper.config import PIPELINE_CHUNK_SIZE
+from scraper.models import ScrapeRun
+from scraper.repository import IngestResult, JobIngestor, ScrapeRunRepository
+from scraper.services import ScraperService, SiteResult
+
+
+def run_pipeline(service: ScraperService, chunk_size: int = None, run: ScrapeRun = None) -> IngestResult:
+    found: Dict[str, int] = {}
+
+    def chunk_written(result: IngestResult):
+        if run is not None:
+            ScrapeRunRepository.progress(run, found, result)
+
+    ingestor = JobIngestor(chunk_size or PIPELINE_CHUNK_SIZE, on_flush=chunk_written)
+
+    def site_done(result: SiteResult):
+        ingestor.flush()
+        if service.incremental:
+            service.commit_crawl_state([result.site])
+        if run is not None:
+            ScrapeRunRepository.site_done(run, result)
+
+    for site, job in service.iter_jobs(on_site_done=site_done):
+        found[site] = found.get(site, 0) + 1
+        ingestor.add(job)
+    return ingestor.close()
@@ -0,0 +1,258 @@
+"""
+Promotion of scraped postings (ScrapedJob) into the job board (Job).
+
+Scraped rows are promoted a chunk at a time, each chunk in one
+transaction with a fixed number of queries:
+
+- company names are resolved to Employer rows by EmployerResolver, which
+  remembers every name it resolved during the run. A chunk's unknown
+  names are looked up together (an existing employer of that name, or one
+  created by an earlier promotion), and the rest are created in bulk;
+- the Jobs are bulk-inserted, tagged with the skills found in their text
+  (JobTags created in bulk as needed), and given search documents;
+- the ScrapedJob rows are linked to their Job, so a posting is promoted
+  once.
+
+A scraped company has no account, but Employer (and Job.posted_by)
+needs a user: each gets an inactive placeholder user that cannot log in,
+with an address derived from the canonical company name. That address
+is what lets concurrent promotions agree on one Employer per company
+(get-or-create through the unique email and user columns).
+
+bulk_create sends no signals, so what jobs.signals and ai.signals would
+do per Job is done here per chunk: search documents are written and
+indexed in bulk, matching features are stored (ai.models.JobFeatures)
+and, once committed, job list caches and the recommendation catalog are
+invalidated.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from ai.matchers.resume_matcher import bump_catalog_version
+from ai.matchers.skill_extractor import get_skill_pattern
+from ai.repository import JobFeatureRepository
+from employers.models import Employer
+from jobs.cache import invalidate_job_lists
+from jobs.models import Job, JobSearchDocument, JobTag
+from jobs.search import build_document_fields, get_search_backend
+from scraper.cache import invalidate_scraped_jobs
+from scraper.config import PROMOTION_CHUNK_SIZE, PROMOTION_MAX_TAGS
+from scraper.dedup import canonical_company
+from scraper.models import ScrapedJob
+from users.models import User
+
+PLACEHOLDER_EMAIL_DOMAIN = "scraped.invalid"
+
+EMPLOYMENT_TYPE_HINTS = [
+    (Job.INTERN, ("intern", "internship", "graduate trainee")),
+    (Job.CONTRACT, ("contract", "contractor", "freelance", "temporary")),
+    (Job.PART_TIME, ("part-time", "part time")),
+]
+
+_TITLE_MAX = Job._meta.get_field("title").max_length
+_LOCATION_MAX = Job._meta.get_field("location").max_length
+_TAG_MAX = JobTag._meta.get_field("name").max_length
+_NAME_MAX = User._meta.get_field("first_name").max_length
+
+
+def employment_type(title: str, description: str) -> str:
+    """Best guess from the posting text; the title is trusted over the description."""
+    for text in (title.lower(), description.lower()):
+        for value, hints in EMPLOYMENT_TYPE_HINTS:
+            if any(hint in text for hint in hints):
+                return value
+    return Job.FULL_TIME
+
+
+def placeholder_email(company_key: str) -> str:
+    digest = hashlib.sha1(company_key.encode("utf-8")).hexdigest()[:20]
+    return f"employer-{digest}@{PLACEHOLDER_EMAIL_DOMAIN}"
+
+
+@dataclass
+class PromotionResult:
+    promoted: int = 0
+    skipped: int = 0
+    employers_created: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"promoted": self.promoted, "skipped": self.skipped, "employers_created": self.employers_created}
+
+
+class EmployerResolver:
+    """Company name -> (employer id, user id), cached for the lifetime of the resolver."""
+
+    def __init__(self):
+        self._resolved: Dict[str, Tuple[int, int]] = {}
+
+    @staticmethod
+    def key(name: str) -> str:
+        return canonical_company(name) or " ".join(name.lower().split())
+
+    def resolve(self, names: Iterable[str]) -> Tuple[Dict[str, Tuple[int, int]], int]:
+        """(ids per name key, number of employers created) for every name."""
+        wanted = {}
+        for name in names:
+            key = self.key(name)
+            if key not in self._resolved:
+                wanted.setdefault(key, name)
+        created = 0
+        if wanted:
+            found = self._lookup(wanted)
+            missing = {key: name for key, name in wanted.items() if key not in found}
+            if missing:
+                created = self._create(missing)
+                found.update(self._lookup(missing))
+            self._resolved.update(found)
+        return self._resolved, created
+
+    def forget(self, names: Iterable[str]):
+        """Drop names resolved in a transaction that was rolled back."""
+        for name in names:
+            self._resolved.pop(self.key(name), None)
+
+    def _lookup(self, wanted: Dict[str, str]) -> Dict[str, Tuple[int, int]]:
+        emails = {placeholder_email(key): key for key in wanted}
+        rows = (
+            Employer.objects.annotate(name_lower=Lower("company_name"))
+            .filter(Q(name_lower__in={name.lower() for name in wanted.values()}) | Q(user__email__in=emails))
+            .order_by("pk")
+            .values_list("pk", "user_id", "company_name", "user__email")
+        )
+        found = {}
+        for pk, user_id, company_name, email in rows:
+            key = emails.get(email) or self.key(company_name)
+            if key in wanted:
+                found.setdefault(key, (pk, user_id))  # oldest employer of a name wins
+        return found
+
+    @staticmethod
+    def _create(missing: Dict[str, str]) -> int:
+        users = []
+        for key, name in missing.items():
+            email = placeholder_email(key)
+            user = User(
+                email=email, username=email, first_name=name[:_NAME_MAX], last_name="",
+                is_employer=True, is_active=False,
+            )
+            user.set_unusable_password()
+            users.append(user)
+        User.objects.bulk_create(users, ignore_conflicts=True)
+
+        user_ids = dict(User.objects.filter(email__in=[user.email for user in users]).values_list("email", "pk"))
+        before = Employer.objects.filter(user_id__in=user_ids.values()).count()
+        Employer.objects.bulk_create(
+            [
+                Employer(user_id=user_ids[placeholder_email(key)], company_name=name)
+                for key, name in missing.items()
+            ],
+            ignore_conflicts=True,
+        )
+        return Employer.objects.filter(user_id__in=user_ids.values()).count() - before
+
+
+class JobPromoter:
+    def __init__(self, chunk_size: int = None, resolver: EmployerResolver = None):
+        self.chunk_size = chunk_size or PROMOTION_CHUNK_SIZE
+        self.resolver = resolver or EmployerResolver()
+        self.result = PromotionResult()
+
+    def promote(self, queryset=None) -> PromotionResult:
+        """Promote every not yet promoted ScrapedJob (of `queryset`), chunk by chunk."""
+        queryset = ScrapedJob.objects.all() if queryset is None else queryset
+        pending = queryset.filter(promoted_at__isnull=True).order_by("pk")
+        last_pk = 0
+        while True:
+            chunk = list(pending.filter(pk__gt=last_pk)[:self.chunk_size])
+            if not chunk:
+                return self.result
+            names = [scraped.company_name for scraped in chunk if scraped.company_name.strip()]
+            try:
+                with transaction.atomic():
+                    self._promote_chunk(chunk, names)
+            except Exception:
+                self.resolver.forget(names)
+                raise
+            last_pk = chunk[-1].pk
+
+    def _promote_chunk(self, chunk: List[ScrapedJob], names: List[str]):
+        employers, created = self.resolver.resolve(names)
+        self.result.employers_created += created
+        pattern = get_skill_pattern()
+
+        jobs: List[Optional[Job]] = []
+        tags: List[List[str]] = []
+        for scraped in chunk:
+            if not scraped.company_name.strip():
+                jobs.append(None)
+                tags.append([])
+                continue
+            employer_id, user_id = employers[self.resolver.key(scraped.company_name)]
+            description = scraped.description or ""
+            jobs.append(Job(
+                title=scraped.title[:_TITLE_MAX],
+                company_id=employer_id,
+                posted_by_id=user_id,
+                location=(scraped.location or "")[:_LOCATION_MAX],
+                description=description,
+                requirements="",
+                employment_type=employment_type(scraped.title, description),
+            ))
+            jobs[-1]._company_name = scraped.company_name
+            skills = sorted(pattern.find(f"{scraped.title}\n{description}"))
+            tags.append([skill[:_TAG_MAX] for skill in skills[:PROMOTION_MAX_TAGS]])
+
+        new_jobs = Job.objects.bulk_create([job for job in jobs if job is not None])
+        self._tag(new_jobs, [names for job, names in zip(jobs, tags) if job is not None])
+        self._index(new_jobs)
+        # Matching features too, or the next catalog build would extract them
+        JobFeatureRepository.refresh_many(new_jobs)
+
+        now = timezone.now()
+        for scraped, job in zip(chunk, jobs):
+            scraped.job = job
+            scraped.promoted_at = now
+        ScrapedJob.objects.bulk_update(chunk, ["job", "promoted_at"])
+        transaction.on_commit(invalidate_scraped_jobs)
+
+        self.result.promoted += len(new_jobs)
+        self.result.skipped += len(chunk) - len(new_jobs)
+        if new_jobs:
+            transaction.on_commit(invalidate_job_lists)
+            transaction.on_commit(bump_catalog_version)
+
+    @staticmethod
+    def _tag(jobs: List[Job], tag_names: List[List[str]]):
+        for job, names in zip(jobs, tag_names):
+            job._tag_names = names
+        wanted = {name for names in tag_names for name in names}
+        if not wanted:
+            return
+        JobTag.objects.bulk_create([JobTag(name=name) for name in wanted], ignore_conflicts=True)
+        tag_ids = dict(JobTag.objects.filter(name__in=wanted).values_list("name", "pk"))
+        Job.tags.through.objects.bulk_create(
+            Job.tags.through(job_id=job.pk, jobtag_id=tag_ids[name])
+            for job, names in zip(jobs, tag_names) for name in names
+        )
+
+    @staticmethod
+    def _index(jobs: List[Job]):
+        documents = JobSearchDocument.objects.bulk_create([
+            JobSearchDocument(job_id=job.pk, **build_document_fields(
+                title=job.title,
+                tags=job._tag_names,
+                company_name=job._company_name,
+                location=job.location,
+                requirements=job.requirements,
+                description=job.description,
+            ))
+            for job in jobs
+        ])
+        get_search_backend().index_documents(documents)
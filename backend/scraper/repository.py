@@ -1,42 +1,335 @@
 # scraper/repository.py
-from jobs.models import Job
-from django.db import IntegrityError
-
-class JobRepository:
-    """
-    Repository to handle saving jobs to the database.
-    Includes duplicate detection based on title + company + location.
-    """
-
-    @staticmethod
-    def save_job(job_data: dict):
-        """
-        Save a job to the database if it doesn't already exist.
-        :param job_data: dict with keys: title, company, location, description, salary, employment_type, source
-        :return: Job instance or None if duplicate
-        """
-        # Check for duplicates
-        existing = Job.objects.filter(
-            title=job_data["title"],
-            company=job_data["company"],
-            location=job_data["location"],
-        ).first()
-        if existing:
-            return None  # Duplicate, skip
-
-        # Save new job
-        try:
-            job = Job.objects.create(
-                title=job_data.get("title"),
-                company=job_data.get("company"),
-                location=job_data.get("location"),
-                description=job_data.get("description", ""),
-                requirements=job_data.get("requirements", ""),
-                salary=job_data.get("salary"),
-                employment_type=job_data.get("employment_type", "Full-time"),
-                posted_by=job_data.get("posted_by"),  # optional, can be admin user
-                is_active=True,
-            )
-            return job
-        except IntegrityError:
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .cache import invalidate_scraped_jobs
+from .config import SCRAPE_RUN_TIMEOUT
+from .dedup import LSHIndex, MinHasher, canonical_company, canonical_url, features, fingerprint
+from .incremental import CrawlSession
+from .models import CrawlState, ScrapedJob, ScrapedJobBucket, ScrapeRun
+
+TEXT_MAX_LENGTH = 255
+URL_MAX_LENGTH = ScrapedJob._meta.get_field("job_url").max_length
+
+
+@dataclass
+class IngestResult:
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+    @property
+    def saved(self) -> int:
+        return self.inserted + self.updated
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"inserted": self.inserted, "updated": self.updated, "skipped": self.skipped}
+
+
+class ScrapedJobRepository:
+    """
+    Batched ingestion of scraper output into ScrapedJob (see JobIngestor).
+
+    Records are normalized, deduplicated in memory and written a chunk at a
+    time with a fixed number of queries: the rows already stored for the
+    chunk's URLs, fingerprints and LSH buckets are read up front, and new or
+    changed rows go out in one INSERT ... ON CONFLICT (job_url) DO UPDATE.
+    Skipped: records without a usable title or URL, repeats of a URL,
+    exact (fingerprint) or near (MinHash) duplicates of another posting in
+    the batch or the table, and rows identical to what is stored.
+
+    fingerprint is unique as well as job_url, so a concurrent run storing
+    the same posting under another URL between those reads and the INSERT
+    makes it fail; the chunk is then read and planned again (up to
+    WRITE_ATTEMPTS times), and the posting is skipped as the duplicate it is.
+    """
+
+    FIELDS = ["title", "company_name", "location", "description", "source_website"]
+    WRITE_ATTEMPTS = 3
+
+    @staticmethod
+    def _clean_text(value) -> str:
+        return " ".join(str(value or "").split())[:TEXT_MAX_LENGTH]
+
+    @staticmethod
+    def normalize_url(url) -> Optional[str]:
+        """Canonical job URL that fits ScrapedJob.job_url, or None."""
+        url = canonical_url(url)
+        return url if url and len(url) <= URL_MAX_LENGTH else None
+
+    @classmethod
+    def normalize(cls, job_data: Dict) -> Optional[Dict]:
+        """Map a scraper record onto ScrapedJob fields; None if it cannot be stored."""
+        job_url = cls.normalize_url(job_data.get("url") or job_data.get("job_url"))
+        title = cls._clean_text(job_data.get("title"))
+        if not job_url or not title:
             return None
+        return {
+            "job_url": job_url,
+            "title": title,
+            "company_name": cls._clean_text(job_data.get("company") or job_data.get("company_name")),
+            "location": cls._clean_text(job_data.get("location")),
+            "description": str(job_data.get("description") or "").strip(),
+            "source_website": cls._clean_text(job_data.get("source"))[:100],
+        }
+
+    @classmethod
+    def ingest(cls, jobs: Iterable[Dict], chunk_size: int = 500) -> IngestResult:
+        ingestor = JobIngestor(chunk_size)
+        for job_data in jobs:
+            ingestor.add(job_data)
+        return ingestor.close()
+
+    @classmethod
+    def _write_batch(cls, records: List[Dict], result: IngestResult):
+        """Collapse duplicates within a batch of URL-unique records (the first posting wins), then write it."""
+        hasher = MinHasher()
+        batch_index = LSHIndex()
+        fingerprints = set()
+        batch = []
+        for record in records:
+            cls._sign(record, hasher)
+            keys = record["_buckets"]
+            if record["fingerprint"] in fingerprints or cls._near_duplicate(batch_index, record):
+                result.skipped += 1
+                continue
+            fingerprints.add(record["fingerprint"])
+            batch_index.add(keys, record["job_url"], record["minhash"])
+            batch.append(record)
+        if batch:
+            cls._write_chunk(batch, result)
+
+    @staticmethod
+    def _near_duplicate(index: LSHIndex, record: Dict, exclude: str = None) -> bool:
+        # Without a description only title and location are left to compare,
+        # and the same title at the same company is often a separate opening
+        if not record["description"]:
+            return False
+        return index.match(record["_buckets"], record["minhash"], exclude=exclude) is not None
+
+    @staticmethod
+    def _sign(record: Dict, hasher: MinHasher):
+        record["fingerprint"] = fingerprint(record)
+        record["minhash"] = hasher.signature(features(record))
+        record["_buckets"] = hasher.bucket_keys(record["minhash"], canonical_company(record["company_name"]))
+
+    @classmethod
+    def _write_chunk(cls, records: List[Dict], result: IngestResult):
+        for attempt in range(1, cls.WRITE_ATTEMPTS + 1):
+            counts = IngestResult()
+            rows, buckets, stored = cls._plan_chunk(records, counts)
+            try:
+                cls._store_chunk(rows, buckets, stored)
+            except IntegrityError as e:
+                if attempt == cls.WRITE_ATTEMPTS:
+                    raise
+                print(f"[ScrapedJobRepository] Chunk conflicted with a concurrent ingest ({e}); re-reading it.")
+                continue
+            result.inserted += counts.inserted
+            result.updated += counts.updated
+            result.skipped += counts.skipped
+            return
+
+    @classmethod
+    def _plan_chunk(cls, records: List[Dict], counts: IngestResult):
+        """(rows to upsert, LSH bucket keys by URL, stored rows by URL), counting into `counts`."""
+        urls = [record["job_url"] for record in records]
+        stored = {
+            row["job_url"]: row
+            for row in ScrapedJob.objects.filter(job_url__in=urls).values("job_url", "fingerprint", *cls.FIELDS)
+        }
+        owners = dict(
+            ScrapedJob.objects.filter(
+                fingerprint__in=[record["fingerprint"] for record in records]
+            ).values_list("fingerprint", "job_url")
+        )
+        stored_index = LSHIndex()
+        for key, job_url, signature in ScrapedJobBucket.objects.filter(
+            key__in={key for record in records for key in record["_buckets"]}
+        ).values_list("key", "job__job_url", "job__minhash"):
+            stored_index.add([key], job_url, signature)
+
+        rows, buckets = [], {}
+        for record in records:
+            job_url = record["job_url"]
+            owner = owners.get(record["fingerprint"], job_url)
+            if owner != job_url or cls._near_duplicate(stored_index, record, exclude=job_url):
+                # Another stored posting (e.g. from a different site) is the same job
+                counts.skipped += 1
+                continue
+
+            current = stored.get(job_url)
+            if current is None:
+                counts.inserted += 1
+            elif current["fingerprint"] != record["fingerprint"] or any(
+                (current[name] or "") != record[name] for name in cls.FIELDS
+            ):
+                counts.updated += 1
+            else:
+                counts.skipped += 1
+                continue
+            buckets[job_url] = record["_buckets"]
+            rows.append(ScrapedJob(
+                job_url=job_url, fingerprint=record["fingerprint"], minhash=record["minhash"],
+                **{name: record[name] for name in cls.FIELDS},
+            ))
+        return rows, buckets, stored
+
+    @classmethod
+    def _store_chunk(cls, rows: List[ScrapedJob], buckets: Dict[str, List], stored: Dict[str, Dict]):
+        if not rows:
+            return
+        with transaction.atomic():
+            ScrapedJob.objects.bulk_create(
+                rows, update_conflicts=True, unique_fields=["job_url"],
+                update_fields=[*cls.FIELDS, "fingerprint", "minhash", "updated_at"],
+            )
+            ids = dict(ScrapedJob.objects.filter(job_url__in=buckets).values_list("job_url", "id"))
+            updated_ids = [ids[url] for url in buckets if url in stored]
+            if updated_ids:
+                ScrapedJobBucket.objects.filter(job_id__in=updated_ids).delete()
+            ScrapedJobBucket.objects.bulk_create(
+                ScrapedJobBucket(job_id=ids[url], key=key) for url, keys in buckets.items() for key in keys
+            )
+            transaction.on_commit(invalidate_scraped_jobs)
+
+
+class JobIngestor:
+    """
+    Streaming front end of ScrapedJobRepository.ingest: records are add()ed
+    as scrapers produce them and written whenever `chunk_size` distinct
+    URLs are buffered, so memory stays bounded and every flushed chunk is
+    committed even if the run dies later. Duplicates of postings from
+    earlier chunks are caught through the stored URLs, fingerprints and
+    LSH buckets of those chunks. on_flush(result) is called after each
+    chunk is written, with the running totals.
+    """
+
+    def __init__(self, chunk_size: int = 500, on_flush: Callable[[IngestResult], None] = None):
+        self.chunk_size = chunk_size
+        self.on_flush = on_flush
+        self.result = IngestResult()
+        self._buffer: Dict[str, Dict] = {}
+
+    def add(self, job_data: Dict):
+        record = ScrapedJobRepository.normalize(job_data)
+        if record is None:
+            self.result.skipped += 1
+            return
+        seen = self._buffer.get(record["job_url"])
+        if seen is None:
+            self._buffer[record["job_url"]] = record
+            if len(self._buffer) >= self.chunk_size:
+                self.flush()
+            return
+        # Same posting listed twice (e.g. on two result pages): keep the
+        # first copy, filling in anything it was missing
+        self.result.skipped += 1
+        for name in ScrapedJobRepository.FIELDS:
+            if not seen[name] and record[name]:
+                seen[name] = record[name]
+
+    def flush(self):
+        records, self._buffer = list(self._buffer.values()), {}
+        if records:
+            ScrapedJobRepository._write_batch(records, self.result)
+            if self.on_flush is not None:
+                self.on_flush(self.result)
+
+    def close(self) -> IngestResult:
+        self.flush()
+        return self.result
+
+
+class CrawlStateRepository:
+    """
+    Loads and stores per-source crawl state for incremental runs.
+    """
+
+    @staticmethod
+    def load(sources: Iterable[str]) -> Dict[str, CrawlSession]:
+        """A session per source; sources never crawled start empty."""
+        sources = list(sources)
+        stored = {state.source: state for state in CrawlState.objects.filter(source__in=sources)}
+        return {
+            source: CrawlSession(source, stored[source].seen_urls, stored[source].pages)
+            if source in stored else CrawlSession(source)
+            for source in sources
+        }
+
+    @staticmethod
+    def save(sessions: Iterable[CrawlSession]):
+        """Persist sessions once the jobs they saw have been ingested."""
+        states = [CrawlState(source=session.source, **session.updated_state()) for session in sessions]
+        if states:
+            CrawlState.objects.bulk_create(
+                states, update_conflicts=True, unique_fields=["source"],
+                update_fields=["seen_urls", "pages", "last_run_at", "updated_at"],
+            )
+
+
+class ScrapeRunRepository:
+    """
+    Progress of a background ScrapeRun. Writes are small UPDATEs of the run
+    row made as chunks and sites finish, so the status endpoint follows the
+    run while it streams.
+    """
+
+    @staticmethod
+    def claim(run_id: int) -> Optional[ScrapeRun]:
+        """Mark a queued run as running; None if it was already picked up."""
+        claimed = ScrapeRun.objects.filter(pk=run_id, status=ScrapeRun.STATUS_QUEUED).update(
+            status=ScrapeRun.STATUS_RUNNING, started_at=timezone.now()
+        )
+        return ScrapeRun.objects.get(pk=run_id) if claimed else None
+
+    @staticmethod
+    def expire_stale(timeout: float = None) -> int:
+        """Mark runs unfinished after SCRAPE_RUN_TIMEOUT seconds failed; returns how many."""
+        now = timezone.now()
+        cutoff = now - timedelta(seconds=timeout or SCRAPE_RUN_TIMEOUT)
+        return ScrapeRun.objects.filter(
+            status__in=[ScrapeRun.STATUS_QUEUED, ScrapeRun.STATUS_RUNNING], created_at__lt=cutoff
+        ).update(
+            status=ScrapeRun.STATUS_FAILED, finished_at=now,
+            error="Run did not finish in time; its worker stopped (process restart?)",
+        )
+
+    @staticmethod
+    def start_sites(run: ScrapeRun, sites: Iterable[str]):
+        run.sites = {name: {"status": ScrapeRun.STATUS_RUNNING, "jobs_found": 0} for name in sites}
+        run.save(update_fields=["sites"])
+
+    @staticmethod
+    def progress(run: ScrapeRun, found: Dict[str, int], result: IngestResult):
+        """Jobs found per site so far and the ingest totals after a written chunk."""
+        for name, count in found.items():
+            run.sites.setdefault(name, {})["jobs_found"] = count
+        run.jobs_found = sum(found.values())
+        run.inserted, run.updated, run.skipped = result.inserted, result.updated, result.skipped
+        run.save(update_fields=["sites", "jobs_found", "inserted", "updated", "skipped"])
+
+    @staticmethod
+    def site_done(run: ScrapeRun, site_result):
+        """Record a finished site's SiteResult report."""
+        run.sites[site_result.site] = {"status": site_result.status, **site_result.as_dict()}
+        run.save(update_fields=["sites"])
+
+    @staticmethod
+    def finish(run: ScrapeRun, result: IngestResult = None, error: str = "", promoted: int = None):
+        run.status = ScrapeRun.STATUS_FAILED if error else ScrapeRun.STATUS_SUCCEEDED
+        run.error = error
+        run.finished_at = timezone.now()
+        fields = ["status", "error", "finished_at"]
+        if result is not None:
+            run.jobs_found = sum(site.get("jobs_found", 0) for site in run.sites.values())
+            run.inserted, run.updated, run.skipped = result.inserted, result.updated, result.skipped
+            fields += ["jobs_found", "inserted", "updated", "skipped"]
+        if promoted is not None:
+            run.promoted = promoted
+            fields.append("promoted")
+        run.save(update_fields=fields)
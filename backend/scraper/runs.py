@@ -0,0 +1,83 @@
+"""
+Background scrape runs.
+
+Scraping is never done inside an HTTP request: start_scrape_run() records
+a queued ScrapeRun and hands it to a Celery worker, or, when Celery is
+off, to a thread of the current process, and returns at once. The run is
+picked up by execute_scrape_run(), which streams the scrapers through
+scraper.pipeline and keeps the ScrapeRun row up to date (per-site status,
+jobs found, inserted/updated/skipped, timings) for the status endpoint.
+With PROMOTE_SCRAPED_JOBS on, the new postings are then promoted into
+the job board by scraper.promotion. A run whose worker disappears (the
+thread dies with its process) is marked failed once SCRAPE_RUN_TIMEOUT
+has passed, see ScrapeRunRepository.expire_stale.
+"""
+
+import threading
+from typing import Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+from scraper.config import PROMOTE_SCRAPED_JOBS
+from scraper.models import ScrapeRun
+from scraper.pipeline import run_pipeline
+from scraper.promotion import JobPromoter
+from scraper.repository import ScrapeRunRepository
+from scraper.services import ScraperService
+
+
+def start_scrape_run(keyword: str = None, location: str = None, full_refresh: bool = False,
+                     requested_by=None) -> ScrapeRun:
+    """Queue a scrape and dispatch it once the ScrapeRun is committed."""
+    run = ScrapeRun.objects.create(
+        keyword=keyword or "", location=location or "", full_refresh=full_refresh,
+        requested_by=requested_by,
+    )
+    transaction.on_commit(lambda: dispatch_scrape_run(run.pk))
+    return run
+
+
+def dispatch_scrape_run(run_id: int):
+    if settings.CELERY_ENABLED:
+        from scraper.tasks import run_scrape_task
+
+        task = run_scrape_task.delay(run_id)
+        ScrapeRun.objects.filter(pk=run_id).update(task_id=task.id)
+    else:
+        threading.Thread(
+            target=_run_in_thread, args=(run_id,), name=f"scrape-run-{run_id}", daemon=True
+        ).start()
+
+
+def _run_in_thread(run_id: int):
+    close_old_connections()
+    try:
+        execute_scrape_run(run_id)
+    except Exception as e:
+        print(f"[ScrapeRun {run_id}] failed: {e}")
+    finally:
+        connection.close()
+
+
+def execute_scrape_run(run_id: int) -> Optional[ScrapeRun]:
+    """Run a queued ScrapeRun to completion; None if another worker has it."""
+    run = ScrapeRunRepository.claim(run_id)
+    if run is None:
+        return None
+    service = ScraperService(
+        keyword=run.keyword or None, location=run.location or None, incremental=not run.full_refresh
+    )
+    try:
+        ScrapeRunRepository.start_sites(run, service.enabled_sites())
+        result = run_pipeline(service, run=run)
+        promoted = JobPromoter().promote().promoted if PROMOTE_SCRAPED_JOBS else None
+    except Exception as e:
+        ScrapeRunRepository.finish(run, error=f"{type(e).__name__}: {e}")
+        raise
+    ScrapeRunRepository.finish(run, result, promoted=promoted)
+    print(
+        f"[ScrapeRun {run.pk}] finished: {run.jobs_found} found, {result.inserted} new, "
+        f"{result.updated} updated, {result.skipped} skipped, {run.promoted} promoted."
+    )
+    return run
@@ -0,0 +1,119 @@
+import threading
+import unittest
+
+from scraper.driver_pool import DriverPool, DriverPoolExhausted
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.visited = []
+        self.cookies_cleared = 0
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class DriverPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.drivers = []
+
+    def factory(self):
+        driver = FakeDriver()
+        self.drivers.append(driver)
+        return driver
+
+    def test_driver_is_reused_and_reset_between_leases(self):
+        pool = DriverPool(size=1, max_pages=10, factory=self.factory)
+        with pool.driver() as driver:
+            driver.get("https://example.com/jobs")
+        with pool.driver() as driver:
+            driver.get("https://example.com/jobs?page=2")
+
+        self.assertEqual(pool.created, 1)
+        raw = self.drivers[0]
+        self.assertEqual(raw.cookies_cleared, 2)
+        self.assertEqual(raw.visited[1], "about:blank")
+        self.assertFalse(raw.quit_called)
+
+    def test_driver_is_recycled_after_max_pages(self):
+        pool = DriverPool(size=1, max_pages=2, factory=self.factory)
+        with pool.driver() as driver:
+            driver.get("https://example.com/1")
+            driver.get("https://example.com/2")
+        with pool.driver():
+            pass
+
+        self.assertEqual(pool.created, 2)
+        self.assertTrue(self.drivers[0].quit_called)
+
+    def test_dead_driver_is_replaced(self):
+        pool = DriverPool(size=1, factory=self.factory)
+        with pool.driver():
+            pass
+        self.drivers[0].alive = False
+        with pool.driver() as driver:
+            self.assertIs(driver._driver, self.drivers[1])
+
+        self.assertTrue(self.drivers[0].quit_called)
+
+    def test_driver_is_discarded_when_scrape_fails(self):
+        pool = DriverPool(size=1, factory=self.factory)
+        with self.assertRaises(ValueError):
+            with pool.driver():
+                raise ValueError("bad page")
+
+        self.assertTrue(self.drivers[0].quit_called)
+        with pool.driver():
+            pass
+        self.assertEqual(pool.created, 2)
+
+    def test_size_bounds_concurrent_leases(self):
+        pool = DriverPool(size=1, factory=self.factory)
+        leased = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with pool.driver():
+                leased.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        leased.wait(5)
+        try:
+            with self.assertRaises(DriverPoolExhausted):
+                with pool.driver(timeout=0.05):
+                    pass
+        finally:
+            release.set()
+            holder.join()
+
+        with pool.driver(timeout=1):
+            pass
+        self.assertEqual(pool.created, 1)
+
+    def test_close_quits_idle_drivers(self):
+        pool = DriverPool(size=2, factory=self.factory)
+        with pool.driver(), pool.driver():
+            pass
+        pool.close()
+
+        self.assertEqual(len(self.drivers), 2)
+        self.assertTrue(all(driver.quit_called for driver in self.drivers))
+
+
+if __name__ == "__main__":
+    unittest.main()
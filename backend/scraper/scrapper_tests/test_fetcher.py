@@ -0,0 +1,185 @@
+# scraper/tests/test_fetcher.py
+import gzip
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from scraper.config import JOB_SITES
+from scraper.fetcher import AsyncFetcher
+from scraper.parsers.indeed_scraper import IndeedScraper
+
+CARD = """
+<div class="job_seen_beacon">
+  <h2 class="jobTitle"><a href="/viewjob?jk={key}"><span>{title}</span></a></h2>
+  <span class="companyName">{company}</span>
+  <div class="companyLocation">Lagos</div>
+</div>
+"""
+
+
+def results_page(start, per_page=2):
+    cards = "".join(
+        CARD.format(title=f"Developer {start + i}", company="TechCorp", key=f"job{start + i}")
+        for i in range(per_page)
+    )
+    return f"<html><body><div id='results'>{cards}</div></body></html>"
+
+
+class FixtureServer:
+    """
+    Local stand-in for a paginated job site: ?start=N serves jobs N, N+1.
+    Pages carry an ETag that changes with `version` and honour If-None-Match;
+    /fail paths answer 503, with a Retry-After when `retry_after` is set.
+    """
+
+    def __init__(self, last_start=20, delay=0.05):
+        server = self
+        self.version = 1
+        self.paths = []
+        self.times = []
+        self.retry_after = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.connections = set()
+        self.gzipped = 0
+        self.lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                with server.lock:
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    server.connections.add(self.client_address)
+                    server.paths.append(self.path)
+                    server.times.append(time.monotonic())
+                time.sleep(delay)
+                query = parse_qs(urlparse(self.path).query)
+                start = int(query.get("start", ["0"])[0])
+                etag = f'"v{server.version}-{start}"'
+                if self.headers.get("If-None-Match") == etag:
+                    with server.lock:
+                        server.in_flight -= 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = (results_page(start) if start <= last_start else "<html></html>").encode()
+                headers = {"Content-Type": "text/html; charset=utf-8", "ETag": etag}
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    headers["Content-Encoding"] = "gzip"
+                    with server.lock:
+                        server.gzipped += 1
+                with server.lock:
+                    server.in_flight -= 1
+                if "fail" in self.path:
+                    self.send_response(503)
+                    if server.retry_after is not None:
+                        self.send_header("Retry-After", str(server.retry_after))
+                else:
+                    self.send_response(200)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestAsyncFetcher(unittest.TestCase):
+    def setUp(self):
+        self.server = FixtureServer()
+        self.addCleanup(self.server.close)
+
+    def test_fan_out_respects_per_host_limit_and_reuses_connections(self):
+        requests = [(f"{self.server.url}/jobs", {"start": n}) for n in range(12)]
+
+        with AsyncFetcher(limit_per_host=3) as fetcher:
+            start = time.monotonic()
+            pages = fetcher.fetch_pages(requests)
+            elapsed = time.monotonic() - start
+
+        self.assertTrue(all(page.ok for page in pages))
+        self.assertIn("Developer 5", pages[5].text)  # order kept, gzip decoded
+        self.assertEqual(self.server.gzipped, 12)
+        self.assertLessEqual(self.server.max_in_flight, 3)
+        self.assertLessEqual(len(self.server.connections), 3)
+        self.assertLess(elapsed, 12 * 0.05)
+
+    def test_batches_share_the_session_until_closed(self):
+        fetcher = AsyncFetcher(limit_per_host=1)
+        self.addCleanup(fetcher.close)
+        for n in range(3):
+            [page] = fetcher.fetch_pages([(f"{self.server.url}/jobs", {"start": n})])
+            self.assertTrue(page.ok)
+        self.assertEqual(len(self.server.connections), 1)
+
+        fetcher.close()
+        self.assertTrue(fetcher.fetch_pages([(f"{self.server.url}/jobs", None)])[0].ok)
+        self.assertEqual(len(self.server.connections), 2)
+
+    def test_http_errors_are_reported_per_page(self):
+        with AsyncFetcher() as fetcher:
+            pages = fetcher.fetch_pages([
+                (f"{self.server.url}/jobs", None),
+                (f"{self.server.url}/fail", None),
+                ("http://127.0.0.1:9/unreachable", None),
+            ])
+        self.assertTrue(pages[0].ok)
+        self.assertEqual((pages[1].status, pages[1].error), (503, "HTTP 503"))
+        self.assertIsNone(pages[2].status)
+        self.assertIn("Error", pages[2].error)
+
+
+class TestStaticHTMLScraper(unittest.TestCase):
+    def setUp(self):
+        self.server = FixtureServer(last_start=20)
+        self.addCleanup(self.server.close)
+        site = patch.dict(JOB_SITES["indeed"], {"base_url": f"{self.server.url}/jobs", "max_pages": 5})
+        site.start()
+        self.addCleanup(site.stop)
+
+    def test_paginated_pages_are_parsed_with_the_existing_parser(self):
+        jobs = IndeedScraper("python", "Lagos").fetch_jobs()
+        # start=0,10,20 have results; start=30 is empty and ends the listing
+        self.assertEqual(
+            [job["title"] for job in jobs],
+            ["Developer 0", "Developer 1", "Developer 10", "Developer 11", "Developer 20", "Developer 21"],
+        )
+        self.assertEqual(jobs[0]["company"], "TechCorp")
+        self.assertEqual(jobs[0]["source"], "Indeed")
+        self.assertEqual(jobs[0]["url"], f"{self.server.url}/viewjob?jk=job0")
+
+    def test_page_requests(self):
+        scraper = IndeedScraper("python", "Lagos", max_pages=3)
+        self.assertEqual(
+            [params for _, params in scraper.page_requests()],
+            [{"q": "python", "l": "Lagos"},
+             {"q": "python", "l": "Lagos", "start": 10},
+             {"q": "python", "l": "Lagos", "start": 20}],
+        )
+
+    def test_first_page_failure_raises_for_retry(self):
+        with patch.dict(JOB_SITES["indeed"], {"base_url": f"{self.server.url}/fail"}):
+            with self.assertRaises(Exception):
+                IndeedScraper("python", "Lagos").fetch_jobs()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from scraper.config import FETCH_PER_HOST, JOB_SITES
+from scraper.incremental import CrawlSession
+from scraper.models import CrawlState
+from scraper.parsers.indeed_scraper import IndeedScraper
+from scraper.pipeline import run_pipeline
+from scraper.scrapper_tests.test_fetcher import FixtureServer
+from scraper.services import ScraperService
+
+
+class IncrementalScrapeTests(TestCase):
+    def setUp(self):
+        self.server = FixtureServer(last_start=40, delay=0.01)
+        self.addCleanup(self.server.close)
+        site = patch.dict(JOB_SITES["indeed"], {
+            "base_url": f"{self.server.url}/jobs", "max_pages": 5, "enabled": True,
+        })
+        site.start()
+        self.addCleanup(site.stop)
+
+    def scrape(self, full_refresh=False):
+        service = ScraperService("python", "Lagos", sites={"indeed": JOB_SITES["indeed"]},
+                                 incremental=not full_refresh)
+        return run_pipeline(service).inserted
+
+    def test_unchanged_site_is_answered_by_one_conditional_get(self):
+        self.assertEqual(self.scrape(), 10)
+        state = CrawlState.objects.get(source="indeed")
+        self.assertEqual(len(state.seen_urls), 10)
+        self.assertEqual(len(state.pages), 5)
+
+        self.server.paths.clear()
+        # the first wave (per-host limit) is in flight before page 1 answers 304
+        self.assertEqual(self.scrape(), 0)
+        self.assertEqual(len(self.server.paths), FETCH_PER_HOST)
+        self.assertIsNotNone(CrawlState.objects.get(source="indeed").last_run_at)
+
+    def test_pagination_stops_at_already_ingested_listings(self):
+        self.scrape()
+        state = CrawlState.objects.get(source="indeed")
+        # as if job0 and job1 were posted since, on a page with new markup
+        session = CrawlSession("indeed", seen_urls=[
+            url for url in state.seen_urls if not url.endswith(("jk=job0", "jk=job1"))
+        ])
+
+        scraper = IndeedScraper("python", "Lagos")
+        scraper.crawl = session
+        jobs = scraper.fetch_jobs()
+
+        self.assertEqual([job["title"] for job in jobs], ["Developer 0", "Developer 1", "Developer 10", "Developer 11"])
+
+    def test_full_refresh_fetches_every_page(self):
+        self.scrape()
+        self.server.paths.clear()
+
+        self.assertEqual(self.scrape(full_refresh=True), 0)  # all stored already
+        self.assertEqual(len(self.server.paths), 5)
+
+    def test_failed_sites_keep_their_state(self):
+        CrawlState.objects.create(source="indeed", seen_urls=["https://x.example.com/1"])
+        service = ScraperService("python", "Lagos", max_attempts=1, incremental=True,
+                                 sites={"indeed": JOB_SITES["indeed"]})
+        with patch.dict(JOB_SITES["indeed"], {"base_url": f"{self.server.url}/fail"}):
+            service.run_all_scrapers()
+        service.commit_crawl_state()
+
+        self.assertEqual(CrawlState.objects.get().seen_urls, ["https://x.example.com/1"])
+
+
+class CrawlSessionTests(TestCase):
+    def test_new_listings_go_first_and_state_is_bounded(self):
+        session = CrawlSession("demo", seen_urls=["https://a.example.com/1"])
+        with patch("scraper.incremental.INCREMENTAL_SEEN_LIMIT", 2):
+            for url in ("https://A.example.com/2#top", "https://a.example.com/1", "https://a.example.com/3"):
+                session.saw({"url": url})
+            state = session.updated_state()
+        self.assertEqual(state["seen_urls"], ["https://a.example.com/2", "https://a.example.com/3"])
+
+    def test_reached_known_uses_the_stop_ratio(self):
+        session = CrawlSession("demo", seen_urls=["https://a.example.com/1"])
+        self.assertTrue(session.reached_known([{"url": "https://a.example.com/1"}, {"url": "https://a.example.com/2"}]))
+        self.assertFalse(session.reached_known([{"url": "https://a.example.com/2"}]))
+        self.assertFalse(session.reached_known([]))
@@ -1,54 +1,50 @@
 import unittest
-from unittest.mock import patch, MagicMock
-from scraper.services import ScraperService
+from unittest.mock import MagicMock
+
+from scraper.fetcher import FetchResult
+from scraper.parsers.indeed_scraper import IndeedScraper
+
+PAGE = """
+<div class="job_seen_beacon" data-jk="1">
+  <h2 class="jobTitle"><a href="/rc/clk?jk=1"><span>Python Developer</span></a></h2>
+  <span class="companyName">TechCorp</span><div class="companyLocation">Lagos</div>
+</div>
+<div class="job_seen_beacon" data-jk="2">
+  <h2 class="jobTitle"><a href="/rc/clk?jk=2"><span>Data Engineer</span></a></h2>
+  <span class="companyName">TechCorp</span><div class="companyLocation">Abuja</div>
+</div>
+"""
 
-class TestIndeedScraper(unittest.TestCase):
 
-    @patch("scraper.services.webdriver.Chrome")
-    def test_scrape_indeed_returns_jobs(self, mock_driver_class):
+class TestIndeedScraper(unittest.TestCase):
+    def test_scrape_indeed_returns_jobs(self):
         """
-        Test that ScraperService.scrape_indeed returns a list of jobs
+        Test that IndeedScraper returns a list of jobs
         with the expected fields.
         """
 
-        # Mock Chrome driver
-        mock_driver = MagicMock()
-        mock_driver_class.return_value = mock_driver
-
-        # Mock individual job element
-        mock_elem = MagicMock()
+        # One results page, then an empty one
+        fetcher = MagicMock(limit_per_host=4)
+        fetcher.fetch_pages.return_value = [
+            FetchResult(url="https://www.indeed.com/jobs", status=200, text=PAGE),
+            FetchResult(url="https://www.indeed.com/jobs?start=10", status=200, text="<html></html>"),
+        ]
 
-        def find_element_side_effect(by, selector):
-            if "jobTitle" in selector:
-                return MagicMock(text="Python Developer")
-            elif "companyName" in selector:
-                return MagicMock(text="TechCorp")
-            elif "companyLocation" in selector:
-                return MagicMock(text="Lagos")
-            elif selector == "a":
-                return MagicMock(get_attribute=lambda attr: "https://indeed.com/job/1")
-            else:
-                return MagicMock(text="")
-
-        mock_elem.find_element.side_effect = find_element_side_effect
-
-        # Simulate multiple job elements on the page
-        mock_driver.find_elements.return_value = [mock_elem, mock_elem]
-
-        # Initialize ScraperService (keyword/location can be anything)
-        service = ScraperService(keyword="Python", location="Lagos")
-        jobs = service.scrape_indeed()
+        # Initialize the scraper (keyword/location can be anything)
+        scraper = IndeedScraper("Python", "Lagos", max_pages=2, fetcher=fetcher)
+        jobs = scraper.fetch_jobs()
 
         # --- Assertions ---
         self.assertIsInstance(jobs, list)
-        self.assertGreaterEqual(len(jobs), 1)
+        self.assertEqual(len(jobs), 2)
 
         first_job = jobs[0]
         self.assertEqual(first_job["title"], "Python Developer")
         self.assertEqual(first_job["company"], "TechCorp")
         self.assertEqual(first_job["location"], "Lagos")
-        self.assertEqual(first_job["source"], "indeed")
-        self.assertTrue(first_job["url"].startswith("https://indeed.com"))
+        self.assertEqual(first_job["source"], "Indeed")
+        self.assertTrue(first_job["url"].startswith("https://www.indeed.com/rc/clk?jk=1"))
+
 
 if __name__ == "__main__":
     unittest.main()
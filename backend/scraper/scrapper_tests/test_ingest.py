@@ -0,0 +1,171 @@
+from unittest.mock import patch
+
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from scraper.dedup import MinHasher, canonical_company, features, fingerprint
+from scraper.models import ScrapedJob
+from scraper.repository import ScrapedJobRepository
+
+
+def scraped(n, **extra):
+    return {
+        "title": f"  Backend   Developer {n} ",
+        "company": "NextGen",
+        "location": "Lagos",
+        "url": f"https://Jobs.Example.com/view/{n}#apply",
+        "source": "jobberman",
+        **extra,
+    }
+
+
+class ScrapedJobIngestTests(TestCase):
+    def test_normalizes_and_inserts_new_jobs(self):
+        result = ScrapedJobRepository.ingest([scraped(1), scraped(2)])
+
+        self.assertEqual(result.as_dict(), {"inserted": 2, "updated": 0, "skipped": 0})
+        job = ScrapedJob.objects.get(job_url="https://jobs.example.com/view/1")
+        self.assertEqual(job.title, "Backend Developer 1")
+        self.assertEqual(job.company_name, "NextGen")
+        self.assertEqual(job.source_website, "jobberman")
+
+    def test_duplicates_and_invalid_records_are_skipped(self):
+        jobs = [
+            scraped(1),
+            scraped(1, location="", description="Build APIs"),
+            scraped(2, url=""),
+            scraped(3, title="  "),
+            scraped(4, url="javascript:void(0)"),
+        ]
+        result = ScrapedJobRepository.ingest(jobs)
+
+        self.assertEqual(result.as_dict(), {"inserted": 1, "updated": 0, "skipped": 4})
+        job = ScrapedJob.objects.get()
+        # the first copy wins, gaps are filled from the repeat
+        self.assertEqual(job.location, "Lagos")
+        self.assertEqual(job.description, "Build APIs")
+
+    def test_rescrape_updates_changed_rows_only(self):
+        ScrapedJobRepository.ingest([scraped(1), scraped(2)])
+
+        result = ScrapedJobRepository.ingest([scraped(1), scraped(2, location="Abuja"), scraped(3)])
+
+        self.assertEqual(result.as_dict(), {"inserted": 1, "updated": 1, "skipped": 1})
+        self.assertEqual(ScrapedJob.objects.count(), 3)
+        self.assertEqual(
+            ScrapedJob.objects.get(job_url="https://jobs.example.com/view/2").location, "Abuja"
+        )
+
+    def test_queries_scale_with_chunks_not_rows(self):
+        ScrapedJobRepository.ingest([scraped(n) for n in range(50)])
+        jobs = [scraped(n, location="Remote") for n in range(100)]
+
+        # a fixed set of statements per chunk, not one or two per row
+        with CaptureQueriesContext(connection) as queries:
+            result = ScrapedJobRepository.ingest(jobs, chunk_size=60)
+
+        self.assertLess(len(queries), 25)
+        self.assertEqual(result.as_dict(), {"inserted": 50, "updated": 50, "skipped": 0})
+        self.assertEqual(ScrapedJob.objects.filter(location="Remote").count(), 100)
+
+    def test_reworded_repost_is_an_exact_duplicate(self):
+        result = ScrapedJobRepository.ingest([
+            {"title": "Senior Python Developer", "company": "NextGen", "location": "Lagos",
+             "url": "https://jobberman.com/jobs/1", "source": "jobberman"},
+            {"title": "Sr. Python Dev", "company": "NextGen Ltd.", "location": "Lagos",
+             "url": "https://linkedin.com/jobs/9", "source": "linkedin"},
+        ])
+
+        self.assertEqual(result.as_dict(), {"inserted": 1, "updated": 0, "skipped": 1})
+        self.assertEqual(ScrapedJob.objects.get().source_website, "jobberman")
+
+    def test_near_duplicate_of_stored_posting_is_skipped(self):
+        description = (
+            "We are hiring a backend engineer to design and build scalable APIs with "
+            "Django and PostgreSQL, mentor junior developers and own our CI pipelines. "
+        )
+        ScrapedJobRepository.ingest([scraped(1, description=description * 3, location="Lagos")])
+
+        result = ScrapedJobRepository.ingest([
+            # another site, same posting with a slightly different footer
+            scraped(2, title="Backend Developer 1", location="Lagos, Nigeria",
+                    url="https://other.example.com/p/77",
+                    description=description * 3 + "Apply before Friday."),
+            # same title elsewhere is a different job
+            scraped(1, company="Acme", url="https://other.example.com/p/78",
+                    description=description * 3),
+        ])
+
+        self.assertEqual(result.as_dict(), {"inserted": 1, "updated": 0, "skipped": 1})
+        self.assertEqual(
+            sorted(ScrapedJob.objects.values_list("company_name", flat=True)), ["Acme", "NextGen"]
+        )
+        self.assertEqual(ScrapedJob.objects.get(company_name="Acme").lsh_buckets.count(), 16)
+
+    def test_same_title_in_another_city_is_a_separate_job(self):
+        ScrapedJobRepository.ingest([{"title": "Python Developer", "company": "Acme", "location": "Lagos",
+                                      "url": "https://jobs.example.com/1", "source": "jobberman"}])
+        result = ScrapedJobRepository.ingest([
+            {"title": "Python Developer", "company": "Acme", "location": location,
+             "url": f"https://jobs.example.com/{n}", "source": "jobberman"}
+            for n, location in ((2, "Abuja"), (3, "Port Harcourt"))
+        ])
+
+        self.assertEqual(result.as_dict(), {"inserted": 2, "updated": 0, "skipped": 0})
+        self.assertEqual(
+            sorted(ScrapedJob.objects.values_list("location", flat=True)), ["Abuja", "Lagos", "Port Harcourt"]
+        )
+
+    def test_posting_stored_concurrently_under_another_url_is_skipped(self):
+        record = ScrapedJobRepository.normalize(scraped(1))
+        write = ScrapedJobRepository._store_chunk
+        raced = []
+
+        def concurrent_ingest(*args):
+            if not raced:  # another run stores the same posting after the chunk was read
+                raced.append(ScrapedJob.objects.create(
+                    job_url="https://other.example.com/p/1", fingerprint=fingerprint(record), **{
+                        name: record[name] for name in ScrapedJobRepository.FIELDS
+                    },
+                ))
+            return write(*args)
+
+        with patch.object(ScrapedJobRepository, "_store_chunk", side_effect=concurrent_ingest) as store:
+            result = ScrapedJobRepository.ingest([scraped(1), scraped(2)])
+
+        self.assertEqual(store.call_count, 2)
+        self.assertEqual(result.as_dict(), {"inserted": 1, "updated": 0, "skipped": 1})
+        self.assertEqual(
+            sorted(ScrapedJob.objects.values_list("job_url", flat=True)),
+            ["https://jobs.example.com/view/2", "https://other.example.com/p/1"],
+        )
+
+    def test_persistent_conflicts_are_raised(self):
+        with patch.object(ScrapedJobRepository, "_store_chunk", side_effect=IntegrityError("fingerprint")) as store:
+            with self.assertRaises(IntegrityError):
+                ScrapedJobRepository.ingest([scraped(1)])
+        self.assertEqual(store.call_count, ScrapedJobRepository.WRITE_ATTEMPTS)
+
+
+class DedupTests(SimpleTestCase):
+    def test_fingerprint_canonicalizes_title_company_and_location(self):
+        first = {"title": "Sr. Python Dev", "company_name": "NextGen Ltd", "location": "Lagos,  NG"}
+        second = {"title": "senior python developer", "company_name": "NEXTGEN", "location": "lagos ng"}
+
+        self.assertEqual(fingerprint(first), fingerprint(second))
+        self.assertNotEqual(fingerprint(first), fingerprint({**second, "description": "Django APIs"}))
+        self.assertEqual(canonical_company("Acme Holdings Inc."), "acme holdings")
+
+    def test_similar_postings_share_a_bucket(self):
+        hasher = MinHasher()
+        text = "build and run data pipelines in python and airflow for the analytics team " * 2
+        base = {"title": "Data Engineer", "description": text}
+        signature = hasher.signature(features(base))
+        repost = hasher.signature(features({**base, "description": text + "remote friendly"}))
+        other = hasher.signature(features({"title": "Accountant", "description": "ledgers and audits"}))
+
+        self.assertGreaterEqual(MinHasher.similarity(signature, repost), 0.7)
+        self.assertLess(MinHasher.similarity(signature, other), 0.2)
+        self.assertTrue(set(hasher.bucket_keys(signature, "x")) & set(hasher.bucket_keys(repost, "x")))
+        self.assertFalse(set(hasher.bucket_keys(signature, "x")) & set(hasher.bucket_keys(repost, "y")))
@@ -1,26 +1,36 @@
-# scraper/tests/test_jobberman_scraper.py
+# scraper/scrapper_tests/test_jobberman_scraper.py
 import unittest
-from unittest.mock import patch, MagicMock
-from scraper.services import ScraperService
+from unittest.mock import MagicMock
 
-class TestJobbermanScraper(unittest.TestCase):
+from scraper.fetcher import FetchResult
+from scraper.parsers.jobberman_scraper import JobbermanScraper
+
+PAGE = """
+<div class="job-list-item"><a href="/listings/python-developer-1"><p class="job-title">Python Developer</p></a>
+  <p class="company-name">TechCorp</p></div>
+<div class="job-list-item"><a href="/listings/data-engineer-2"><p class="job-title">Data Engineer</p></a>
+  <p class="company-name">TechCorp</p></div>
+"""
 
-    @patch("scraper.services.webdriver.Chrome")
-    def test_scrape_jobberman_returns_jobs(self, mock_driver_class):
-        # Mock driver and elements
-        mock_driver = MagicMock()
-        mock_driver_class.return_value = mock_driver
-        mock_elem = MagicMock()
-        mock_elem.find_element.side_effect = lambda by, selector: MagicMock(text="Test" if "text" in selector else "http://link")
-        mock_driver.find_elements.return_value = [mock_elem, mock_elem]
 
-        service = ScraperService(keyword="Python", location="Lagos")
-        jobs = service.scrape_jobberman()
+class TestJobbermanScraper(unittest.TestCase):
+    def test_scrape_jobberman_returns_jobs(self):
+        # Static result page: parsed without starting a browser
+        pool = MagicMock()
+        fetcher = MagicMock(limit_per_host=4)
+        fetcher.fetch_pages.return_value = [
+            FetchResult(url="https://www.jobberman.com/jobs", status=200, text=PAGE),
+        ]
+
+        jobs = JobbermanScraper("Python", "Lagos", max_pages=1, pool=pool, fetcher=fetcher).fetch_jobs()
 
         self.assertIsInstance(jobs, list)
-        self.assertGreaterEqual(len(jobs), 1)
+        self.assertEqual(len(jobs), 2)
         self.assertIn("title", jobs[0])
         self.assertEqual(jobs[0]["source"], "jobberman")
+        self.assertEqual(jobs[0]["url"], "https://www.jobberman.com/listings/python-developer-1")
+        pool.driver.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+import json
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+from django.utils.module_loading import import_string
+
+from scraper.config import JOB_SITES
+from scraper.management.commands.benchmark_scraper_parsers import load_corpus
+from scraper.parsers.indeed_scraper import IndeedScraper
+from scraper.parsers.markup import HTML_PARSERS, LxmlNode, SoupNode, css_to_xpath, parse_html
+
+CORPUS = Path(__file__).parent / "html"
+
+
+def fixture(source):
+    page = CORPUS / source / "results.html"
+    return page.read_text(encoding="utf-8"), json.loads(page.with_suffix(".json").read_text(encoding="utf-8"))
+
+
+class FixturePageTests(SimpleTestCase):
+    def test_every_parser_reads_the_fixture_pages(self):
+        pages = load_corpus()
+        self.assertIn(("linkedin", "guest"), [(source, name) for source, name, _, _ in pages])
+        for source, name, html, expected in pages:
+            scraper = import_string(JOB_SITES[source]["parser"])("developer", "Lagos")
+            for html_parser in HTML_PARSERS:
+                with self.subTest(source=source, page=name, parser=html_parser):
+                    scraper.html_parser = html_parser
+                    self.assertEqual(scraper.parse_page(html), expected)
+
+    def test_incomplete_cards_are_skipped(self):
+        for source in ("indeed", "linkedin", "jobberman", "glassdoor"):
+            html, expected = fixture(source)
+            with self.subTest(source=source):
+                self.assertEqual(len(expected), 24)  # of 25 cards, one lacks a required field
+                self.assertTrue(all(job["url"] for job in expected))
+
+    def test_parser_is_chosen_per_site(self):
+        scraper = IndeedScraper("developer", "Lagos")
+        self.assertIsInstance(scraper.parse_html("<p>x</p>"), LxmlNode)
+        with patch.dict(JOB_SITES["indeed"], {"html_parser": "bs4"}):
+            self.assertIsInstance(scraper.parse_html("<p>x</p>"), SoupNode)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_scraper_parsers", runs=1, source=["jobberman"], stdout=out)
+        self.assertIn("1 pages parsed as expected", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("benchmark_scraper_parsers", runs=1, source=["jobberman"], max_ms=0, stdout=StringIO())
+
+
+class MarkupTests(SimpleTestCase):
+    HTML = """
+        <ul class="results list"><li class="card" data-jk="1"><a href="/a">First
+            <b>job</b></a></li><li class="card featured"><span>Second</span></li></ul>
+        <div class="card"><button aria-label="Page next">Next</button></div>
+    """
+
+    def test_parsers_agree(self):
+        for html_parser in HTML_PARSERS:
+            with self.subTest(parser=html_parser):
+                doc = parse_html(self.HTML, html_parser)
+                self.assertEqual([card.text for card in doc.select("ul.results > li.card")], ["First job", "Second"])
+                self.assertEqual(doc.select_one("li[data-jk='1'] a").get("href"), "/a")
+                self.assertEqual(doc.select_one("button[aria-label='Page next']").text, "Next")
+                self.assertEqual(len(doc.select(".card")), 3)
+                self.assertEqual([card.text for card in doc.select("div.card, li.featured, li.card")],
+                                 ["First job", "Second", "Next"])
+                self.assertIsNone(doc.select_one(".card.missing"))
+                self.assertIsNone(doc.select_one("li").get("title"))
+                self.assertEqual(parse_html("", html_parser).select("li"), [])
+
+    def test_unsupported_selectors_are_rejected(self):
+        for selector in ("li:first-child", "a + b", "ul >", "> li", "li,", ""):
+            with self.subTest(selector=selector), self.assertRaises(ValueError):
+                css_to_xpath(selector)
@@ -0,0 +1,79 @@
+import time
+
+from django.test import TransactionTestCase
+
+from scraper.models import ScrapedJob
+from scraper.parsers.base_scraper import BaseScraper
+from scraper.pipeline import run_pipeline
+from scraper.repository import JobIngestor
+from scraper.services import ScraperService
+
+
+class CountingScraper(BaseScraper):
+    total = 40
+    produced = 0
+
+    def iter_jobs(self):
+        for n in range(self.total):
+            CountingScraper.produced += 1
+            yield {
+                "title": f"Role {n}", "company": f"Company {n}", "location": "Lagos",
+                "url": f"https://jobs.example.com/{n}", "source": "counting",
+            }
+
+
+class FailingScraper(CountingScraper):
+    total = 5
+
+    def iter_jobs(self):
+        yield from super().iter_jobs()
+        raise ConnectionError("connection reset")
+
+
+MODULE = "scraper.scrapper_tests.test_pipeline"
+
+
+def service(parser, **kwargs):
+    return ScraperService("python", "Lagos", max_attempts=1, sites={
+        "counting": {"enabled": True, "parser": f"{MODULE}.{parser}"},
+    }, **kwargs)
+
+
+class StreamingPipelineTests(TransactionTestCase):
+    def setUp(self):
+        CountingScraper.produced = 0
+
+    def test_jobs_are_written_in_chunks_as_they_stream(self):
+        scrape = service("CountingScraper")
+
+        result = run_pipeline(scrape, chunk_size=15)
+
+        self.assertEqual(result.as_dict(), {"inserted": 40, "updated": 0, "skipped": 0})
+        self.assertEqual(ScrapedJob.objects.count(), 40)
+        self.assertEqual(scrape.site_report()["counting"]["jobs_found"], 40)
+
+    def test_scrapers_block_on_a_full_buffer(self):
+        jobs = service("CountingScraper", buffer_size=5).iter_jobs()
+        next(jobs)
+        time.sleep(0.3)  # plenty of time to produce all 40 if nothing pushed back
+
+        self.assertLessEqual(CountingScraper.produced, 5 + 2)
+        jobs.close()
+
+    def test_a_crash_keeps_the_chunks_already_written(self):
+        ingestor = JobIngestor(chunk_size=10)
+        with self.assertRaises(RuntimeError):
+            for count, (_, job) in enumerate(service("CountingScraper").iter_jobs(), 1):
+                ingestor.add(job)
+                if count == 25:
+                    raise RuntimeError("worker killed")
+
+        self.assertEqual(ScrapedJob.objects.count(), 20)
+
+    def test_jobs_of_a_failed_site_are_kept(self):
+        scrape = service("FailingScraper")
+
+        result = run_pipeline(scrape)
+
+        self.assertEqual(result.inserted, 5)
+        self.assertEqual(scrape.results["counting"].error, "ConnectionError: connection reset")
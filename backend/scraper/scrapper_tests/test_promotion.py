@@ -0,0 +1,146 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ai.models import JobFeatures
+from employers.models import Employer
+from jobs.models import Job, JobSearchDocument, JobTag
+from scraper.models import ScrapedJob
+from scraper.promotion import EmployerResolver, JobPromoter, employment_type
+from users.models import User
+
+
+def scraped(n, company="TechCorp", **fields):
+    return ScrapedJob.objects.create(
+        title=fields.pop("title", f"Python Developer {n}"), company_name=company,
+        location=fields.pop("location", "Lagos"),
+        description=fields.pop("description", "We use Django and PostgreSQL."),
+        job_url=f"https://jobs.example.com/{n}", source_website="Indeed", **fields,
+    )
+
+
+class JobPromoterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_promotes_jobs_with_employer_tags_and_search_document(self):
+        row = scraped(1, title="Python Intern")
+        result = JobPromoter().promote()
+
+        self.assertEqual((result.promoted, result.skipped, result.employers_created), (1, 0, 1))
+        row.refresh_from_db()
+        job = row.job
+        self.assertIsNotNone(row.promoted_at)
+        self.assertEqual((job.title, job.location, job.employment_type), ("Python Intern", "Lagos", Job.INTERN))
+        self.assertEqual(job.company.company_name, "TechCorp")
+        self.assertEqual(job.posted_by, job.company.user)
+        self.assertFalse(job.posted_by.is_active)
+        self.assertFalse(job.posted_by.has_usable_password())
+        self.assertTrue({"python", "django"} <= {name.lower() for name in job.tags.values_list("name", flat=True)})
+        document = JobSearchDocument.objects.get(job=job)
+        self.assertIn("python intern", document.weighted_a.lower())
+        self.assertIn("techcorp", document.weighted_b.lower())
+        self.assertIn("django", JobFeatures.objects.get(job=job).skills)
+
+    def test_employers_are_resolved_in_a_fixed_number_of_queries(self):
+        for n in range(30):
+            scraped(n, company=f"Company {n % 10}")
+        with CaptureQueriesContext(connection) as ctx:
+            result = JobPromoter(chunk_size=100).promote()
+
+        self.assertEqual((result.promoted, result.employers_created), (30, 10))
+        self.assertEqual(Employer.objects.count(), 10)
+        self.assertLess(len(ctx.captured_queries), 25)
+
+    def test_existing_employer_is_reused_whatever_the_case(self):
+        owner = User.objects.create_user(
+            email="hr@techcorp.com", password="Password123", first_name="Hr", last_name="Team", is_employer=True
+        )
+        employer = Employer.objects.create(user=owner, company_name="TechCorp")
+        scraped(1, company="techcorp")
+        scraped(2, company="TechCorp Ltd")
+
+        result = JobPromoter().promote()
+
+        self.assertEqual(result.employers_created, 0)
+        self.assertEqual(set(Job.objects.values_list("company", flat=True)), {employer.pk})
+        self.assertEqual(set(Job.objects.values_list("posted_by", flat=True)), {owner.pk})
+
+    def test_resolved_names_are_cached_across_chunks(self):
+        for n in range(6):
+            scraped(n)
+        resolver = EmployerResolver()
+        with patch.object(resolver, "_lookup", wraps=resolver._lookup) as lookup:
+            JobPromoter(chunk_size=2, resolver=resolver).promote()
+        self.assertEqual(lookup.call_count, 2)  # first chunk: lookup, create, lookup again
+        self.assertEqual(Job.objects.count(), 6)
+
+    def test_promotion_is_idempotent(self):
+        for n in range(3):
+            scraped(n)
+        JobPromoter().promote()
+        result = JobPromoter().promote()
+
+        self.assertEqual(result.promoted, 0)
+        self.assertEqual(Job.objects.count(), 3)
+        self.assertEqual(Employer.objects.count(), 1)
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_rows_without_a_company_are_skipped(self):
+        row = scraped(1, company="  ")
+        result = JobPromoter().promote()
+
+        self.assertEqual((result.promoted, result.skipped), (0, 1))
+        row.refresh_from_db()
+        self.assertIsNone(row.job)
+        self.assertIsNotNone(row.promoted_at)
+
+    def test_a_failed_chunk_is_rolled_back_and_earlier_chunks_stay(self):
+        for n in range(4):
+            scraped(n, company=f"Company {n}")
+        bulk_update = ScrapedJob.objects.bulk_update
+        calls = []
+
+        def fail_second(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("disk full")
+            return bulk_update(*args, **kwargs)
+
+        promoter = JobPromoter(chunk_size=2)
+        with patch.object(ScrapedJob.objects, "bulk_update", side_effect=fail_second):
+            with self.assertRaises(RuntimeError):
+                promoter.promote()
+
+        self.assertEqual(Job.objects.count(), 2)
+        self.assertEqual(ScrapedJob.objects.filter(promoted_at__isnull=True).count(), 2)
+        self.assertEqual(Employer.objects.count(), 2)
+
+        promoter.promote()  # the resolver forgot the employers that were rolled back
+        self.assertEqual(Job.objects.count(), 4)
+        self.assertEqual(Employer.objects.count(), 4)
+
+    def test_list_caches_are_invalidated_on_commit(self):
+        scraped(1)
+        with patch("scraper.promotion.invalidate_job_lists") as invalidate, \
+                patch("scraper.promotion.bump_catalog_version") as bump, \
+                self.captureOnCommitCallbacks(execute=True):
+            JobPromoter().promote()
+        invalidate.assert_called_once()
+        bump.assert_called_once()
+
+    def test_tags_are_shared_between_jobs(self):
+        scraped(1)
+        scraped(2)
+        JobPromoter().promote()
+        self.assertEqual(JobTag.objects.filter(name__iexact="django").count(), 1)
+        self.assertEqual(JobTag.objects.get(name__iexact="django").job_set.count(), 2)
+
+    def test_employment_type(self):
+        self.assertEqual(employment_type("Backend Engineer (Contract)", ""), Job.CONTRACT)
+        self.assertEqual(employment_type("Barista", "Part-time weekend shifts"), Job.PART_TIME)
+        self.assertEqual(employment_type("Engineering Intern", "No contractors"), Job.INTERN)
+        self.assertEqual(employment_type("Backend Engineer", ""), Job.FULL_TIME)
@@ -0,0 +1,188 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from scraper.config import JOB_SITES
+from scraper.driver_pool import DriverPool
+from scraper.fetcher import FetchResult, request_url
+from scraper.incremental import CrawlSession, page_checksum
+from scraper.models import ScrapeRun
+from scraper.parsers.base_scraper import PageFetchError
+from scraper.parsers.jobberman_scraper import JobbermanScraper
+from scraper.parsers.linkedin_scraper import LinkedInScraper
+from scraper.runs import execute_scrape_run
+
+HTML = Path(__file__).parent / "html"
+JOBBERMAN_PAGE = (HTML / "jobberman" / "results.html").read_text(encoding="utf-8")
+LINKEDIN_GUEST_PAGE = (HTML / "linkedin" / "guest.html").read_text(encoding="utf-8")
+SCRIPT_SHELL = '<html><body><div id="app"></div><script src="/bundle.js"></script></body></html>'
+
+
+class FakeFetcher:
+    """Answers requests in order with (status, text[, etag]) and records what was sent."""
+
+    limit_per_host = 4
+
+    def __init__(self, *pages):
+        self.pages = list(pages)
+        self.requested = []
+        self.headers = []
+
+    def fetch_pages(self, requests):
+        results = []
+        for request, (status, text, *etag) in zip(requests, self.pages):
+            url, params, headers = (*request, None)[:3]
+            self.requested.append(request_url(url, params))
+            self.headers.append(headers)
+            results.append(FetchResult(
+                url=request_url(url, params), status=status, text=text, etag=etag[0] if etag else None,
+                error=None if status in (200, 304) else f"HTTP {status}",
+            ))
+        del self.pages[:len(results)]
+        return results
+
+
+class FakeDriver:
+    def __init__(self, page_source):
+        self.page_source = page_source
+        self.visited = []
+
+    def execute_script(self, script):
+        return 1
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class RenderStrategyTests(TestCase):
+    def setUp(self):
+        self.drivers = []
+
+    def pool(self, page_source=JOBBERMAN_PAGE):
+        def factory():
+            self.drivers.append(FakeDriver(page_source))
+            return self.drivers[-1]
+        return DriverPool(size=1, factory=factory)
+
+    def test_static_pages_never_start_chrome(self):
+        scraper = JobbermanScraper("python", "Lagos", pool=self.pool(), fetcher=FakeFetcher((200, JOBBERMAN_PAGE)))
+        jobs = scraper.fetch_jobs()
+
+        self.assertEqual(len(jobs), 24)
+        self.assertEqual(self.drivers, [])
+        stats = scraper.render_stats
+        self.assertEqual((stats["strategy"], stats["fallback"], stats["http_pages"]), ("http", None, 1))
+        self.assertEqual(stats["http_bytes"], len(JOBBERMAN_PAGE.encode()))
+        self.assertNotIn("browser_seconds", stats)
+
+    def test_script_rendered_page_falls_back_to_the_browser(self):
+        scraper = JobbermanScraper("python", "Lagos", pool=self.pool(), fetcher=FakeFetcher((200, SCRIPT_SHELL)))
+        jobs = scraper.fetch_jobs()
+
+        self.assertEqual(len(jobs), 3 * 24)  # every configured page, in Chrome
+        self.assertEqual(self.drivers[0].visited[:3], [
+            f"https://www.jobberman.com/jobs?q=python&l=Lagos&page={page}" for page in (1, 2, 3)
+        ])
+        stats = scraper.render_stats
+        self.assertEqual((stats["strategy"], stats["fallback"]), ("browser", "no job cards in the HTML"))
+        self.assertIn("http_seconds", stats)
+        self.assertIn("browser_seconds", stats)
+
+    def test_blocked_request_falls_back_to_the_browser(self):
+        scraper = JobbermanScraper("python", "Lagos", max_pages=1, pool=self.pool(),
+                                   fetcher=FakeFetcher((403, "Forbidden")))
+        self.assertEqual(len(scraper.fetch_jobs()), 24)
+        self.assertEqual(scraper.render_stats["fallback"], "Failed to fetch page: HTTP 403")
+
+    def test_http_only_sites_do_not_fall_back(self):
+        with patch.dict(JOB_SITES["jobberman"], {"render": "http"}):
+            empty = JobbermanScraper("python", "Lagos", pool=self.pool(), fetcher=FakeFetcher((200, SCRIPT_SHELL)))
+            blocked = JobbermanScraper("python", "Lagos", pool=self.pool(), fetcher=FakeFetcher((403, "Forbidden")))
+        self.assertEqual(empty.fetch_jobs(), [])
+        with self.assertRaisesRegex(PageFetchError, "HTTP 403"):
+            blocked.fetch_jobs()
+        self.assertEqual(self.drivers, [])
+
+    def test_browser_sites_skip_http(self):
+        fetcher = FakeFetcher()
+        with patch.dict(JOB_SITES["jobberman"], {"render": "browser"}):
+            scraper = JobbermanScraper("python", "Lagos", pool=self.pool(), fetcher=fetcher)
+        self.assertEqual(len(scraper.fetch_jobs()), 3 * 24)
+        self.assertEqual(fetcher.requested, [])
+        self.assertEqual(scraper.render_stats["strategy"], "browser")
+
+    def test_jobs_stream_before_later_pages_are_parsed(self):
+        fetcher = FakeFetcher(*[(200, JOBBERMAN_PAGE)] * 3)
+        scraper = JobbermanScraper("python", "Lagos", pool=self.pool(), fetcher=fetcher)
+        with patch.object(scraper, "parse_page", wraps=scraper.parse_page) as parse_page:
+            jobs = scraper.iter_jobs()
+            next(jobs)
+            self.assertEqual(parse_page.call_count, 1)
+            self.assertEqual(len(list(jobs)), 3 * 24 - 1)
+        self.assertEqual(fetcher.requested, [
+            f"https://www.jobberman.com/jobs?q=python&l=Lagos&page={page}" for page in (1, 2, 3)
+        ])
+
+    def test_http_pages_stop_at_the_first_empty_one(self):
+        fetcher = FakeFetcher((200, LINKEDIN_GUEST_PAGE), (200, SCRIPT_SHELL), (200, LINKEDIN_GUEST_PAGE))
+        scraper = LinkedInScraper("python", "Lagos", max_pages=3, pool=self.pool(), fetcher=fetcher)
+
+        self.assertEqual(len(scraper.fetch_jobs()), 24)  # the guest page's cards
+        self.assertEqual(fetcher.requested[1], "https://www.linkedin.com/jobs/search/?keywords=python&location=Lagos&start=25")
+        self.assertEqual(scraper.render_stats["strategy"], "http")
+        self.assertEqual(self.drivers, [])
+
+
+class IncrementalHttpRenderTests(TestCase):
+    URL = "https://www.jobberman.com/jobs?q=python&l=Lagos&page=1"
+
+    def scraper(self, fetcher, pages=None):
+        scraper = JobbermanScraper("python", "Lagos", max_pages=1, pool=DriverPool(size=1, factory=self.fail),
+                                   fetcher=fetcher)
+        scraper.crawl = CrawlSession("jobberman", pages=pages)
+        return scraper
+
+    def test_changed_pages_are_recorded_for_the_next_run(self):
+        scraper = self.scraper(FakeFetcher((200, JOBBERMAN_PAGE, '"v2"')))
+        self.assertEqual(len(scraper.fetch_jobs()), 24)
+        self.assertEqual(scraper.crawl.fetched, {
+            self.URL: {"etag": '"v2"', "last_modified": None, "checksum": page_checksum(JOBBERMAN_PAGE)},
+        })
+
+    def test_unchanged_first_page_ends_the_run_without_the_browser(self):
+        fetcher = FakeFetcher((304, ""))
+        scraper = self.scraper(fetcher, pages={self.URL: {"etag": '"v1"', "checksum": "abc"}})
+
+        self.assertEqual(scraper.fetch_jobs(), [])
+        self.assertEqual(fetcher.headers, [{"If-None-Match": '"v1"'}])
+        self.assertEqual(scraper.crawl.pages_unchanged, 1)
+        self.assertEqual(scraper.crawl.fetched, {})
+        self.assertEqual((scraper.render_stats["strategy"], scraper.render_stats["fallback"]), ("http", None))
+
+
+class RenderStatsOnRunTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_strategy_and_cost_are_recorded_per_site(self):
+        run = ScrapeRun.objects.create(full_refresh=True)
+        sites = {"jobberman": dict(JOB_SITES["jobberman"], enabled=True)}
+        fetched = [FetchResult(url="https://www.jobberman.com/jobs", status=200, text=JOBBERMAN_PAGE)]
+        with patch.dict(JOB_SITES, sites, clear=True), \
+                patch("scraper.fetcher.AsyncFetcher.fetch_pages", return_value=fetched), \
+                patch("scraper.runs.PROMOTE_SCRAPED_JOBS", False):
+            execute_scrape_run(run.pk)
+
+        run.refresh_from_db()
+        self.assertEqual(run.jobs_found, 24)
+        render = run.sites["jobberman"]["render"]
+        self.assertEqual((render["strategy"], render["fallback"], render["http_pages"]), ("http", None, 1))
+        self.assertGreater(render["http_bytes"], 0)
@@ -1,31 +1,37 @@
-# scraper/tests/test_repository_and_tasks.py
+# scraper/scrapper_tests/test_repository_and_tasks.py
 import unittest
-from unittest.mock import patch, MagicMock
-from scraper.repository import ScraperRepository
-from scraper.tasks import run_scrapers_task
-from jobs.models import Job
+from unittest.mock import patch
 
+from django.core.cache import cache
+from django.test import TestCase
 
-class TestScraperRepository(unittest.TestCase):
-    @patch("jobs.models.Job.objects")
-    def test_save_jobs_creates_new_records(self, mock_manager):
+from scraper.models import ScrapedJob, ScrapeRun
+from scraper.repository import ScrapedJobRepository
+from scraper.scrapper_tests.test_runs import only_site
+from scraper.tasks import run_all_scrapers_task
+
+
+class TestScrapedJobRepository(TestCase):
+    def test_save_jobs_creates_new_records(self):
         fake_jobs = [
-            {"title": "Python Dev", "company": "TechCorp", "location": "Lagos", "url": "http://x"},
-            {"title": "Python Dev", "company": "TechCorp", "location": "Lagos", "url": "http://x"},
+            {"title": "Python Dev", "company": "TechCorp", "location": "Lagos", "url": "http://x.example.com/1"},
+            {"title": "Python Dev", "company": "TechCorp", "location": "Lagos", "url": "http://x.example.com/1"},
         ]
-        mock_manager.filter.return_value.exists.return_value = False
-        ScraperRepository.save_jobs(fake_jobs)
-        self.assertEqual(mock_manager.create.call_count, 2)
-
-
-class TestScraperTask(unittest.TestCase):
-    @patch("scraper.tasks.ScraperRepository.save_jobs", return_value=5)
-    @patch("scraper.tasks.ScraperService.run_all_scrapers")
-    def test_run_scrapers_task_success(self, mock_run_all, mock_save_jobs):
-        mock_run_all.return_value = [{"title": "Backend Dev"}]
-        result = run_scrapers_task("python", "Lagos")
-        self.assertEqual(result["status"], "success")
-        self.assertEqual(result["new_jobs"], 5)
+        result = ScrapedJobRepository.ingest(fake_jobs)
+        self.assertEqual((result.inserted, result.skipped), (1, 1))
+        self.assertEqual(ScrapedJob.objects.count(), 1)
+
+
+class TestScraperTask(TestCase):
+    def setUp(self):
+        cache.clear()  # circuit breaker state
+
+    @patch("scraper.runs.PROMOTE_SCRAPED_JOBS", False)
+    def test_run_scrapers_task_success(self):
+        with only_site("CountingScraper"):
+            result = run_all_scrapers_task("python", "Lagos")
+        self.assertEqual(result["status"], ScrapeRun.STATUS_SUCCEEDED)
+        self.assertEqual(result["inserted"], 40)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,141 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from scraper.config import JOB_SITES, SCRAPE_RUN_TIMEOUT
+from scraper.models import ScrapeRun
+from scraper.repository import ScrapeRunRepository
+from scraper.runs import execute_scrape_run
+from users.models import User
+
+MODULE = "scraper.scrapper_tests.test_pipeline"
+
+
+def only_site(parser):
+    return patch.dict(JOB_SITES, {"counting": {"enabled": True, "parser": f"{MODULE}.{parser}"}}, clear=True)
+
+
+class ScrapeRunExecutionTests(TestCase):
+    def setUp(self):
+        cache.clear()  # circuit breaker state
+
+    def test_progress_is_recorded_as_chunks_are_written(self):
+        run = ScrapeRun.objects.create(keyword="python", full_refresh=True)
+        written = []
+        progress = ScrapeRunRepository.progress
+
+        def record(run, found, result):
+            progress(run, found, result)
+            written.append(ScrapeRun.objects.values_list("inserted", flat=True).get(pk=run.pk))
+
+        with only_site("CountingScraper"), patch("scraper.pipeline.PIPELINE_CHUNK_SIZE", 15), \
+                patch.object(ScrapeRunRepository, "progress", side_effect=record):
+            execute_scrape_run(run.pk)
+
+        self.assertEqual(written, [15, 30, 40])
+        run.refresh_from_db()
+        self.assertEqual(run.status, ScrapeRun.STATUS_SUCCEEDED)
+        self.assertEqual((run.jobs_found, run.inserted, run.updated, run.skipped), (40, 40, 0, 0))
+        self.assertEqual(run.promoted, 40)
+        self.assertEqual(run.sites["counting"]["status"], "done")
+        self.assertEqual(run.sites["counting"]["jobs_found"], 40)
+        self.assertIsNotNone(run.finished_at)
+        self.assertGreaterEqual(run.duration, 0)
+
+    def test_failed_site_is_reported_per_source(self):
+        run = ScrapeRun.objects.create(full_refresh=True)
+        with only_site("FailingScraper"), patch("scraper.services.MAX_ATTEMPTS", 1):
+            execute_scrape_run(run.pk)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, ScrapeRun.STATUS_SUCCEEDED)
+        self.assertEqual(run.inserted, 5)
+        self.assertEqual(run.sites["counting"]["status"], "failed")
+        self.assertEqual(run.sites["counting"]["error"], "ConnectionError: connection reset")
+
+    def test_crashed_run_is_marked_failed(self):
+        run = ScrapeRun.objects.create()
+        with only_site("CountingScraper"), \
+                patch("scraper.runs.run_pipeline", side_effect=RuntimeError("database went away")):
+            with self.assertRaises(RuntimeError):
+                execute_scrape_run(run.pk)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, ScrapeRun.STATUS_FAILED)
+        self.assertEqual(run.error, "RuntimeError: database went away")
+
+    def test_a_run_is_executed_once(self):
+        run = ScrapeRun.objects.create(full_refresh=True)
+        with only_site("CountingScraper"):
+            self.assertIsNotNone(execute_scrape_run(run.pk))
+            self.assertIsNone(execute_scrape_run(run.pk))
+        self.assertEqual(ScrapeRun.objects.get().inserted, 40)
+
+
+class ScrapeRunViewTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com", password="Password123", first_name="Ada", last_name="Admin"
+        )
+        self.client.force_authenticate(self.admin)
+
+    def test_trigger_returns_at_once_with_a_queued_run(self):
+        with patch("scraper.runs.threading.Thread") as thread, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("scraper:trigger-scraping"), {"keyword": "python"}, format="json")
+
+        self.assertEqual(response.status_code, 202)
+        run = ScrapeRun.objects.get()
+        self.assertEqual((run.keyword, run.status, run.requested_by), ("python", "queued", self.admin))
+        self.assertEqual(response.data["run_id"], run.pk)
+        self.assertEqual(response.data["status_url"], reverse("scraper:scrape-run-detail", args=[run.pk]))
+        self.assertEqual(thread.call_args.kwargs["args"], (run.pk,))
+        thread.return_value.start.assert_called_once()
+
+    @override_settings(CELERY_ENABLED=True)
+    def test_trigger_hands_the_run_to_celery(self):
+        with patch("scraper.tasks.run_scrape_task.delay") as delay, self.captureOnCommitCallbacks(execute=True):
+            delay.return_value.id = "task-1"
+            self.client.post(reverse("scraper:trigger-scraping"), {"full_refresh": True}, format="json")
+
+        run = ScrapeRun.objects.get()
+        delay.assert_called_once_with(run.pk)
+        self.assertEqual(run.task_id, "task-1")
+        self.assertTrue(run.full_refresh)
+
+    def test_status_endpoint(self):
+        run = ScrapeRun.objects.create(
+            status=ScrapeRun.STATUS_RUNNING, jobs_found=12,
+            sites={"jobberman": {"status": "running", "jobs_found": 12}},
+        )
+        response = self.client.get(reverse("scraper:scrape-run-detail", args=[run.pk]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "running")
+        self.assertEqual(response.data["sites"]["jobberman"]["jobs_found"], 12)
+        self.assertIsNone(response.data["duration"])
+        self.assertEqual(self.client.get(reverse("scraper:scrape-run-detail", args=[run.pk + 1])).status_code, 404)
+
+    def test_run_whose_worker_is_gone_is_reported_failed(self):
+        stale = ScrapeRun.objects.create(status=ScrapeRun.STATUS_RUNNING, started_at=timezone.now())
+        ScrapeRun.objects.filter(pk=stale.pk).update(
+            created_at=timezone.now() - timedelta(seconds=SCRAPE_RUN_TIMEOUT + 60)
+        )
+        current = ScrapeRun.objects.create(status=ScrapeRun.STATUS_RUNNING, started_at=timezone.now())
+
+        response = self.client.get(reverse("scraper:scrape-run-detail", args=[stale.pk]))
+        self.assertEqual(response.data["status"], "failed")
+        self.assertIn("did not finish", response.data["error"])
+        self.assertIsNotNone(response.data["finished_at"])
+        current.refresh_from_db()
+        self.assertEqual(current.status, ScrapeRun.STATUS_RUNNING)
+
+    def test_status_endpoint_is_admin_only(self):
+        user = User.objects.create_user(email="user@example.com", password="Password123", first_name="U", last_name="S")
+        self.client.force_authenticate(user)
+        run = ScrapeRun.objects.create()
+        self.assertEqual(self.client.get(reverse("scraper:scrape-run-detail", args=[run.pk])).status_code, 403)
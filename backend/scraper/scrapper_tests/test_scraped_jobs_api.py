@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from scraper.models import ScrapedJob
+from scraper.pagination import ScrapedJobPagination
+from scraper.repository import ScrapedJobRepository
+from users.models import User
+
+
+class ScrapedJobListTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="user@example.com", password="Password123", first_name="Reg", last_name="User"
+        )
+        self.client.force_authenticate(self.user)
+        self.jobs = [
+            ScrapedJob.objects.create(
+                title=f"Engineer {n}", company_name="TechCorp", description="Long text " * 50,
+                job_url=f"https://jobs.example.com/{n}", source_website="Indeed" if n % 2 else "Jobberman",
+            )
+            for n in range(7)
+        ]
+        # Same timestamp for a few rows exercises the id tie-breaker
+        ScrapedJob.objects.filter(pk__in=[job.pk for job in self.jobs[2:5]]).update(created_at=timezone.now())
+        self.url = reverse("scraper:scraped-job-list")
+
+    def walk(self, params):
+        ids = []
+        response = self.client.get(self.url, {"page_size": 3, **params})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            ids.extend(job["id"] for job in response.data["results"])
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def newest_first(self, jobs):
+        return [job.pk for job in sorted(
+            ScrapedJob.objects.filter(pk__in=[job.pk for job in jobs]),
+            key=lambda job: (job.created_at, job.pk), reverse=True,
+        )]
+
+    def test_cursor_pages_cover_every_job_once_newest_first(self):
+        self.assertEqual(self.walk({}), self.newest_first(self.jobs))
+
+    def test_source_filter(self):
+        expected = self.newest_first([job for job in self.jobs if job.source_website == "Indeed"])
+        self.assertEqual(self.walk({"source": "Indeed"}), expected)
+
+    def test_pages_seek_instead_of_offset(self):
+        first = self.client.get(self.url, {"page_size": 3})
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(first.data["next"])
+        self.assertFalse(any("OFFSET" in query["sql"] or "COUNT" in query["sql"] for query in ctx.captured_queries))
+
+    def test_sparse_fieldset_leaves_out_description(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {"fields": "id,title,job_url"})
+
+        self.assertEqual(set(response.data["results"][0]), {"id", "title", "job_url"})
+        self.assertFalse(any('"description"' in query["sql"] for query in ctx.captured_queries))
+        self.assertEqual(self.client.get(self.url, {"fields": "id,salary"}).status_code, 400)
+
+    def test_conditional_get(self):
+        response = self.client.get(self.url, {"page_size": 3})
+        etag = response["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {"page_size": 3}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertNotEqual(self.client.get(self.url, {"page_size": 4})["ETag"], etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ScrapedJobRepository.ingest([{
+                "title": "Data Analyst", "company": "Acme", "url": "https://jobs.example.com/new",
+                "source": "Indeed",
+            }])
+        response = self.client.get(self.url, {"page_size": 3}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["results"][0]["title"], "Data Analyst")
+
+    def test_edits_and_deletes_outside_ingest_change_the_etag(self):
+        for change in (lambda job: job.save(), lambda job: job.delete()):
+            etag = self.client.get(self.url)["ETag"]
+            with self.captureOnCommitCallbacks(execute=True):
+                change(self.jobs[0])
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+
+    def test_page_size_is_capped_and_invalid_sizes_use_the_default(self):
+        with patch.object(ScrapedJobPagination, "max_page_size", 3):
+            for page_size, expected in (("2", 2), ("1000", 3), ("0", 7), ("-3", 7), ("x", 7)):
+                with self.subTest(page_size=page_size):
+                    response = self.client.get(self.url, {"page_size": page_size})
+                    self.assertEqual(len(response.data["results"]), expected)
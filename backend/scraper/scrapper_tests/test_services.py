@@ -1,8 +1,14 @@
 # scraper/tests/test_services.py
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 from scraper.services import ScraperService
 
+
+def fake_site(parser="fake_module.FakeScraper", **extra):
+    return {"enabled": True, "parser": parser, **extra}
+
+
 class TestScraperService(unittest.TestCase):
     @patch("importlib.import_module")
     def test_run_all_scrapers_aggregates_results(self, mock_import_module):
@@ -21,13 +27,100 @@ class TestScraperService(unittest.TestCase):
         # importlib.import_module should return our fake module (first call)
         mock_import_module.return_value = fake_module
 
-        # patch JOB_SOURCES to point to our fake parser path
-        with patch("scraper.services.JOB_SOURCES", {"fake": {"enabled": True, "parser": "fake_module.FakeScraper"}}):
-            service = ScraperService(keyword="x", location="y")
-            jobs = service.run_all_scrapers()
-            # Should aggregate the single job from FakeScraper
-            self.assertEqual(len(jobs), 1)
-            self.assertEqual(jobs[0]["title"], "Job A")
+        # point the service at our fake parser path
+        service = ScraperService(keyword="x", location="y", sites={"fake": fake_site()})
+        jobs = service.run_all_scrapers()
+        # Should aggregate the single job from FakeScraper
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0]["title"], "Job A")
+        FakeScraperClass.assert_called_once_with("x", "y")
+
+
+class SlowScraper:
+    delay = 0.3
+
+    def __init__(self, keyword, location):
+        self.keyword = keyword
+
+    def fetch_jobs(self):
+        time.sleep(self.delay)
+        return [{"title": f"{self.keyword} job"}]
+
+
+class HangingScraper(SlowScraper):
+    delay = 2
+
+
+class FlakyScraper:
+    calls = 0
+
+    def __init__(self, keyword, location):
+        pass
+
+    def fetch_jobs(self):
+        FlakyScraper.calls += 1
+        if FlakyScraper.calls < 2:
+            raise ConnectionError("reset by peer")
+        return [{"title": "Recovered"}]
+
+
+class BrokenScraper(FlakyScraper):
+    def fetch_jobs(self):
+        raise ValueError("bad markup")
+
+
+MODULE = "scraper.scrapper_tests.test_services"
+
+
+class TestParallelScraperService(unittest.TestCase):
+    def setUp(self):
+        FlakyScraper.calls = 0
+        backoff = patch.object(ScraperService, "_backoff", return_value=0.01)
+        backoff.start()
+        self.addCleanup(backoff.stop)
+
+    def test_sites_run_concurrently(self):
+        sites = {name: fake_site(f"{MODULE}.SlowScraper") for name in ("a", "b", "c")}
+        service = ScraperService(keyword="python", sites=sites, max_workers=3)
+
+        start = time.monotonic()
+        jobs = service.run_all_scrapers()
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(len(jobs), 3)
+        self.assertEqual(list(service.results), ["a", "b", "c"])
+
+    def test_slow_site_times_out_without_blocking_others(self):
+        sites = {
+            "slow": fake_site(f"{MODULE}.HangingScraper", timeout=0.2),
+            "fast": fake_site(f"{MODULE}.SlowScraper", timeout=5),
+        }
+        service = ScraperService(sites=sites)
+
+        start = time.monotonic()
+        results = service.run_sites()
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertTrue(results["slow"].timed_out)
+        self.assertEqual(results["slow"].jobs, [])
+        self.assertTrue(results["fast"].ok)
+        self.assertEqual(len(results["fast"].jobs), 1)
+
+    def test_retries_and_error_reporting(self):
+        sites = {
+            "flaky": fake_site(f"{MODULE}.FlakyScraper"),
+            "broken": fake_site(f"{MODULE}.BrokenScraper"),
+            "disabled": {"enabled": False, "parser": f"{MODULE}.BrokenScraper"},
+        }
+        service = ScraperService(sites=sites, max_attempts=3)
+        jobs = service.run_all_scrapers()
+
+        self.assertEqual(jobs, [{"title": "Recovered"}])
+        report = service.site_report()
+        self.assertEqual(set(report), {"flaky", "broken"})
+        self.assertEqual(report["flaky"]["attempts"], 2)
+        self.assertIsNone(report["flaky"]["error"])
+        self.assertEqual(report["broken"]["attempts"], 3)
+        self.assertEqual(report["broken"]["error"], "ValueError: bad markup")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,137 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from scraper.config import JOB_SITES
+from scraper.fetcher import AsyncFetcher
+from scraper.scrapper_tests.test_fetcher import FixtureServer
+from scraper.services import ScraperService
+from scraper.throttle import CircuitBreaker, LocalTokenBucket, RateLimiter, RedisTokenBucket, retry_after_seconds
+
+
+def redis_available():
+    try:
+        import redis
+
+        return redis.Redis(socket_connect_timeout=0.2).ping()
+    except Exception:
+        return False
+
+
+class RateLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.server = FixtureServer(delay=0)
+        self.addCleanup(self.server.close)
+
+    def test_requests_to_a_domain_are_spaced_by_the_bucket(self):
+        with AsyncFetcher(limit_per_host=10, limiter=RateLimiter(rate=20, burst=2)) as fetcher:
+            pages = fetcher.fetch_pages([(f"{self.server.url}/jobs", {"start": n}) for n in range(8)])
+
+        self.assertTrue(all(page.ok for page in pages))
+        times = sorted(self.server.times)
+        # two go out at once, the other six one interval (50ms) apart
+        self.assertGreaterEqual(times[-1] - times[0], 6 * 0.05 - 0.03)
+        self.assertLess(times[1] - times[0], 0.03)
+
+    def test_domains_have_separate_buckets(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        self.assertEqual(limiter.reserve("https://a.example.com/1"), 0)
+        self.assertEqual(limiter.reserve("https://b.example.com/1"), 0)
+        self.assertAlmostEqual(limiter.reserve("https://a.example.com/2"), 1, delta=0.05)
+
+    def test_throttled_domain_slows_down_and_recovers(self):
+        buckets = LocalTokenBucket()
+        limiter = RateLimiter(buckets, rate=10, burst=2)
+        self.server.retry_after = 1
+
+        with AsyncFetcher(limiter=limiter) as fetcher:
+            [page] = fetcher.fetch_pages([(f"{self.server.url}/fail", None)])
+
+        self.assertEqual(page.status, 503)
+        domain = self.server.url.split("//")[1]
+        self.assertEqual(buckets._state[domain]["rate"], 5)
+        limiter.feedback(self.server.url, 503)  # same burst: not halved again
+        self.assertEqual(buckets._state[domain]["rate"], 5)
+        self.assertAlmostEqual(limiter.reserve(self.server.url), 1, delta=0.1)  # paused for Retry-After
+
+        for _ in range(20):
+            limiter.feedback(self.server.url, 200)
+        self.assertEqual(buckets._state[domain]["rate"], 10)
+
+    def test_retry_after_forms(self):
+        self.assertEqual(retry_after_seconds("7"), 7)
+        self.assertEqual(retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT"), 0)  # in the past
+        self.assertEqual(retry_after_seconds("999999"), 300)
+        self.assertEqual(retry_after_seconds(None), 0)
+
+    def test_unreachable_redis_falls_back_to_local_buckets(self):
+        limiter = RateLimiter(RedisTokenBucket("redis://127.0.0.1:9/0"), rate=1, burst=1)
+        self.assertEqual(limiter.reserve("https://a.example.com/1"), 0)
+        self.assertAlmostEqual(limiter.reserve("https://a.example.com/2"), 1, delta=0.05)
+
+    @unittest.skipUnless(redis_available(), "needs a local Redis")
+    def test_redis_buckets_are_shared_between_limiters(self):
+        import redis
+
+        url = "redis://localhost:6379/15"
+        redis.Redis.from_url(url).delete("scraper:rate:shared.example.com")
+        first = RateLimiter(RedisTokenBucket(url), rate=1, burst=1)
+        second = RateLimiter(RedisTokenBucket(url), rate=1, burst=1)
+        self.assertEqual(first.reserve("https://shared.example.com/1"), 0)
+        self.assertAlmostEqual(second.reserve("https://shared.example.com/2"), 1, delta=0.05)
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_opens_after_consecutive_failures_then_lets_one_probe_through(self):
+        breaker = CircuitBreaker("demo", failures=2, cooldown=0.2)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+        time.sleep(0.25)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())  # only one probe at a time
+        breaker.record_success()
+        self.assertTrue(breaker.allow())
+        self.assertIsNone(breaker.open_until())
+
+    def test_a_failed_probe_reopens_it(self):
+        breaker = CircuitBreaker("demo", failures=2, cooldown=0.2)
+        breaker.record_failure()
+        breaker.record_failure()
+        time.sleep(0.25)
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+    def test_cache_errors_let_requests_through(self):
+        breaker = CircuitBreaker("demo", failures=1)
+        with patch("scraper.throttle.cache") as broken:
+            for method in ("get", "add", "incr", "set", "delete", "delete_many"):
+                getattr(broken, method).side_effect = ConnectionError("cache down")
+            breaker.record_failure()
+            self.assertTrue(breaker.allow())
+            breaker.record_success()
+
+    def test_failing_site_is_skipped_once_open(self):
+        server = FixtureServer(delay=0)
+        self.addCleanup(server.close)
+        sites = {"indeed": {**JOB_SITES["indeed"], "base_url": f"{server.url}/fail", "enabled": True}}
+
+        with patch.dict(JOB_SITES, sites), patch("scraper.throttle.BREAKER_FAILURES", 2), \
+                patch.object(ScraperService, "_backoff", return_value=0.01):
+            first = ScraperService(sites=sites, max_attempts=3).run_sites()["indeed"]
+            requests = len(server.paths)
+            second = ScraperService(sites=sites, max_attempts=3).run_sites()["indeed"]
+
+        self.assertEqual(first.attempts, 2)  # the breaker opened after the second failure
+        self.assertTrue(first.circuit_open)
+        self.assertIn("HTTP 503", first.error)
+        self.assertEqual((second.attempts, second.circuit_open), (0, True))
+        self.assertEqual(len(server.paths), requests)
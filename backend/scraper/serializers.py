@@ -1,8 +1,16 @@
 from rest_framework import serializers
-from .models import ScrapedJob
+from .models import ScrapedJob, ScrapeRun
 
 
 class ScrapedJobSerializer(serializers.ModelSerializer):
+    """Pass `fields` to serialize only those fields (sparse fieldsets)."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
     class Meta:
         model = ScrapedJob
         fields = [
@@ -11,3 +19,17 @@ class ScrapedJobSerializer(serializers.ModelSerializer):
             'source_website', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class ScrapeRunSerializer(serializers.ModelSerializer):
+    duration = serializers.FloatField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = ScrapeRun
+        fields = [
+            'id', 'status', 'keyword', 'location', 'full_refresh',
+            'sites', 'jobs_found', 'inserted', 'updated', 'skipped',
+            'promoted', 'error', 'task_id', 'created_at', 'started_at', 'finished_at',
+            'duration'
+        ]
+        read_only_fields = fields
@@ -3,25 +3,111 @@
 ScraperService - central orchestrator for all enabled job scrapers.
 Each scraper fetches jobs from its respective source, and results
 are aggregated into a unified job list.
+
+Sites run concurrently on a bounded thread pool (scraping is I/O bound:
+HTTP requests or a separate Chrome process). Each site is retried with
+jittered exponential backoff and has its own timeout; a site that is
+still running at its deadline is reported as timed out and told to stop
+(which also cuts short a backoff wait), so one slow site never holds up
+the others. A site that keeps failing, across runs and workers, trips its
+CircuitBreaker and is skipped until the cooldown is over; requests
+themselves are paced per domain by scraper.throttle's rate limiter.
+
+Jobs are streamed: iter_jobs() yields (site, job) pairs as scrapers
+produce them, through a queue of at most PIPELINE_BUFFER records. A full
+queue blocks the scraper threads, so a slow consumer (e.g. the database
+writes in scraper.pipeline) bounds memory instead of letting it grow
+with the scrape. run_sites()/run_all_scrapers() collect the stream into
+lists for callers that want everything at once.
+
+Incremental runs (incremental=True) give each scraper its source's
+CrawlSession so pagination stops at already-ingested listings; callers
+persist the sessions with commit_crawl_state() once the jobs are saved.
 """
 
 import importlib
+import queue
+import random
+import threading
 import time
-from typing import List, Dict
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from scraper.config import JOB_SITES, DEFAULT_SEARCH
+from scraper.config import (
+    DEFAULT_SEARCH,
+    DEFAULT_SITE_TIMEOUT,
+    JOB_SITES,
+    MAX_ATTEMPTS,
+    MAX_WORKERS,
+    PIPELINE_BUFFER,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+)
+from scraper.incremental import CrawlSession
+from scraper.parsers.base_scraper import BaseScraper
+from scraper.throttle import CircuitBreaker
+
+
+@dataclass
+class SiteResult:
+    """Outcome of scraping one site."""
+
+    site: str
+    jobs: List[Dict] = field(default_factory=list)
+    jobs_found: int = 0
+    error: Optional[str] = None
+    attempts: int = 0
+    duration: float = 0.0
+    timed_out: bool = False
+    circuit_open: bool = False
+    render: Optional[Dict] = None  # BrowserScraper.render_stats of the last attempt
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def status(self) -> str:
+        if self.ok:
+            return "done"
+        if self.timed_out:
+            return "timed_out"
+        if self.circuit_open and not self.attempts:
+            return "skipped"
+        return "failed"
+
+    def as_dict(self) -> Dict:
+        return {
+            "jobs_found": self.jobs_found,
+            "error": self.error,
+            "attempts": self.attempts,
+            "duration": round(self.duration, 2),
+            "timed_out": self.timed_out,
+            "circuit_open": self.circuit_open,
+            "render": self.render,
+        }
+
+
+class _Stopped(Exception):
+    """Raised in a scraper thread whose site timed out or whose consumer went away."""
 
-import random
 
 class ScraperService:
     """Main orchestrator for all scrapers."""
 
-    def __init__(self, keyword: str = None, location: str = None):
+    def __init__(self, keyword: str = None, location: str = None,
+                 max_workers: int = None, max_attempts: int = None, sites: Dict = None,
+                 incremental: bool = False, buffer_size: int = None):
         self.keyword = keyword or DEFAULT_SEARCH["keyword"]
         self.location = location or DEFAULT_SEARCH["location"]
+        self.max_workers = max_workers or MAX_WORKERS
+        self.max_attempts = max_attempts or MAX_ATTEMPTS
+        self.sites = JOB_SITES if sites is None else sites
+        self.incremental = incremental
+        self.buffer_size = buffer_size or PIPELINE_BUFFER
+        self.crawl: Dict[str, CrawlSession] = {}
+        self.results: Dict[str, SiteResult] = {}
 
     def _load_scraper(self, path: str):
         """Dynamically import scraper class from config path."""
@@ -29,49 +115,207 @@ class ScraperService:
         module = importlib.import_module(module_path)
         return getattr(module, class_name)
 
-    def run_all_scrapers(self) -> List[Dict]:
-        """Run all enabled scrapers and return a combined job list."""
-        all_jobs = []
+    def enabled_sites(self) -> Dict[str, Dict]:
+        return {name: config for name, config in self.sites.items() if config.get("enabled")}
+
+    @staticmethod
+    def _site_timeout(site_config: Dict) -> float:
+        return site_config.get("timeout", DEFAULT_SITE_TIMEOUT)
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter, so retries of sites (and workers) that failed together spread out
+        return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+    @staticmethod
+    def _records(scraper) -> Iterable[Dict]:
+        # BaseScraper subclasses stream; anything else only has fetch_jobs()
+        return scraper.iter_jobs() if isinstance(scraper, BaseScraper) else scraper.fetch_jobs()
 
-        for site_name, site_config in JOB_SITES.items():
-            if not site_config["enabled"]:
-                continue
+    def _scrape_site(self, site_name: str, site_config: Dict, started: Dict[str, float],
+                     emit: Callable[[Tuple], None], stop: threading.Event) -> SiteResult:
+        """Run one site with retries, passing each job to emit(); never raises."""
+        start = started[site_name] = time.monotonic()
+        deadline = start + self._site_timeout(site_config)
+        result = SiteResult(site=site_name)
+        breaker = CircuitBreaker(site_name)
 
-            print(f"[ScraperService] Running scraper: {site_name}...")
+        for attempt in range(self.max_attempts):
+            result.attempts = attempt + 1
+            records = scraper = None
             try:
+                if attempt == 0 and not breaker.allow():
+                    result.attempts = 0
+                    result.error = "Circuit open after repeated failures; skipped"
+                    result.circuit_open = True
+                    break
                 ScraperClass = self._load_scraper(site_config["parser"])
                 scraper = ScraperClass(self.keyword, self.location)
-                jobs = scraper.fetch_jobs()
-                all_jobs.extend(jobs)
-                print(f"[ScraperService] {site_name}: {len(jobs)} jobs found.")
+                crawl = self.crawl.get(site_name)
+                if crawl is not None:
+                    crawl.begin_attempt()
+                    scraper.crawl = crawl
+                records = self._records(scraper)
+                # Jobs emitted by a failed attempt are already downstream;
+                # the retry repeats them and ingestion drops the repeats
+                for job in records:
+                    emit(("job", site_name, job))
+                result.error = None
+                breaker.record_success()
+                break
+            except _Stopped:
+                break
             except Exception as e:
-                print(f"[ScraperService][Error] {site_name}: {e}")
+                result.error = f"{type(e).__name__}: {e}"
+                breaker.record_failure()
+                wait_for = self._backoff(attempt)
+                if attempt + 1 == self.max_attempts or time.monotonic() + wait_for >= deadline:
+                    break
+                if not breaker.allow():
+                    result.circuit_open = True
+                    break
+                print(f"[Retry {attempt + 1}] {site_name} failed: {e}. Retrying in {wait_for:.1f}s...")
+                if stop.wait(wait_for):
+                    break
+            finally:
+                close = getattr(records, "close", None)
+                if close is not None:
+                    close()
+                result.render = getattr(scraper, "render_stats", None)
 
-        return all_jobs
-
-def run_all_scrapers(self) -> List[Dict]:
-    """Run all enabled scrapers and return a combined job list."""
-    all_jobs = []
+        result.duration = time.monotonic() - start
+        return result
 
-    for site_name, site_config in JOB_SITES.items():
-        if not site_config.get("enabled"):
-            continue
+    def _produce(self, site_name: str, site_config: Dict, started: Dict[str, float],
+                 buffer: queue.Queue, stop: threading.Event):
+        def emit(item):
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            raise _Stopped()
 
-        print(f"[ScraperService] Running scraper: {site_name}...")
+        result = self._scrape_site(site_name, site_config, started, emit, stop)
+        try:
+            emit(("done", site_name, result))
+        except _Stopped:
+            pass
 
-        for attempt in range(3):  # retry up to 3 times
-            try:
-                ScraperClass = self._load_scraper(site_config["parser"])
-                scraper = ScraperClass(self.keyword, self.location)
-                jobs = scraper.fetch_jobs()
-                all_jobs.extend(jobs)
-                print(f"[ScraperService] {site_name}: {len(jobs)} jobs found.")
-                break  # exit retry loop on success
-            except Exception as e:
-                wait = 2 ** attempt + random.random()
-                print(f"[Retry {attempt+1}] {site_name} failed: {e}. Retrying in {wait:.1f}s...")
-                time.sleep(wait)
+    def _finish(self, result: SiteResult, on_site_done: Optional[Callable]):
+        self.results[result.site] = result
+        if result.ok:
+            via = f" ({result.render['strategy']})" if result.render else ""
+            print(f"[ScraperService] {result.site}: {result.jobs_found} jobs found in {result.duration:.1f}s{via}.")
         else:
-            print(f"[ScraperService][Error] {site_name} failed after retries.")
+            print(f"[ScraperService][Error] {result.site}: {result.error}")
+        if on_site_done is not None:
+            on_site_done(result)
+
+    def iter_jobs(self, on_site_done: Callable[[SiteResult], None] = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Scrape every enabled site concurrently, yielding (site, job) as jobs
+        arrive. on_site_done(result) is called (in the caller's thread) when
+        a site finishes, fails or times out; self.results ends up holding a
+        SiteResult per site, in config order.
+        """
+        sites = self.enabled_sites()
+        self.results = {}
+        if not sites:
+            return
+        if self.incremental:
+            from scraper.repository import CrawlStateRepository
+
+            self.crawl = CrawlStateRepository.load(sites)
+
+        started: Dict[str, float] = {}
+        counts = dict.fromkeys(sites, 0)
+        stops = {name: threading.Event() for name in sites}
+        buffer = queue.Queue(maxsize=self.buffer_size)
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(sites)), thread_name_prefix="scraper"
+        )
+        for name, config in sites.items():
+            executor.submit(self._produce, name, config, started, buffer, stops[name])
+        pending = set(sites)
+        try:
+            while pending:
+                now = time.monotonic()
+                # Sites queued behind a busy pool have not started their clock yet
+                deadlines = {
+                    name: started[name] + self._site_timeout(sites[name])
+                    for name in pending if name in started
+                }
+                for name, deadline in deadlines.items():
+                    if deadline <= now:
+                        stops[name].set()
+                        pending.discard(name)
+                        CircuitBreaker(name).record_failure()
+                        self._finish(SiteResult(
+                            site=name, jobs_found=counts[name],
+                            error=f"Timed out after {self._site_timeout(sites[name])}s",
+                            duration=now - started[name], timed_out=True,
+                        ), on_site_done)
+                if not pending:
+                    break
+
+                timeout = min(deadlines.values(), default=now + 0.5) - now
+                try:
+                    kind, name, payload = buffer.get(timeout=min(max(timeout, 0.01), 0.5))
+                except queue.Empty:
+                    continue
+                if name not in pending:
+                    continue  # late output of a timed-out site
+                if kind == "job":
+                    counts[name] += 1
+                    if name in self.crawl:
+                        self.crawl[name].saw(payload)
+                    yield name, payload
+                else:
+                    pending.discard(name)
+                    payload.jobs_found = counts[name]
+                    self._finish(payload, on_site_done)
+        finally:
+            # Stop scrapers still running (timed out, or the consumer stopped
+            # early) and do not wait for them
+            for stop in stops.values():
+                stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.results = {name: self.results[name] for name in sites}
+
+    def run_sites(self) -> Dict[str, SiteResult]:
+        """
+        Scrape every enabled site concurrently and return a result per site,
+        in config order, with its jobs collected. Also kept on self.results.
+        """
+        jobs: Dict[str, List[Dict]] = {}
+        for name, job in self.iter_jobs():
+            jobs.setdefault(name, []).append(job)
+        for name, result in self.results.items():
+            if not result.timed_out:
+                result.jobs = jobs.get(name, [])
+        return self.results
+
+    def run_all_scrapers(self) -> List[Dict]:
+        """Run all enabled scrapers and return a combined job list."""
+        all_jobs = []
+        for result in self.run_sites().values():
+            all_jobs.extend(result.jobs)
+        return all_jobs
+
+    def commit_crawl_state(self, sites: Iterable[str] = None):
+        """Save crawl state of the sites that completed; call after ingesting their jobs."""
+        if not self.crawl:
+            return
+        from scraper.repository import CrawlStateRepository
+
+        names = self.results if sites is None else sites
+        CrawlStateRepository.save(
+            self.crawl[name] for name in names
+            if name in self.crawl and name in self.results and self.results[name].ok
+        )
 
-    return all_jobs
+    def site_report(self) -> Dict[str, Dict]:
+        """Per-site summary of the last run."""
+        return {name: result.as_dict() for name, result in self.results.items()}
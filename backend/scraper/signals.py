@@ -0,0 +1,20 @@
+"""
+Signal handlers that move the scraped job list's ETag version (see
+scraper.cache) on ScrapedJob writes made outside ScrapedJobRepository,
+e.g. admin edits and deletes.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_scraped_jobs
+from .models import ScrapedJob
+
+
+@receiver(post_save, sender=ScrapedJob)
+@receiver(post_delete, sender=ScrapedJob)
+def invalidate_scraped_job_list(sender, raw=False, **kwargs):
+    if raw:
+        return
+    transaction.on_commit(invalidate_scraped_jobs)
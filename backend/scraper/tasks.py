@@ -1,62 +1,41 @@
-
 """
 Celery tasks for job scraping.
-This task runs all enabled scrapers and saves the results
-into the jobs.Job model, avoiding duplicates.
+Every scrape is a tracked ScrapeRun (see scraper.runs): the scrapers'
+results are streamed into ScrapedJob in batches (see scraper.pipeline),
+avoiding duplicates, and the run records per-site progress as they go.
+Runs are incremental unless full_refresh is set: each site stops at
+listings ingested by an earlier run (see scraper.incremental).
 """
 
-import time
 from celery import shared_task
-from django.db import IntegrityError
-from jobs.models import Job
-from scraper.services import ScraperService
+from scraper.models import ScrapeRun
+from scraper.runs import execute_scrape_run
 
 
 @shared_task
-def run_all_scrapers_task(keyword=None, location=None):
+def run_scrape_task(run_id):
     """
-    Celery task to run all scrapers and save jobs.
-    :param keyword: Optional job keyword to search
-    :param location: Optional location to filter jobs
-    :return: Number of new jobs added
+    Celery task running a queued ScrapeRun.
+    :param run_id: Primary key of the ScrapeRun
+    :return: Final status and inserted, updated and skipped counts
     """
-    scraper_service = ScraperService(keyword=keyword, location=location)
-    all_jobs = scraper_service.run_all_scrapers()
-
-    new_jobs_count = 0
-
-    for job_data in all_jobs:
-        # Check for duplicates using title + company + location
-        exists = Job.objects.filter(
-            title=job_data.get("title"),
-            company=job_data.get("company"),
-            location=job_data.get("location")
-        ).exists()
-
-        if exists:
-            continue
+    run = execute_scrape_run(run_id)
+    if run is None:
+        return None
+    return {"status": run.status, "inserted": run.inserted, "updated": run.updated, "skipped": run.skipped}
 
-        try:
-            Job.objects.create(
-                title=job_data.get("title"),
-                company=job_data.get("company"),
-                location=job_data.get("location"),
-                description=job_data.get("description", ""),
-                salary=job_data.get("salary", None),
-                employment_type=job_data.get("employment_type", "Full-time"),
-                posted_by=None,  # or set a system user
-                is_active=True
-            )
-            new_jobs_count += 1
-        except IntegrityError:
-            # Skip if there's a unique constraint violation
-            continue
-        except Exception as e:
-            print(f"[Error] Saving job {job_data.get('title')}: {e}")
-            continue
 
-    print(f"Scraping finished: {len(all_jobs)} total, {new_jobs_count} new jobs added.")
-    return new_jobs_count
+@shared_task
+def run_all_scrapers_task(keyword=None, location=None, full_refresh=False):
+    """
+    Celery task to run all scrapers and save jobs (used by the beat schedule).
+    :param keyword: Optional job keyword to search
+    :param location: Optional location to filter jobs
+    :param full_refresh: Re-scrape every page instead of stopping at known listings
+    :return: Final status and inserted, updated and skipped counts
+    """
+    run = ScrapeRun.objects.create(keyword=keyword or "", location=location or "", full_refresh=full_refresh)
+    return run_scrape_task(run.pk)
 
 @shared_task
 def send_application_email_task(to_email, subject, body):
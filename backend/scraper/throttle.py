@@ -0,0 +1,254 @@
+"""
+Per-domain rate limiting and per-source circuit breaking for scrapers.
+
+Every request a scraper makes (AsyncFetcher pages, pooled Chrome page
+loads) first reserves a slot in its domain's token bucket. The bucket is
+kept as a "theoretical arrival time" (GCRA), which is a token bucket in a
+single number: reserving pushes it one interval (1 / rate) forward and the
+caller sleeps until its slot, so concurrent requests are spaced instead of
+polling. Up to RATE_LIMIT_BURST requests go out back to back.
+
+Buckets live in Redis (SCRAPER_RATE_LIMIT_URL), updated by one Lua script
+on Redis' clock, so every worker process shares them. If Redis cannot be
+reached the limiter degrades to per-process buckets and tries Redis again
+a little later; scraping never fails because of the limiter.
+
+The rate adapts to the site: a throttling answer (429/503) halves the
+domain's rate, down to RATE_LIMIT_MIN_PER_SECOND, and pauses it for the
+answer's Retry-After; each successful response wins back a fraction of
+the configured rate (additive increase, multiplicative decrease). The
+answers to one burst of requests arrive together, so the rate is halved
+at most once per burst window (burst / rate seconds).
+
+CircuitBreaker stops retrying a source that keeps failing: after
+BREAKER_FAILURES consecutive failed attempts it opens for BREAKER_COOLDOWN
+seconds, during which ScraperService skips the site, then lets a single
+run through to probe it. Its state is in the Django cache, which is
+shared by the workers too; while the cache is down every run goes through.
+"""
+
+import email.utils
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+
+from scraper.config import (
+    BREAKER_COOLDOWN,
+    BREAKER_FAILURES,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_DOMAINS,
+    RATE_LIMIT_MAX_PAUSE,
+    RATE_LIMIT_MIN_PER_SECOND,
+    RATE_LIMIT_PER_SECOND,
+    RATE_LIMIT_RECOVERY,
+)
+
+THROTTLE_STATUSES = {429, 503}
+
+
+def domain_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def retry_after_seconds(value: Optional[str]) -> float:
+    """Seconds asked for by a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return 0.0
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+    return min(max(seconds, 0.0), RATE_LIMIT_MAX_PAUSE)
+
+
+class LocalTokenBucket:
+    """Token buckets of this process only."""
+
+    def __init__(self):
+        self._state: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def update(self, key: str, op: str, max_rate: float, burst: int, arg: float = 0.0) -> float:
+        """Same operations as the Redis script: 'reserve', 'slow' and 'recover'."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._state.setdefault(key, {"tat": now, "rate": max_rate, "held": 0.0})
+            tat, rate, held = max(state["tat"], now), state["rate"], state["held"]
+            wait = 0.0
+            if op == "reserve":
+                tat += 1 / rate
+                wait = max(0.0, tat - burst / rate - now)
+            elif op == "slow":
+                if now >= held:
+                    rate = max(RATE_LIMIT_MIN_PER_SECOND, rate / 2)
+                    held = now + burst / rate
+                tat = max(tat, now + arg + (burst - 1) / rate)
+            else:
+                rate = min(max_rate, rate + max_rate * arg)
+            state.update(tat=tat, rate=rate, held=held)
+            return wait
+
+
+class RedisTokenBucket:
+    """Token buckets shared through Redis, falling back to local ones while it is down."""
+
+    SCRIPT = """
+        local t = redis.call('TIME')
+        local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+        local op, max_rate, burst = ARGV[1], tonumber(ARGV[2]), tonumber(ARGV[3])
+        local arg, min_rate = tonumber(ARGV[4]), tonumber(ARGV[5])
+        local state = redis.call('HMGET', KEYS[1], 'tat', 'rate', 'held')
+        local tat = math.max(tonumber(state[1]) or now, now)
+        local rate = tonumber(state[2]) or max_rate
+        local held = tonumber(state[3]) or 0
+        local wait = 0
+        if op == 'reserve' then
+            tat = tat + 1 / rate
+            wait = math.max(0, tat - burst / rate - now)
+        elseif op == 'slow' then
+            if now >= held then
+                rate = math.max(min_rate, rate / 2)
+                held = now + burst / rate
+            end
+            tat = math.max(tat, now + arg + (burst - 1) / rate)
+        else
+            rate = math.min(max_rate, rate + max_rate * arg)
+        end
+        redis.call('HSET', KEYS[1], 'tat', tostring(tat), 'rate', tostring(rate), 'held', tostring(held))
+        redis.call('EXPIRE', KEYS[1], 3600)
+        return tostring(wait)
+    """
+    RETRY_REDIS_AFTER = 30
+
+    def __init__(self, url: str):
+        import redis
+
+        self._errors = (redis.ConnectionError, redis.TimeoutError)
+        self._client = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+        self._script = self._client.register_script(self.SCRIPT)
+        self._local = LocalTokenBucket()
+        self._down_until = 0.0
+
+    def update(self, key: str, op: str, max_rate: float, burst: int, arg: float = 0.0) -> float:
+        if time.monotonic() >= self._down_until:
+            try:
+                return float(self._script(
+                    keys=[f"scraper:rate:{key}"],
+                    args=[op, max_rate, burst, arg, RATE_LIMIT_MIN_PER_SECOND],
+                ))
+            except self._errors as e:
+                if not self._down_until:
+                    print(f"[RateLimiter] Redis unavailable ({e}); limiting per process.")
+                self._down_until = time.monotonic() + self.RETRY_REDIS_AFTER
+        return self._local.update(key, op, max_rate, burst, arg)
+
+
+class RateLimiter:
+    def __init__(self, buckets=None, rate: float = None, burst: int = None,
+                 domains: Dict[str, float] = None):
+        self.buckets = buckets or LocalTokenBucket()
+        self.rate = rate or RATE_LIMIT_PER_SECOND
+        self.burst = burst or RATE_LIMIT_BURST
+        self.domains = RATE_LIMIT_DOMAINS if domains is None else domains
+
+    def _update(self, url: str, op: str, arg: float = 0.0) -> float:
+        domain = domain_of(url)
+        rate = self.domains.get(domain, self.rate)
+        return self.buckets.update(domain, op, rate, self.burst, arg)
+
+    def reserve(self, url: str) -> float:
+        """Reserve the next request slot of url's domain; returns seconds to wait for it."""
+        return self._update(url, "reserve")
+
+    def wait(self, url: str):
+        delay = self.reserve(url)
+        if delay:
+            time.sleep(delay)
+
+    def feedback(self, url: str, status: Optional[int], retry_after: Optional[str] = None):
+        """Adapt url's domain to a response: slow down when throttled, recover otherwise."""
+        if status in THROTTLE_STATUSES:
+            pause = retry_after_seconds(retry_after)
+            print(f"[RateLimiter] {domain_of(url)} answered {status}; slowing down (pause {pause:.0f}s).")
+            self._update(url, "slow", pause)
+        elif status is not None and status < 400:
+            self._update(url, "recover", RATE_LIMIT_RECOVERY)
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """The process-wide limiter, on Redis unless SCRAPER_RATE_LIMIT_URL is empty."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                url = getattr(settings, "SCRAPER_RATE_LIMIT_URL", "")
+                _limiter = RateLimiter(RedisTokenBucket(url) if url else LocalTokenBucket())
+    return _limiter
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker of one source, shared through the Django cache."""
+
+    def __init__(self, source: str, failures: int = None, cooldown: float = None):
+        self.source = source
+        self.threshold = failures or BREAKER_FAILURES
+        self.cooldown = cooldown or BREAKER_COOLDOWN
+        self._failures_key = f"scraper:breaker:{source}:failures"
+        self._open_key = f"scraper:breaker:{source}:open_until"
+        self._probe_key = f"scraper:breaker:{source}:probe"
+
+    def open_until(self) -> Optional[float]:
+        return cache.get(self._open_key)
+
+    def allow(self) -> bool:
+        """False while open; once the cooldown is over, True for a single probe."""
+        try:
+            open_until = self.open_until()
+            if open_until is None:
+                return True
+            if time.time() < open_until:
+                return False
+            return cache.add(self._probe_key, True, timeout=self.cooldown)
+        except Exception as e:
+            # Like the rate limiter, never fail a scrape because of the breaker
+            self._unavailable(e)
+            return True
+
+    def record_success(self):
+        try:
+            cache.delete_many([self._failures_key, self._open_key, self._probe_key])
+        except Exception as e:
+            self._unavailable(e)
+
+    def record_failure(self):
+        try:
+            self._count_failure()
+        except Exception as e:
+            self._unavailable(e)
+
+    def _unavailable(self, error: Exception):
+        print(f"[CircuitBreaker] Cache unavailable ({error}); not tracking {self.source}.")
+
+    def _count_failure(self):
+        cache.add(self._failures_key, 0, timeout=None)
+        try:
+            failures = cache.incr(self._failures_key)
+        except ValueError:  # reset by a concurrent success
+            cache.set(self._failures_key, 1, timeout=None)
+            failures = 1
+        if failures >= self.threshold:
+            # A failed probe lands here too and re-opens at once
+            cache.set(self._open_key, time.time() + self.cooldown, timeout=None)
+            cache.delete(self._probe_key)
+            print(f"[CircuitBreaker] {self.source} opened for {self.cooldown:.0f}s after {failures} failures.")
@@ -1,9 +1,13 @@
 from django.urls import path
+from rest_framework.routers import DefaultRouter
 from . import views
 
 app_name = "scraper"
 
+router = DefaultRouter()
+router.register(r"scraped-jobs", views.ScrapedJobViewSet, basename="scraped-job")
+
 urlpatterns = [
     path("scrape/", views.trigger_scraping, name="trigger-scraping"),
-    path("scraped-jobs/", views.list_scraped_jobs, name="list-scraped-jobs"),
-]
+    path("scrape/runs/<int:pk>/", views.scrape_run_detail, name="scrape-run-detail"),
+] + router.urls
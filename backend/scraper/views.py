@@ -1,49 +1,65 @@
-from rest_framework import status, serializers
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.http import parse_etags
+from rest_framework import status, serializers, viewsets
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
-from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from .services import ScraperService
-from .tasks import run_all_scrapers_task
-from .models import ScrapedJob
-from .serializers import ScrapedJobSerializer
+from .cache import list_etag
+from .pagination import ScrapedJobPagination
+from .runs import start_scrape_run
+from .models import ScrapedJob, ScrapeRun
+from .repository import ScrapeRunRepository
+from .serializers import ScrapedJobSerializer, ScrapeRunSerializer
 
 
 class ScrapingRequestSerializer(Serializer):
     keyword = serializers.CharField(required=False)
     location = serializers.CharField(required=False)
-    run_async = serializers.BooleanField(default=False, required=False)
+    run_async = serializers.BooleanField(
+        default=True, required=False,
+        help_text='Deprecated and ignored: scraping always runs in the background.'
+    )
+    full_refresh = serializers.BooleanField(
+        default=False, required=False,
+        help_text='Re-scrape every page instead of stopping at listings already ingested.'
+    )
 
 
 @extend_schema(
     tags=['Scraper'],
     summary='Trigger job scraping',
-    description='Manually trigger job scraping from configured job sites. Admin only.',
+    description=(
+        'Start a background scrape of the configured job sites. Admin only. '
+        'Poll the returned status_url for per-site progress and results.'
+    ),
     request=ScrapingRequestSerializer,
     responses={
-        200: {
-            'description': 'Scraping completed successfully',
+        202: {
+            'description': 'Scrape run queued',
             'examples': {
                 'application/json': {
-                    'message': 'Scraping completed',
-                    'jobs_found': 25,
-                    'jobs_saved': 15
+                    'message': 'Scraping started',
+                    'run_id': 7,
+                    'status_url': '/api/scrape/runs/7/',
+                    'run': {'id': 7, 'status': 'queued', 'sites': {}, 'jobs_found': 0}
                 }
             }
         },
         400: {'description': 'Invalid parameters'},
         403: {'description': 'Permission denied'},
-        500: {'description': 'Scraping failed'}
     }
 )
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def trigger_scraping(request):
     """
-    Manually trigger job scraping from configured sources.
+    Queue a scrape of the configured sources as a tracked ScrapeRun.
     Requires admin privileges.
     """
     # First try to get data from request body (for POST requests)
@@ -53,78 +69,111 @@ def trigger_scraping(request):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         keyword = serializer.validated_data.get('keyword')
         location = serializer.validated_data.get('location')
-        run_async = serializer.validated_data.get('run_async', False)
+        full_refresh = serializer.validated_data.get('full_refresh', False)
     else:
         # Fall back to query params (for GET requests or backward compatibility)
         keyword = request.query_params.get('keyword')
         location = request.query_params.get('location')
-        run_async = request.query_params.get('async', 'false').lower() == 'true'
-    
-    if run_async:
-        # Run asynchronously with Celery
-        task = run_all_scrapers_task.delay(keyword=keyword, location=location)
-        return Response({
-            'message': 'Scraping task queued',
-            'task_id': str(task.id)
-        }, status=status.HTTP_202_ACCEPTED)
-    else:
-        # Run synchronously
-        scraper_service = ScraperService(keyword=keyword, location=location)
-        jobs = scraper_service.run_all_scrapers()
-        
-        # Save to database
-        saved_count = 0
-        for job_data in jobs:
-            try:
-                ScrapedJob.objects.get_or_create(
-                    job_url=job_data.get('url', ''),
-                    defaults={
-                        'title': job_data.get('title', ''),
-                        'company_name': job_data.get('company', ''),
-                        'location': job_data.get('location', ''),
-                        'description': job_data.get('description', ''),
-                        'source_website': job_data.get('source', ''),
-                    }
-                )
-                saved_count += 1
-            except Exception as e:
-                print(f"Error saving job: {e}")
-                continue
-        
-        return Response({
-            'message': 'Scraping completed',
-            'jobs_found': len(jobs),
-            'jobs_saved': saved_count
-        }, status=status.HTTP_200_OK)
+        full_refresh = request.query_params.get('full_refresh', 'false').lower() == 'true'
+
+    run = start_scrape_run(
+        keyword=keyword, location=location, full_refresh=full_refresh, requested_by=request.user
+    )
+    return Response({
+        'message': 'Scraping started',
+        'run_id': run.pk,
+        'status_url': reverse('scraper:scrape-run-detail', args=[run.pk]),
+        'run': ScrapeRunSerializer(run).data
+    }, status=status.HTTP_202_ACCEPTED)
 
 
 @extend_schema(
     tags=['Scraper'],
-    summary='List scraped jobs',
-    description='Get a list of all scraped jobs from external sources',
-    parameters=[
-        OpenApiParameter(
-            name='source',
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description='Filter by source website',
-            required=False
-        ),
-    ],
-    responses={200: ScrapedJobSerializer(many=True)}
+    summary='Scrape run status',
+    description='Progress of a background scrape: status, per-site progress, counts and timings. Admin only.',
+    responses={200: ScrapeRunSerializer, 404: {'description': 'No such run'}}
 )
 @api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def list_scraped_jobs(request):
+@permission_classes([IsAuthenticated, IsAdminUser])
+def scrape_run_detail(request, pk):
     """
-    List all scraped jobs. Can be filtered by source website.
+    Current state of one ScrapeRun. Runs whose worker is gone are reported
+    failed rather than running forever.
     """
-    source = request.query_params.get('source')
-    
-    queryset = ScrapedJob.objects.all().order_by('-created_at')
-    
-    if source:
-        queryset = queryset.filter(source_website=source)
-    
-    serializer = ScrapedJobSerializer(queryset, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    ScrapeRunRepository.expire_stale()
+    run = get_object_or_404(ScrapeRun, pk=pk)
+    return Response(ScrapeRunSerializer(run).data, status=status.HTTP_200_OK)
+
+
+@extend_schema_view(
+    list=extend_schema(
+        tags=['Scraper'],
+        summary='List scraped jobs',
+        description=(
+            'Scraped jobs from external sources, newest first, cursor-paginated. '
+            'Responses carry an ETag: send it back in If-None-Match to get a 304 '
+            'while no jobs were ingested since.'
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='source',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Filter by source website',
+                required=False
+            ),
+            OpenApiParameter(
+                name='fields',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated fields to return, e.g. id,title,company_name,job_url',
+                required=False
+            ),
+        ],
+    ),
+    retrieve=extend_schema(tags=['Scraper'], summary='Get a scraped job'),
+)
+class ScrapedJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Scraped jobs. `?fields=` returns only the listed fields and loads only
+    their columns, so lists can leave out the (large) description.
+    """
+
+    queryset = ScrapedJob.objects.order_by('-created_at', '-id')
+    serializer_class = ScrapedJobSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = ScrapedJobPagination  # keyset on (created_at, id)
+
+    def requested_fields(self):
+        raw = self.request.query_params.get('fields')
+        if not raw:
+            return None
+        names = [name.strip() for name in raw.split(',') if name.strip()]
+        unknown = set(names) - set(ScrapedJobSerializer.Meta.fields)
+        if unknown:
+            raise ValidationError({'fields': f"Unknown field(s): {', '.join(sorted(unknown))}"})
+        return names
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        source = self.request.query_params.get('source')
+        if source:
+            queryset = queryset.filter(source_website=source)
+        fields = self.requested_fields()
+        if fields is not None:
+            # Pagination keys are always needed
+            queryset = queryset.only('id', 'created_at', *fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        etag = list_etag(request)
+        if etag and etag in {tag.removeprefix('W/') for tag in parse_etags(request.headers.get('If-None-Match', ''))}:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        response = super().list(request, *args, **kwargs)
+        if etag:
+            response['ETag'] = etag
+        return response
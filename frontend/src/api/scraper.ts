@@ -1,4 +1,5 @@
 import axiosClient from "./axiosClient";
+import type { CursorPaginatedResponse } from "@/types";
 
 export interface ScrapedJob {
   id: number;
@@ -13,34 +14,82 @@ export interface ScrapedJob {
   updated_at: string;
 }
 
+export interface ScrapeRunSite {
+  status: string;
+  jobs_found: number;
+  error?: string | null;
+  attempts?: number;
+  duration?: number;
+  timed_out?: boolean;
+  circuit_open?: boolean;
+}
+
+export interface ScrapeRun {
+  id: number;
+  status: "queued" | "running" | "succeeded" | "failed";
+  keyword: string;
+  location: string;
+  full_refresh: boolean;
+  sites: Record<string, ScrapeRunSite>;
+  jobs_found: number;
+  inserted: number;
+  updated: number;
+  skipped: number;
+  promoted: number;
+  error: string;
+  task_id: string;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+  duration: number | null;
+}
+
 export interface TriggerScrapingResponse {
   message: string;
-  jobs_found?: number;
-  jobs_saved?: number;
-  task_id?: string;
+  run_id: number;
+  status_url: string;
+  run: ScrapeRun;
 }
 
 /**
- * Trigger job scraping (admin only)
+ * Trigger job scraping (admin only). The scrape runs in the background:
+ * poll getScrapeRun(run_id) for its progress.
  */
 export const triggerScraping = async (
   keyword?: string,
   location?: string,
-  async: boolean = false
+  fullRefresh: boolean = false
 ): Promise<TriggerScrapingResponse> => {
   const params: Record<string, string> = {};
   if (keyword) params.keyword = keyword;
   if (location) params.location = location;
-  if (async) params.async = "true";
+  if (fullRefresh) params.full_refresh = "true";
 
   const response = await axiosClient.post("/scrape/", null, { params });
   return response.data;
 };
 
 /**
- * Get list of scraped jobs
+ * Current state of a scrape run (admin only)
  */
-export const getScrapedJobs = async (source?: string): Promise<ScrapedJob[]> => {
+export const getScrapeRun = async (runId: number): Promise<ScrapeRun> => {
+  const response = await axiosClient.get(`/scrape/runs/${runId}/`);
+  return response.data;
+};
+
+/**
+ * Get a page of scraped jobs, newest first. Pass a page's `next` or
+ * `previous` link as `pageUrl` to move through the list.
+ */
+export const getScrapedJobs = async (
+  source?: string,
+  pageUrl?: string
+): Promise<CursorPaginatedResponse<ScrapedJob>> => {
+  if (pageUrl) {
+    const response = await axiosClient.get(pageUrl);
+    return response.data;
+  }
+
   const params: Record<string, string> = {};
   if (source) params.source = source;
 
@@ -50,6 +99,7 @@ export const getScrapedJobs = async (source?: string): Promise<ScrapedJob[]> =>
 
 const scraperAPI = {
   triggerScraping,
+  getScrapeRun,
   getScrapedJobs,
 };
 
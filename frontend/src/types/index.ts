@@ -170,11 +170,41 @@ export interface ScrapedJob {
   updated_at: string;
 }
 
+export interface ScrapeRunSite {
+  status: string;
+  jobs_found: number;
+  error?: string | null;
+  attempts?: number;
+  duration?: number;
+  timed_out?: boolean;
+  circuit_open?: boolean;
+}
+
+export interface ScrapeRun {
+  id: number;
+  status: "queued" | "running" | "succeeded" | "failed";
+  keyword: string;
+  location: string;
+  full_refresh: boolean;
+  sites: Record<string, ScrapeRunSite>;
+  jobs_found: number;
+  inserted: number;
+  updated: number;
+  skipped: number;
+  promoted: number;
+  error: string;
+  task_id: string;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+  duration: number | null;
+}
+
 export interface TriggerScrapingResponse {
   message: string;
-  jobs_found?: number;
-  jobs_saved?: number;
-  task_id?: string;
+  run_id: number;
+  status_url: string;
+  run: ScrapeRun;
 }
 
 // API Error Types
@@ -192,3 +222,10 @@ export interface PaginatedResponse<T> {
   previous: string | null;
   results: T[];
 }
+
+// Cursor pages carry no count; follow `next`/`previous` as returned
+export interface CursorPaginatedResponse<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}